@@ -14,25 +14,33 @@
 # Copyright (c) 2017-2024 Wind River Systems, Inc.
 #
 
-from starlingx_dashboard.api import base
-from starlingx_dashboard.api import ceph
-from starlingx_dashboard.api import dc_manager
-from starlingx_dashboard.api import fm
-from starlingx_dashboard.api import neutron
-from starlingx_dashboard.api import patch
-from starlingx_dashboard.api import sysinv
-from starlingx_dashboard.api import usm
-from starlingx_dashboard.api import vim
+import importlib
 
 
 __all__ = [
     "base",
+    "breaker",
     "ceph",
     "dc_manager",
     "fm",
     "neutron",
     "patch",
+    "singleflight",
+    "snapshots",
     "sysinv",
+    "tracing",
     "usm",
     "vim",
 ]
+
+
+def __getattr__(name):
+    # The API modules are imported on first use (PEP 562), so that a
+    # worker only loads the clients of the panels it serves
+    if name in __all__:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -17,6 +17,18 @@ def get_request_page_size(request, limit=None):
         return request.session.get('horizon_pagesize', default_page_size)
 
 
+def auth_scope(request):
+    """Return what, besides its arguments, a read call result depends on.
+
+    Users of the same region and project, with the same roles, get the
+    same results, whatever their token.
+    """
+    user = request.user
+    return (getattr(user, 'services_region', None),
+            getattr(user, 'project_id', None),
+            tuple(sorted(role['name'] for role in getattr(user, 'roles', ()))))
+
+
 def is_stx_region(request):
     if not base.is_service_enabled(request, 'platform'):
         return False
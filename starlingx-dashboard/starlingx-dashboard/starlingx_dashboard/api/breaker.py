@@ -0,0 +1,314 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import collections
+from concurrent import futures
+import functools
+import logging
+import threading
+import time
+
+from cgtsclient import exc
+from django.conf import settings
+
+from starlingx_dashboard.api import base as stx_base
+from starlingx_dashboard.api import singleflight
+from starlingx_dashboard.api import tracing
+from starlingx_dashboard.utils import metrics
+from starlingx_dashboard.utils import subrequest
+
+LOG = logging.getLogger(__name__)
+
+# Default number of seconds a call to each service may take, by service
+# type; overridden by the API_TIMEOUTS setting
+DEFAULT_API_TIMEOUTS = {
+    'platform': 60,
+    'faultmanagement': 10,
+    'dcmanager': 20,
+    'patching': 10,
+    'usm': 30,
+    'ceph': 10,
+}
+
+# Default number of consecutive failures opening the circuit of a service
+DEFAULT_API_BREAKER_FAILURES = 3
+
+# Default number of seconds calls fail fast once the circuit is open
+DEFAULT_API_BREAKER_COOLDOWN = 30
+
+# Default number of deadline calls to a service of a region running at
+# once, so that a hung service cannot take every deadline thread
+DEFAULT_API_MAX_IN_FLIGHT = 4
+
+# Default number of guarded call results kept to be served while their
+# circuit is open
+DEFAULT_API_LAST_KNOWN_SIZE = 256
+
+# Failures meaning that a backend is unreachable; requests and socket
+# errors are OSErrors
+UNREACHABLE_ERRORS = (OSError, futures.TimeoutError)
+
+# Circuit of each (service, region)
+_circuits = {}
+# Last result of each guarded call, served while its circuit is open, the
+# least recently stored first
+_last_known = collections.OrderedDict()
+# Slots for the deadline calls of each (service, region)
+_in_flight = {}
+_lock = threading.Lock()
+
+_executor = None
+
+
+class CircuitOpen(exc.CommunicationError):
+    """Raised instead of calling a service known to be unreachable.
+
+    A CommunicationError, so that pages handle it as they handle an
+    unreachable platform service.
+    """
+
+    def __init__(self, service, region):
+        super(CircuitOpen, self).__init__(
+            '%s is unreachable in region %s' % (service, region))
+        self.service = service
+        self.region = region
+
+
+class ServiceBusy(exc.CommunicationError):
+    """Raised when a deadline call to a service cannot start in time,
+    as API_MAX_IN_FLIGHT calls to it are still running or the deadline
+    threads are all busy.  Not a failure of the service."""
+
+    def __init__(self, service, region):
+        super(ServiceBusy, self).__init__(
+            'Too many calls to %s in region %s are in progress' %
+            (service, region))
+        self.service = service
+        self.region = region
+
+
+class _Circuit(object):
+    def __init__(self):
+        self.failures = 0
+        self.opened_until = 0
+        self.trial = False
+
+
+def timeout(service):
+    """Return the number of seconds a call to a service may take."""
+    timeouts = getattr(settings, 'API_TIMEOUTS', {})
+    return timeouts.get(service, DEFAULT_API_TIMEOUTS.get(service))
+
+
+def _get_executor():
+    global _executor  # pylint: disable=global-statement
+    with _lock:
+        if _executor is None:
+            _executor = futures.ThreadPoolExecutor(
+                thread_name_prefix='stx-api-deadline')
+        return _executor
+
+
+def raised_in(error, package):
+    """Tell whether error was raised from the code of a package, e.g. a
+    client library, rather than from the code calling it."""
+    tb = error.__traceback__
+    while tb is not None:
+        module = tb.tb_frame.f_globals.get('__name__', '')
+        if module == package or module.startswith(package + '.'):
+            return True
+        tb = tb.tb_next
+    return False
+
+
+def _slots(key):
+    with _lock:
+        slots = _in_flight.get(key)
+        if slots is None:
+            slots = _in_flight[key] = threading.BoundedSemaphore(
+                getattr(settings, 'API_MAX_IN_FLIGHT',
+                        DEFAULT_API_MAX_IN_FLIGHT))
+        return slots
+
+
+def _call_with_deadline(key, function, args, kwargs):
+    """Run function in a deadline thread, and wait for it at most
+    timeout(service) seconds from the moment it starts running.
+
+    A request passed first is replaced by a copy of it, as the thread may
+    outlive the call.
+    """
+    slots = _slots(key)
+    if not slots.acquire(blocking=False):
+        raise ServiceBusy(*key)
+    function = tracing.bind(function)
+    request = None
+    if args and hasattr(args[0], 'user'):
+        request = args[0]
+        args = (subrequest.copy_request(request),) + tuple(args[1:])
+    started = []
+
+    def _run():
+        started.append(time.monotonic())
+        try:
+            return function(*args, **kwargs)
+        finally:
+            slots.release()
+
+    try:
+        future = _get_executor().submit(_run)
+    except Exception:
+        slots.release()
+        raise
+
+    seconds = timeout(key[0])
+    wait = seconds
+    try:
+        while True:
+            try:
+                return future.result(timeout=wait)
+            except futures.TimeoutError:
+                if future.cancel():
+                    # Still queued: the service was not even called
+                    slots.release()
+                    raise ServiceBusy(*key)
+                ran = time.monotonic() - started[0] if started else 0
+                if ran >= seconds:
+                    raise
+                wait = seconds - ran
+    finally:
+        if request is not None:
+            subrequest.forward_messages(args[0], request)
+
+
+def _remember(call_key, result):
+    # Kept apart from the result returned, which callers may change
+    result = singleflight.copy_result(result)
+    with _lock:
+        _last_known[call_key] = result
+        _last_known.move_to_end(call_key)
+        while len(_last_known) > getattr(settings, 'API_LAST_KNOWN_SIZE',
+                                         DEFAULT_API_LAST_KNOWN_SIZE):
+            _last_known.popitem(last=False)
+
+
+def _unreachable(error, errors):
+    if isinstance(error, UNREACHABLE_ERRORS):
+        return True
+    if callable(errors):
+        return errors(error)
+    return isinstance(error, tuple(errors))
+
+
+def _scope(args):
+    # Calls of the local ceph cluster do not take a request
+    if args and hasattr(args[0], 'user'):
+        return stx_base.auth_scope(args[0])
+    return (None, None, ())
+
+
+def _allow(key):
+    """Tell whether a call may be made, letting one trial call through
+    once the cool-down of an open circuit has elapsed."""
+    with _lock:
+        circuit = _circuits.get(key)
+        if circuit is None or circuit.opened_until == 0:
+            return True
+        if circuit.trial or time.monotonic() < circuit.opened_until:
+            return False
+        circuit.trial = True
+        return True
+
+
+def _record(key, failed):
+    with _lock:
+        circuit = _circuits.setdefault(key, _Circuit())
+        circuit.trial = False
+        if not failed:
+            circuit.failures = 0
+            circuit.opened_until = 0
+            return
+        circuit.failures += 1
+        if circuit.failures >= getattr(settings, 'API_BREAKER_FAILURES',
+                                       DEFAULT_API_BREAKER_FAILURES):
+            circuit.opened_until = time.monotonic() + getattr(
+                settings, 'API_BREAKER_COOLDOWN',
+                DEFAULT_API_BREAKER_COOLDOWN)
+            LOG.warning("%s unreachable in region %s, failing fast for "
+                        "%s seconds", key[0], key[1],
+                        getattr(settings, 'API_BREAKER_COOLDOWN',
+                                DEFAULT_API_BREAKER_COOLDOWN))
+
+
+def call(service, region, function, *args, errors=(), deadline=False,
+         call_key=None, **kwargs):
+    """Call function(*args, **kwargs) through the circuit of a service.
+
+    The circuit of a (service, region) opens after API_BREAKER_FAILURES
+    consecutive calls failed with UNREACHABLE_ERRORS or errors, a tuple
+    of exception types or a function telling whether an exception means
+    the service is unreachable.  While
+    it is open, calls fail fast with CircuitOpen for API_BREAKER_COOLDOWN
+    seconds, or return a copy of the last result of the same call_key
+    when there is one.  A trial call then closes the circuit or opens it again.
+
+    With deadline, the call is abandoned after running timeout(service)
+    seconds; for clients that have no timeout of their own.  At most
+    API_MAX_IN_FLIGHT such calls run at once for a (service, region);
+    others fail with ServiceBusy, as do calls still waiting for a thread
+    at their deadline.  ServiceBusy does not count as a failure.
+    """
+    key = (service, region)
+    if not _allow(key):
+        with _lock:
+            hit = call_key is not None and call_key in _last_known
+            result = _last_known.get(call_key)
+        metrics.cache('breaker_last_known', hit)
+        if hit:
+            LOG.info("%s unreachable, returning the last %s",
+                     service, call_key[0])
+            # Each caller gets its own copy, as with single-flight
+            return singleflight.copy_result(result)
+        raise CircuitOpen(service, region)
+
+    try:
+        if deadline:
+            result = _call_with_deadline(key, function, args, kwargs)
+        else:
+            result = function(*args, **kwargs)
+    except ServiceBusy:
+        raise
+    except Exception as ex:
+        # Other errors come from a service that answered
+        _record(key, failed=_unreachable(ex, errors))
+        raise
+
+    _record(key, failed=False)
+    if call_key is not None:
+        _remember(call_key, result)
+    return result
+
+
+def guarded(service, errors=(), deadline=False):
+    """Guard an API call with the circuit of a service, see call().
+
+    For calls taking the request first, or no argument for calls of the
+    local cluster.  While the circuit is open, the last result of the
+    same call for the same authorization scope is returned if any.
+    """
+    def decorator(function):
+        name = '%s.%s' % (function.__module__, function.__name__)
+
+        @functools.wraps(function)
+        def _wrapped(*args, **kwargs):
+            scope = _scope(args)
+            call_key = (name, scope, repr(args[1:]),
+                        repr(sorted(kwargs.items())))
+            return call(service, scope[0], function, *args, errors=errors,
+                        deadline=deadline, call_key=call_key, **kwargs)
+
+        return _wrapped
+    return decorator
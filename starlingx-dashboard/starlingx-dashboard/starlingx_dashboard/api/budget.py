@@ -0,0 +1,118 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import collections
+import logging
+import os
+import sys
+
+from django.conf import settings
+from horizon import tabs
+
+LOG = logging.getLogger(__name__)
+
+# Default for API_CALL_CHECK: 'warn' or 'raise' to check the backend calls
+# of each request against the budgets of its view and tabs, or None
+DEFAULT_API_CALL_CHECK = None
+
+# Default number of times a request may make the same backend call from
+# the same call site
+DEFAULT_API_CALL_REPEAT_LIMIT = 10
+
+_API_DIR = os.path.dirname(os.path.abspath(__file__))
+_REST_DIR = os.path.join(_API_DIR, 'rest')
+_PACKAGE_DIR = os.path.dirname(_API_DIR)
+
+
+class CallBudgetExceeded(Exception):
+    """Raised, in 'raise' mode, by a request that made too many backend
+    calls."""
+
+
+def enabled():
+    return getattr(settings, 'API_CALL_CHECK',
+                   DEFAULT_API_CALL_CHECK) in ('warn', 'raise')
+
+
+def _is_call_site(filename):
+    # Code of this package outside of the API layer, REST views included
+    if not filename.startswith(_PACKAGE_DIR + os.sep):
+        return False
+    return not filename.startswith(_API_DIR + os.sep) or \
+        filename.startswith(_REST_DIR + os.sep)
+
+
+def locate(span, origin=None):
+    """Set the call site of a backend call in progress, and the tab
+    rendering it if any, or else those of origin."""
+    frame = sys._getframe(1)  # pylint: disable=protected-access
+    while frame is not None and span.tab is None:
+        code = frame.f_code
+        if span.site is None and _is_call_site(code.co_filename):
+            span.site = '%s:%d %s' % (
+                os.path.relpath(code.co_filename, _PACKAGE_DIR),
+                frame.f_lineno, code.co_name)
+        owner = frame.f_locals.get('self')
+        if isinstance(owner, tabs.Tab):
+            span.tab = type(owner)
+        frame = frame.f_back
+    if origin is not None:
+        span.site = span.site or origin.site
+        span.tab = span.tab or origin.tab
+
+
+def _name(cls):
+    return '%s.%s' % (cls.__module__, cls.__name__)
+
+
+def _over_budget(owner, count):
+    budget = getattr(owner, 'api_call_budget', None)
+    if budget is not None and count > budget:
+        return '%s made %d backend calls, over its budget of %d' % (
+            _name(owner), count, budget)
+    return None
+
+
+def check(request, trace):
+    """Check the backend calls of a request.
+
+    Budgets are declared by an api_call_budget attribute on views, such as
+    TabbedTableView classes, and on tab classes, whose budget is for the
+    calls made while the tab loads its data and renders.  A call repeated
+    more than API_CALL_REPEAT_LIMIT times from the same call site, usually
+    a call in a loop over table rows, is reported as well.
+
+    :raises: CallBudgetExceeded in 'raise' mode.
+    """
+    problems = []
+
+    match = getattr(request, 'resolver_match', None)
+    view_class = getattr(getattr(match, 'func', None), 'view_class', None)
+    if view_class is not None:
+        problems.append(_over_budget(view_class, len(trace.spans)))
+
+    by_tab = collections.Counter(span.tab for span in trace.spans
+                                 if span.tab is not None)
+    for tab, count in by_tab.items():
+        problems.append(_over_budget(tab, count))
+
+    limit = getattr(settings, 'API_CALL_REPEAT_LIMIT',
+                    DEFAULT_API_CALL_REPEAT_LIMIT)
+    repeats = collections.Counter((span.service, span.operation, span.site)
+                                  for span in trace.spans)
+    for (service, operation, site), count in repeats.items():
+        if count > limit:
+            problems.append('%s %s called %d times from %s' % (
+                service, operation, count, site))
+
+    problems = [problem for problem in problems if problem]
+    if not problems:
+        return
+    if getattr(settings, 'API_CALL_CHECK', DEFAULT_API_CALL_CHECK) == 'raise':
+        raise CallBudgetExceeded('%s %s: %s' % (
+            request.method, request.path, '; '.join(problems)))
+    for problem in problems:
+        LOG.warning("%s %s: %s", request.method, request.path, problem)
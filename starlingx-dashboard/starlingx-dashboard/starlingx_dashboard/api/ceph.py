@@ -19,15 +19,21 @@ from __future__ import absolute_import
 
 import logging
 
-from cephclient import wrapper
-
 from openstack_dashboard.api import base
 
+from starlingx_dashboard.api import breaker
+from starlingx_dashboard.api import tracing
+from starlingx_dashboard.utils import lazy
+
 LOG = logging.getLogger(__name__)
 
+# Imported when the first client is built, rather than with this module
+wrapper = lazy.module('cephclient.wrapper')
+
 
 def cephwrapper():
-    return wrapper.CephWrapper()
+    # Recorded in the trace of the current thread
+    return tracing.traced_client(wrapper.CephWrapper(), None, 'ceph')
 
 
 class Monitor(base.APIDictWrapper):
@@ -67,6 +73,7 @@ def _Bytes_to_GiB(value_B):
     return (value_B // (1024 * 1024 * 1024))
 
 
+@breaker.guarded('ceph', deadline=True)
 def cluster_get():
     # the json response doesn't give all the information
     response, text_body = cephwrapper().health(body='text')
@@ -94,6 +101,7 @@ def cluster_get():
     return Cluster(cluster)
 
 
+@breaker.guarded('ceph', deadline=True)
 def storage_get():
     # # Space info
     response, body = cephwrapper().df(body='json')
@@ -148,6 +156,7 @@ def _get_quorum_status(mon, quorums):
     return status
 
 
+@breaker.guarded('ceph', deadline=True)
 def monitor_list():
     response, body = cephwrapper().mon_dump(body='json')
     # return no monitors info
@@ -164,6 +173,7 @@ def monitor_list():
     return [Monitor(m) for m in mons]
 
 
+@breaker.guarded('ceph', deadline=True)
 def osd_list():
     # would use osd_find, but it doesn't give osd's name
     response, tree = cephwrapper().osd_tree(body='json')
@@ -13,21 +13,35 @@
 # Copyright (c) 2017-2023 Wind River Systems, Inc.
 #
 
+import collections
 import logging
 
-from dcmanagerclient.api.v1 import client
-from dcmanagerclient.exceptions import APIException
+from django.conf import settings
 
 from horizon.utils.memoized import memoized  # noqa
 
 from openstack_dashboard.api import base
+from starlingx_dashboard.api import breaker
+from starlingx_dashboard.api import singleflight
+from starlingx_dashboard.api import snapshots
+from starlingx_dashboard.api import tracing
+from starlingx_dashboard.utils import lazy
 
 LOG = logging.getLogger(__name__)
 
+# Imported when the first client is built, rather than with this module
+client = lazy.module('dcmanagerclient.api.v1.client')
+dcmanager_exc = lazy.module('dcmanagerclient.exceptions')
+
 
 DEFAULT_CONFIG_NAME = "all clouds default"
 DEFAULT_GROUP_NAME = "Default"
 
+# Default number of seconds the strategy step list of a region is reused
+DEFAULT_STEP_SNAPSHOT_TTL = 5
+
+_step_snapshots = snapshots.SnapshotCache('dc_strategy_steps')
+
 
 @memoized
 def dcmanagerclient(request):
@@ -36,13 +50,15 @@ def dcmanagerclient(request):
                       user_id=request.user.id,
                       auth_token=request.user.token.id,
                       dcmanager_url=endpoint)
-    return c
+    return tracing.traced_client(c, request, 'dcmanager')
 
 
 class Summary(base.APIResourceWrapper):
     _attrs = ['name', 'critical', 'major', 'minor', 'warnings', 'status']
 
 
+@singleflight.shared
+@breaker.guarded('dcmanager', deadline=True)
 def alarm_summary_list(request):
     summaries = dcmanagerclient(request).alarm_manager.list_alarms()
     return [Summary(summary) for summary in summaries]
@@ -58,11 +74,31 @@ class Subcloud(base.APIResourceWrapper):
               'endpoint_sync_status', 'region_name', ]
 
 
+@singleflight.shared
+@breaker.guarded('dcmanager', deadline=True)
 def subcloud_list(request):
     subclouds = dcmanagerclient(request).subcloud_manager.list_subclouds()
     return [Subcloud(subcloud) for subcloud in subclouds]
 
 
+def subcloud_name_list(request):
+    return [subcloud.name for subcloud in subcloud_list(request)]
+
+
+def subcloud_get(request, subcloud_ref):
+    """Return the subcloud of a name or id, or None if there is none"""
+    try:
+        response = dcmanagerclient(request).subcloud_manager.\
+            subcloud_detail(subcloud_ref)
+    except dcmanager_exc.APIException as e:
+        if e.error_code == 404:
+            return None
+        raise
+
+    if response:
+        return Subcloud(response[0])
+
+
 def subcloud_create(request, data):
     return dcmanagerclient(request).subcloud_manager.add_subcloud(
         **data.get('data'))
@@ -97,6 +133,8 @@ def subcloud_group_create(request, **kwargs):
     return [SubcloudGroup(subcloud_group) for subcloud_group in response]
 
 
+@singleflight.shared
+@breaker.guarded('dcmanager', deadline=True)
 def list_subcloud_groups(request):
     subcloud_groups = dcmanagerclient(request).subcloud_group_manager.\
         list_subcloud_groups()
@@ -132,7 +170,7 @@ def get_strategy(request):
     try:
         response = dcmanagerclient(request).sw_strategy_manager.\
             update_sw_strategy_detail()
-    except APIException as e:
+    except dcmanager_exc.APIException as e:
         if e.error_code == 404:
             return None
         else:
@@ -145,27 +183,34 @@ def get_strategy(request):
 def strategy_create(request, data):
     response = dcmanagerclient(request).sw_strategy_manager.\
         create_sw_update_strategy(**data)
+    invalidate_step_snapshot(request)
     return Strategy(response)
 
 
 def strategy_apply(request):
-    return dcmanagerclient(request).sw_strategy_manager.\
+    response = dcmanagerclient(request).sw_strategy_manager.\
         apply_sw_update_strategy()
+    invalidate_step_snapshot(request)
+    return response
 
 
 def strategy_abort(request):
-    return dcmanagerclient(request).sw_strategy_manager.\
+    response = dcmanagerclient(request).sw_strategy_manager.\
         abort_sw_update_strategy()
+    invalidate_step_snapshot(request)
+    return response
 
 
 def strategy_delete(request):
-    return dcmanagerclient(request).sw_strategy_manager.\
+    response = dcmanagerclient(request).sw_strategy_manager.\
         delete_sw_update_strategy()
+    invalidate_step_snapshot(request)
+    return response
 
 
 class Step(base.APIResourceWrapper):
     _attrs = ['cloud', 'stage', 'state', 'details', 'started_at',
-              'finished_at']
+              'finished_at', 'created_at', 'updated_at']
 
 
 def step_list(request):
@@ -180,6 +225,90 @@ def step_detail(request, cloud_name):
     return Step(response[0])
 
 
+def _step_updated_at(step):
+    # Times of dcmanager, in one format, so that they compare as strings
+    return getattr(step, 'updated_at', None) or \
+        getattr(step, 'created_at', None) or ''
+
+
+class StepSnapshot(object):
+    """Strategy steps of a region, indexed by cloud name, with the number
+    of steps in each state.
+
+    The marker of a snapshot is the last time one of its steps was
+    updated, as recorded by dcmanager, so that it can be passed to
+    changed_since() by any process.
+    """
+
+    def __init__(self, steps):
+        self.steps = steps
+        self.state_counts = collections.Counter(s.state for s in steps)
+        self.marker = max((_step_updated_at(s) for s in steps), default='')
+        self._steps = {step.cloud: step for step in steps}
+
+    def get_step(self, cloud_name):
+        return self._steps.get(cloud_name)
+
+    def changed_since(self, marker):
+        """Return the steps updated after marker, or all steps without
+        one."""
+        if not marker:
+            return self.steps
+        return [s for s in self.steps if _step_updated_at(s) > marker]
+
+    def filter(self, filter_string=None, state=None):
+        """Return the steps of a state and/or matching a filter string.
+
+        Like the table filter, the filter string is matched against the
+        state and stage of the steps.
+        """
+        steps = self.steps
+        if state:
+            steps = [s for s in steps if s.state == state]
+        q = (filter_string or '').lower().strip()
+        if q:
+            steps = [s for s in steps
+                     if q in s.state.lower() or q in str(s.stage)]
+        return steps
+
+
+def page_steps(steps, limit, marker=None, prev_marker=None):
+    """Return a page of limit steps after marker, or before prev_marker.
+
+    Markers are cloud names.
+
+    :returns: a (steps, has_prev_data, has_more_data) tuple.
+    """
+    clouds = [s.cloud for s in steps]
+    if prev_marker is not None and prev_marker in clouds:
+        end = clouds.index(prev_marker)
+        start = max(0, end - limit)
+    else:
+        start = clouds.index(marker) + 1 if marker in clouds else 0
+        end = start + limit
+    return steps[start:end], start > 0, end < len(steps)
+
+
+def _step_snapshot_ttl(_snapshot):
+    return getattr(settings, 'DC_STEP_SNAPSHOT_TTL', DEFAULT_STEP_SNAPSHOT_TTL)
+
+
+def get_step_snapshot(request):
+    """Return the strategy steps of the request's region.
+
+    The step list is retrieved at most once per request, and is reused by
+    later requests of the same user and region (e.g. the ajax refresh of
+    each step row) for DC_STEP_SNAPSHOT_TTL seconds.
+    """
+    return _step_snapshots.get(
+        request, lambda: StepSnapshot(step_list(request)), _step_snapshot_ttl)
+
+
+def invalidate_step_snapshot(request):
+    """Stop reusing the cached strategy steps of the request's region."""
+    _step_snapshots.invalidate(request)
+
+
 class Config(base.APIResourceWrapper):
     _attrs = ['cloud', 'storage_apply_type', 'worker_apply_type',
               'max_parallel_workers', 'alarm_restriction_type',
@@ -9,13 +9,17 @@ from __future__ import absolute_import
 
 import logging
 
-import fmclient as fm_client
-
 from django.conf import settings
+from django.core.cache import cache
 
 from openstack_dashboard.api import base
 
 from starlingx_dashboard.api import base as stx_base
+from starlingx_dashboard.api import breaker
+from starlingx_dashboard.api import singleflight
+from starlingx_dashboard.api import tracing
+from starlingx_dashboard.utils import lazy
+from starlingx_dashboard.utils import metrics
 
 # Fault management values
 FM_ALL = 'ALL'
@@ -32,9 +36,41 @@ FM_MINOR = 'minor'
 FM_WARNING = 'warning'
 FM_NONE = 'none'
 
+# Fields returned by FM for alarms and event logs listed without being
+# expanded, by kind ('alarm' or 'event_log'), as seen in the first such
+# listing
+_short_fields = {}
+
+
+def _learn_short_fields(kind, resources):
+    info = getattr(resources[0], '_info', None) if resources else None
+    if info is not None and kind not in _short_fields:
+        _short_fields[kind] = frozenset(info)
+
+
+def short_fields_cover(kind, fields):
+    """Return whether the unexpanded listing of kind has all of fields.
+
+    The fields of that listing are learned from FM itself, so this returns
+    None until it has been listed once.
+    """
+    short = _short_fields.get(kind)
+    if short is None:
+        return None
+    return short.issuperset(fields)
+
+
+# Default number of seconds alarm counts are reused
+DEFAULT_ALARM_COUNTS_TTL = 10
+
+_ALARM_COUNTS_KEY = 'stx-alarm-counts-%s-%s'
+
 
 LOG = logging.getLogger(__name__)
 
+# Imported when the first client is built, rather than with this module
+fm_client = lazy.module('fmclient')
+
 
 def fmclient(request):
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
@@ -55,9 +91,10 @@ def fmclient(request):
     LOG.debug('user_id=%(user)s, tenant_id=%(tenant)s',
               {'user': request.user.id, 'tenant': request.user.tenant_id})
 
-    return fm_client.Client(version, endpoint,
-                            auth_token=request.user.token.id,
-                            insecure=insecure, cacert=cacert)
+    client = fm_client.Client(version, endpoint,
+                              auth_token=request.user.token.id,
+                              insecure=insecure, cacert=cacert)
+    return tracing.traced_client(client, request, 'faultmanagement')
 
 
 class AlarmSummary(base.APIResourceWrapper):
@@ -73,6 +110,8 @@ class AlarmSummary(base.APIResourceWrapper):
         super(AlarmSummary, self).__init__(apiresource)
 
 
+@singleflight.shared
+@breaker.guarded('faultmanagement', deadline=True)
 def alarm_summary_get(request, include_suppress=False):
     summary = fmclient(request).alarm.summary(
         include_suppress=include_suppress)
@@ -103,6 +142,8 @@ class Alarm(base.APIResourceWrapper):
         super(Alarm, self).__init__(apiresource)
 
 
+@singleflight.shared
+@breaker.guarded('faultmanagement', deadline=True)
 def alarm_list(request, search_opts=None):
     paginate = False
     include_suppress = False
@@ -139,6 +180,8 @@ def alarm_list(request, search_opts=None):
     alarms = fmclient(request).alarm.list(
         limit=limit, marker=marker, sort_key=sort_key, sort_dir=sort_dir,
         include_suppress=include_suppress, expand=expand)
+    if not expand:
+        _learn_short_fields('alarm', alarms)
 
     has_more_data = False
     if paginate and len(alarms) > page_size:
@@ -154,6 +197,71 @@ def alarm_list(request, search_opts=None):
         return [Alarm(n) for n in alarms]
 
 
+def _is_true(value):
+    return str(value).lower() == 'true'
+
+
+# Fields of alarms counted by alarm_counts()
+_ALARM_IMPACT_FIELDS = ('mgmt_affecting', 'service_affecting')
+
+
+@singleflight.shared
+@breaker.guarded('faultmanagement', deadline=True)
+def _alarm_counts_get(request, include_suppress):
+    client = fmclient(request)
+    counts = dict.fromkeys(['critical', 'major', 'minor', 'warnings'], 0)
+    summary = client.alarm.summary(include_suppress=include_suppress)
+    if len(summary) > 0:
+        for severity in counts:
+            counts[severity] = int(getattr(summary[0], severity, 0) or 0)
+
+    # The alarms are only expanded when their unexpanded listing is known
+    # to lack the fields counted
+    expand = short_fields_cover('alarm', _ALARM_IMPACT_FIELDS) is False
+    alarms = client.alarm.list(include_suppress=include_suppress,
+                               expand=expand)
+    if not expand:
+        _learn_short_fields('alarm', alarms)
+        if alarms and not short_fields_cover('alarm', _ALARM_IMPACT_FIELDS):
+            alarms = client.alarm.list(include_suppress=include_suppress,
+                                       expand=True)
+    counts['total'] = len(alarms)
+    counts['mgmt_affecting'] = len(
+        [a for a in alarms if _is_true(getattr(a, 'mgmt_affecting', None))])
+    counts['service_affecting'] = len(
+        [a for a in alarms
+         if _is_true(getattr(a, 'service_affecting', None))])
+    return counts
+
+
+def alarm_counts(request, include_suppress=False):
+    """Return the number of active alarms, by severity and impact.
+
+    The severity counts come from the alarm summary; the total and the
+    management and service affecting counts from a scan of the alarm
+    list, expanded only if its unexpanded listing lacks the impact fields.
+    Only the counts are kept, shared by the users of a region for
+    ALARM_COUNTS_TTL seconds.
+
+    :param include_suppress: a boolean, or its string form (as passed to
+                             the REST API).
+    :returns: a dict with the total, critical, major, minor, warnings,
+              mgmt_affecting and service_affecting counts.
+    """
+    include_suppress = _is_true(include_suppress)
+    key = _ALARM_COUNTS_KEY % (getattr(request.user, 'services_region', None),
+                               include_suppress)
+    counts = cache.get(key)
+    metrics.cache('alarm_counts', counts is not None)
+    if counts is not None:
+        return counts
+
+    counts = _alarm_counts_get(request, include_suppress)
+    cache.set(key, counts, getattr(settings, 'ALARM_COUNTS_TTL',
+                                   DEFAULT_ALARM_COUNTS_TTL))
+    return counts
+
+
 def alarm_get(request, alarm_id):
     alarm = fmclient(request).alarm.get(alarm_id)
     if not alarm:
@@ -183,6 +291,8 @@ class EventLog(base.APIResourceWrapper):
         super(EventLog, self).__init__(apiresource)
 
 
+@singleflight.shared
+@breaker.guarded('faultmanagement', deadline=True)
 def event_log_list(request, search_opts=None):
     paginate = False
 
@@ -233,6 +343,8 @@ def event_log_list(request, search_opts=None):
                         logs=logs,
                         include_suppress=include_suppress,
                         expand=expand)
+    if not expand:
+        _learn_short_fields('event_log', logs)
 
     has_more_data = False
     if paginate and len(logs) > page_size:
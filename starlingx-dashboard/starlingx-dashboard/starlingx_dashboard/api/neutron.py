@@ -7,8 +7,14 @@
 
 from openstack_dashboard.api import base
 from openstack_dashboard.api.neutron import NeutronAPIDictWrapper
-from openstack_dashboard.api.neutron import neutronclient
+from openstack_dashboard.api.neutron import neutronclient as os_neutronclient
 from openstack_dashboard.api.neutron import QoSPolicy
+from starlingx_dashboard.api import tracing
+
+
+def neutronclient(request):
+    return tracing.traced_client(os_neutronclient(request), request,
+                                 'network')
 
 
 class PortForwardingRule(base.APIDictWrapper):
@@ -22,14 +22,18 @@ import requests
 
 from openstack_dashboard.api import base
 
+from starlingx_dashboard.api import breaker
+from starlingx_dashboard.api import tracing
+
 LOG = logging.getLogger(__name__)
 
 
 class Client(object):
-    def __init__(self, version, url, token_id):
+    def __init__(self, version, url, token_id, region=None):
         self.version = version
         self.url = url
         self.token_id = token_id
+        self.region = region
 
     def _make_request(self, token_id, method, api_version, api_cmd,
                       encoder=None):
@@ -40,13 +44,19 @@ class Client(object):
         headers = {"X-Auth-Token": token_id,
                    "Accept": "application/json"}
 
+        timeout = breaker.timeout('patching')
         if method == 'GET':
-            req = requests.get(url, headers=headers)
+            req = breaker.call('patching', self.region, requests.get, url,
+                               headers=headers, timeout=timeout)
         elif method == 'POST':
             if encoder is not None:
                 headers['Content-Type'] = encoder.content_type
-            req = requests.post(url, headers=headers, data=encoder)
+            # Actions may take long and only have a deadline to connect
+            req = breaker.call('patching', self.region, requests.post, url,
+                               headers=headers, data=encoder,
+                               timeout=(timeout, None))
 
+        tracing.add_bytes(len(req.content))
         resp = req.json()
 
         return resp
@@ -63,7 +73,9 @@ class Client(object):
 def _patching_client(request):
     o = urlparse(base.url_for(request, 'patching'))
     url = "://".join((o.scheme, o.netloc))
-    return Client("v1", url, token_id=request.user.token.id)
+    client = Client("v1", url, token_id=request.user.token.id,
+                    region=getattr(request.user, 'services_region', None))
+    return tracing.traced_client(client, request, 'patching')
 
 
 class Patch(object):
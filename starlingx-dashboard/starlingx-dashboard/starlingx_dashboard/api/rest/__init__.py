@@ -14,13 +14,19 @@
 # Copyright (c) 2014 Wind River Systems, Inc.
 #
 
+from starlingx_dashboard.api.rest import batch
 from starlingx_dashboard.api.rest import dc_manager
 from starlingx_dashboard.api.rest import fm
+from starlingx_dashboard.api.rest import jobs
+from starlingx_dashboard.api.rest import metrics
 from starlingx_dashboard.api.rest import sysinv
 
 
 __all__ = [
+    'batch',
     'dc_manager',
     'fm',
+    'jobs',
+    'metrics',
     'sysinv',
 ]
@@ -0,0 +1,176 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+from concurrent import futures
+import logging
+import time
+
+from django.conf import settings
+from django import http
+from django import urls as django_urls
+from django.utils.http import urlencode
+from django.utils import translation
+from django.views import generic
+
+from openstack_dashboard.api.rest import urls
+from openstack_dashboard.api.rest import utils as rest_utils
+from starlingx_dashboard.api import tracing
+from starlingx_dashboard import middleware
+from starlingx_dashboard.utils import fastjson
+from starlingx_dashboard.utils import metrics
+from starlingx_dashboard.utils import subrequest
+
+LOG = logging.getLogger(__name__)
+
+# Default maximum number of sub-requests in a batch
+DEFAULT_BATCH_MAX_REQUESTS = 20
+
+# Default number of sub-requests of a batch run concurrently
+DEFAULT_BATCH_MAX_WORKERS = 8
+
+_REST_MODULE_PREFIX = 'starlingx_dashboard.api.rest.'
+
+
+def _resolve(url):
+    """Return the view match of a starlingx REST API URL, or None."""
+    try:
+        match = django_urls.resolve(url)
+    except django_urls.Resolver404:
+        return None
+    view_class = getattr(match.func, 'view_class', None)
+    if view_class is None or view_class is Batch or \
+            not view_class.__module__.startswith(_REST_MODULE_PREFIX):
+        return None
+    return match
+
+
+def _sub_request(request, url, match, params, etag):
+    # Sub-requests run concurrently: each has its own message storage and
+    # a read-only snapshot of the session
+    sub = subrequest.copy_request(request)
+    query = urlencode(params or {}, doseq=True)
+    sub.method = 'GET'
+    sub.path = sub.path_info = url
+    sub.GET = http.QueryDict(query)
+    sub.META = dict(request.META, REQUEST_METHOD='GET',
+                    PATH_INFO=url, QUERY_STRING=query)
+    # Sub-responses are embedded as they are, so they must not be gzipped
+    sub.META.pop('HTTP_ACCEPT_ENCODING', None)
+    sub.META.pop('HTTP_IF_NONE_MATCH', None)
+    if etag:
+        sub.META['HTTP_IF_NONE_MATCH'] = etag
+    sub._body = b''
+    sub.resolver_match = match
+    return sub
+
+
+def _run(request, match, language):
+    # The active language is thread local
+    translation.activate(language)
+    # Each sub-request gets its own trace and metrics, as the tracing and
+    # metrics middleware would give it
+    trace = tracing.start(request) if tracing.enabled() else None
+    started = time.monotonic()
+    status = 500
+    try:
+        response = match.func(request, *match.args, **match.kwargs)
+        status = response.status_code
+        if trace is not None:
+            middleware.report(request, response, trace)
+        return response
+    finally:
+        if trace is not None:
+            tracing.stop()
+        if metrics.enabled():
+            middleware.observe(request, status, time.monotonic() - started)
+        translation.deactivate()
+
+
+def _encode(response):
+    """Encode a sub-response as a JSON object, embedding its body."""
+    content = response.content
+    if not content:
+        content = b'null'
+    elif not response.get('Content-Type', '').endswith('json'):
+        content = fastjson.dumps(content.decode('utf-8', 'replace'))
+    header = {'status': response.status_code}
+    if response.has_header('ETag'):
+        header['etag'] = response['ETag']
+    # Splice the body in place of the closing brace of the header
+    return fastjson.dumps(header)[:-1] + b',"data":' + content + b'}'
+
+
+@urls.register
+class Batch(generic.View):
+    """API for running several starlingx REST API GETs at once."""
+    url_regex = r'stx/batch/$'
+
+    @rest_utils.ajax(data_required=True)
+    def post(self, request):
+        """Run GET requests of the starlingx REST API concurrently
+
+        POST http://localhost/api/stx/batch/
+        {"requests": [{"url": "/api/fm/alarm_summary/",
+                       "params": {"include_suppress": true},
+                       "etag": "W/\"...\""}, ...]}
+
+        The response holds, in the same order, the status, ETag and data
+        of each request: {"responses": [{"status": 200, "data": ...}]}.
+        A batch costs one session load and one authentication check
+        instead of one per request.
+
+        Sub-requests are passed to their view directly rather than
+        through the middleware chain: they share the session, user,
+        language and messages of the batch request, and are only GETs,
+        so CSRF checks do not apply.  The tracing and metrics of the
+        starlingx middleware, including the call budget checks of each
+        view, are applied to each sub-request by the batch, and the
+        backend calls of all sub-requests are added to the trace of the
+        batch request.  Other middleware, such as response compression or
+        the operation log, only sees the batch request.
+        """
+        requests = request.DATA.get('requests')
+        max_requests = getattr(settings, 'BATCH_MAX_REQUESTS',
+                               DEFAULT_BATCH_MAX_REQUESTS)
+        if not isinstance(requests, list) or \
+                not 0 < len(requests) <= max_requests:
+            raise rest_utils.AjaxError(
+                400, 'requests must be a list of 1 to %d requests' %
+                max_requests)
+
+        subs = []
+        for item in requests:
+            url = item.get('url', '') if isinstance(item, dict) else ''
+            match = _resolve(url)
+            if match is None:
+                raise rest_utils.AjaxError(400, 'Invalid batch URL: %s' % url)
+            subs.append((_sub_request(request, url, match,
+                                      item.get('params'), item.get('etag')),
+                         match))
+
+        language = translation.get_language()
+        workers = min(len(subs), getattr(settings, 'BATCH_MAX_WORKERS',
+                                         DEFAULT_BATCH_MAX_WORKERS))
+        with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = [executor.submit(_run, sub, match, language)
+                       for sub, match in subs]
+        trace = tracing.get(request)
+        bodies = []
+        for (sub, _match), future in zip(subs, pending):
+            subrequest.forward_messages(sub, request)
+            sub_trace = tracing.get(sub)
+            if trace is not None and sub_trace is not trace:
+                for span in sub_trace.spans:
+                    trace.add(span)
+            try:
+                bodies.append(_encode(future.result()))
+            except Exception as ex:
+                LOG.exception("Batch request failed")
+                bodies.append(fastjson.dumps({'status': 500,
+                                              'data': str(ex)}))
+
+        return fastjson.body_response(
+            request, b'{"responses":[' + b','.join(bodies) + b']}')
@@ -0,0 +1,81 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import functools
+import hashlib
+
+from django import http
+from django.utils.http import parse_etags
+
+from starlingx_dashboard.utils import fastjson
+from starlingx_dashboard.utils import metrics
+
+
+def _etag(digest):
+    # Weak, as the same JSON may be sent gzipped or not
+    return 'W/"%s"' % digest.hexdigest()
+
+
+def _opaque(etag):
+    return etag[2:] if etag.startswith('W/') else etag
+
+
+def _matches(request, etag):
+    # If-None-Match uses the weak comparison
+    etags = parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+    matches = '*' in etags or _opaque(etag) in [_opaque(e) for e in etags]
+    if etags:
+        metrics.cache('conditional_get', matches)
+    return matches
+
+
+def _with_etag(response, etag):
+    response['ETag'] = etag
+    # Clients must check with the server before reusing a response
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def etag(version=None):
+    """Answer conditional GET requests of a REST API view.
+
+    Used inside rest_utils.ajax(), on a view returning data to encode as
+    JSON.  The ETag is a fingerprint of the encoded data, or, when version
+    is given and version(request, *args, **kwargs) returns something other
+    than None, of that value and of the request's URL; the view is not
+    called at all when such a version matches If-None-Match.
+
+    A request whose If-None-Match matches is answered with an empty 304.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def _wrapped(self, request, *args, **kw):
+            tag = None
+            if version is not None:
+                value = version(request, *args, **kw)
+                if value is not None:
+                    digest = hashlib.sha1(str(value).encode('utf-8'))
+                    digest.update(request.get_full_path().encode('utf-8'))
+                    tag = _etag(digest)
+                    if _matches(request, tag):
+                        return _with_etag(http.HttpResponseNotModified(), tag)
+
+            data = function(self, request, *args, **kw)
+            if data is None or isinstance(data, http.HttpResponse):
+                return data
+
+            # Never streamed, as rest_utils.ajax() only passes plain
+            # HttpResponses through; encoded once for the ETag and body
+            body = fastjson.dumps(data)
+            if tag is None:
+                tag = _etag(hashlib.sha1(body))
+                if _matches(request, tag):
+                    return _with_etag(http.HttpResponseNotModified(), tag)
+
+            response = fastjson.body_response(request, body)
+            return _with_etag(response, tag)
+        return _wrapped
+    return decorator
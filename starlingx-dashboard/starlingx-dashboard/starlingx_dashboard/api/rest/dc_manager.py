@@ -19,10 +19,28 @@ from django.views import generic
 
 from openstack_dashboard.api.rest import urls
 from openstack_dashboard.api.rest import utils as rest_utils
-from starlingx_dashboard.api import dc_manager
+from starlingx_dashboard import api
+from starlingx_dashboard.api.rest import conditional
+from starlingx_dashboard.api.rest import projection
+from starlingx_dashboard.utils import choices
+from starlingx_dashboard.utils import jobs
+from starlingx_dashboard.utils import lazy
 
 LOG = logging.getLogger(__name__)
 
+# Imported when a subcloud creation fails, rather than with the REST API
+dcmanager_exc = lazy.module('dcmanagerclient.exceptions')
+
+
+def _create_subcloud(job, data):
+    try:
+        api.dc_manager.subcloud_create(job.request, data)
+    except dcmanager_exc.APIException as e:
+        LOG.error(e.error_message)
+        job.error(e.error_message)
+        return None
+    return 'Subcloud created succesfully.'
+
 
 @urls.register
 class Subcloud(generic.View):
@@ -36,7 +54,7 @@ class Subcloud(generic.View):
 
         PATCH http://localhost/api/dc_manager/subclouds/2
         """
-        dc_manager.subcloud_update(request, subcloud_id, request.DATA)
+        api.dc_manager.subcloud_update(request, subcloud_id, request.DATA)
 
     @rest_utils.ajax()
     def delete(self, request, subcloud_id):
@@ -44,7 +62,7 @@ class Subcloud(generic.View):
 
         DELETE http://localhost/api/dc_manager/subclouds/3
         """
-        dc_manager.subcloud_delete(request, subcloud_id)
+        api.dc_manager.subcloud_delete(request, subcloud_id)
 
 
 @urls.register
@@ -57,8 +75,8 @@ class SubcloudConfig(generic.View):
     def get(self, request, subcloud_id):
         """Generate a config for a specific subcloud."""
 
-        response = dc_manager.subcloud_generate_config(request, subcloud_id,
-                                                       request.GET.dict())
+        response = api.dc_manager.subcloud_generate_config(
+            request, subcloud_id, request.GET.dict())
         response = {'config': response}
         return rest_utils.CreatedResponse('/api/dc_manager/subclouds/',
                                           response)
@@ -70,19 +88,51 @@ class SubClouds(generic.View):
     url_regex = r'dc_manager/subclouds/$'
 
     @rest_utils.ajax()
+    @conditional.etag()
     def get(self, request):
         """Get a list of subclouds"""
-        result = dc_manager.subcloud_list(request)
-        return {'items': [sc.to_dict() for sc in result]}
+        result = api.dc_manager.subcloud_list(request)
+        return {'items': projection.project_list(
+            result, projection.get_fields(request))}
 
     @rest_utils.ajax(data_required=True)
     def put(self, request):
         """Create a Subcloud.
 
         Create a subcloud using the parameters supplied in the POST
-        application/json object.
+        application/json object. The subcloud is created by a background
+        job whose id is returned.
         """
-        dc_manager.subcloud_create(request, request.DATA)
+        job_id = jobs.submit(request, 'Create subcloud', _create_subcloud,
+                             request.DATA)
+        return {'job_id': job_id}
+
+
+@urls.register
+class SubcloudNames(generic.View):
+    """API for looking up subcloud names"""
+    url_regex = r'dc_manager/subcloud-names/$'
+
+    # Default maximum number of names returned
+    DEFAULT_LIMIT = 20
+
+    @rest_utils.ajax()
+    def get(self, request):
+        """Get the subcloud names containing a string
+
+        GET http://localhost/api/dc_manager/subcloud-names/?q=edge&limit=20
+        """
+        q = request.GET.get('q', '').lower()
+        try:
+            limit = int(request.GET.get('limit', self.DEFAULT_LIMIT))
+        except ValueError:
+            raise rest_utils.AjaxError(400, 'Invalid limit')
+
+        names = choices.load(request, [api.dc_manager.subcloud_name_list])[0]
+        matches = [name for name in names if q in name.lower()]
+        # Names starting with the string come first
+        matches.sort(key=lambda name: not name.lower().startswith(q))
+        return {'items': matches[:limit], 'total': len(matches)}
 
 
 @urls.register
@@ -91,10 +141,12 @@ class SubCloudGroups(generic.View):
     url_regex = r'dc_manager/subcloud-groups/$'
 
     @rest_utils.ajax()
+    @conditional.etag()
     def get(self, request):
         """Get a list of subcloud groups"""
-        result = dc_manager.list_subcloud_groups(request)
-        return {'items': [scg.to_dict() for scg in result]}
+        result = api.dc_manager.list_subcloud_groups(request)
+        return {'items': projection.project_list(
+            result, projection.get_fields(request))}
 
 
 @urls.register
@@ -103,7 +155,9 @@ class Summaries(generic.View):
     url_regex = r'dc_manager/alarm_summaries/$'
 
     @rest_utils.ajax()
+    @conditional.etag()
     def get(self, request):
         """Get a list of summaries"""
-        result = dc_manager.alarm_summary_list(request)
-        return {'items': [s.to_dict() for s in result]}
+        result = api.dc_manager.alarm_summary_list(request)
+        return {'items': projection.project_list(
+            result, projection.get_fields(request))}
@@ -9,23 +9,55 @@ from django.views import generic
 
 from openstack_dashboard.api.rest import urls
 from openstack_dashboard.api.rest import utils as rest_utils
-from starlingx_dashboard.api import fm
+from starlingx_dashboard import api
+from starlingx_dashboard.api.rest import conditional
+from starlingx_dashboard.api.rest import projection
 
 
 LOG = logging.getLogger(__name__)
 
 
+def _list_projected(kind, fields, list_call):
+    """List alarms or event logs, only expanded when fields requires it.
+
+    The fields of the unexpanded listing are the ones FM returns: until
+    they are known, the unexpanded listing is tried first.
+    """
+    covered = None
+    if fields is not None:
+        covered = api.fm.short_fields_cover(kind, fields)
+    if fields is not None and covered is not False:
+        result = list_call({'suppression': api.fm.FM_SUPPRESS_SHOW})
+        if covered or api.fm.short_fields_cover(kind, fields) is not False:
+            return result
+    return list_call({'suppression': api.fm.FM_SUPPRESS_SHOW, 'expand': True})
+
+
 @urls.register
 class AlarmSummary(generic.View):
     """API for retrieving alarm summaries."""
     url_regex = r'fm/alarm_summary/$'
 
     @rest_utils.ajax()
+    @conditional.etag()
     def get(self, request):
         """Get an alarm summary for the system"""
         include_suppress = request.GET.get('include_suppress', False)
-        result = fm.alarm_summary_get(request, include_suppress)
-        return result.to_dict()
+        result = api.fm.alarm_summary_get(request, include_suppress)
+        return projection.project(result, projection.get_fields(request))
+
+
+@urls.register
+class AlarmCounts(generic.View):
+    """API for retrieving alarm counts."""
+    url_regex = r'fm/alarm_counts/$'
+
+    @rest_utils.ajax()
+    @conditional.etag()
+    def get(self, request):
+        """Get the number of alarms by severity and impact"""
+        include_suppress = request.GET.get('include_suppress', False)
+        return api.fm.alarm_counts(request, include_suppress)
 
 
 @urls.register
@@ -34,12 +66,19 @@ class Alarms(generic.View):
     url_regex = r'fm/alarm_list/$'
 
     @rest_utils.ajax()
+    @conditional.etag()
     def get(self, request):
-        search_opts = {'suppression': 'SUPPRESS_SHOW', 'expand': True}
+        """Get a list of alarms
 
-        result = fm.alarm_list(request, search_opts=search_opts)
+        The fields parameter (e.g. ?fields=uuid,severity) limits the fields
+        returned; alarms are only expanded when a field requires it.
+        """
+        fields = projection.get_fields(request)
+        result = _list_projected(
+            'alarm', fields,
+            lambda opts: api.fm.alarm_list(request, search_opts=opts))
 
-        return {'items': [sc.to_dict() for sc in result]}
+        return {'items': projection.project_list(result, fields)}
 
 
 @urls.register
@@ -49,7 +88,7 @@ class Alarm(generic.View):
 
     @rest_utils.ajax()
     def get(self, request, uuid):
-        result = fm.alarm_get(request, uuid)
+        result = api.fm.alarm_get(request, uuid)
         return result.to_dict()
 
 
@@ -59,12 +98,19 @@ class Events(generic.View):
     url_regex = r'fm/event_log_list/$'
 
     @rest_utils.ajax()
+    @conditional.etag()
     def get(self, request):
-        search_opts = {'suppression': 'SUPPRESS_SHOW', 'expand': True}
+        """Get a list of events
 
-        result, _more = fm.event_log_list(request, search_opts=search_opts)
+        The fields parameter (e.g. ?fields=uuid,state) limits the fields
+        returned; events are only expanded when a field requires it.
+        """
+        fields = projection.get_fields(request)
+        result = _list_projected(
+            'event_log', fields,
+            lambda opts: api.fm.event_log_list(request, search_opts=opts)[0])
 
-        return {'items': [sc.to_dict() for sc in result]}
+        return {'items': projection.project_list(result, fields)}
 
 
 @urls.register
@@ -74,7 +120,7 @@ class Event(generic.View):
 
     @rest_utils.ajax()
     def get(self, request, uuid):
-        result = fm.event_log_get(request, uuid)
+        result = api.fm.event_log_get(request, uuid)
         return result.to_dict()
 
 
@@ -84,6 +130,7 @@ class EventsSuppression(generic.View):
     url_regex = r'fm/events_suppression_list/$'
 
     @rest_utils.ajax()
+    @conditional.etag()
     def get(self, request):
 
         if 'include_unsuppressed' in request.GET:
@@ -91,7 +138,7 @@ class EventsSuppression(generic.View):
         else:
             include_unsuppressed = False
 
-        result = fm.event_suppression_list(
+        result = api.fm.event_suppression_list(
             request, include_unsuppressed=include_unsuppressed)
         return {'items': [sc.to_dict() for sc in result]}
 
@@ -104,5 +151,6 @@ class EventSuppression(generic.View):
     @rest_utils.ajax(data_required=True)
     def patch(self, request, uuid):
 
-        result = fm.event_suppression_update(request, uuid, **(request.DATA))
+        result = api.fm.event_suppression_update(request, uuid,
+                                                 **(request.DATA))
         return result.to_dict()
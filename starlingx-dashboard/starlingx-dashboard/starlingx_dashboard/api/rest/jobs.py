@@ -0,0 +1,53 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+from django.views import generic
+
+from openstack_dashboard.api.rest import urls
+from openstack_dashboard.api.rest import utils as rest_utils
+from starlingx_dashboard.utils import jobs
+
+
+@urls.register
+class Jobs(generic.View):
+    """API for listing the background jobs of the current user."""
+    url_regex = r'stx/jobs/$'
+
+    @rest_utils.ajax()
+    def get(self, request):
+        """Get a list of the jobs of the current user"""
+        return {'items': jobs.job_list(request)}
+
+
+@urls.register
+class Job(generic.View):
+    """API for polling the progress of a background job."""
+    url_regex = r'stx/jobs/(?P<job_id>[^/]+)/$'
+
+    @rest_utils.ajax()
+    def get(self, request, job_id):
+        """Get the state and progress of a job
+
+        GET http://localhost/api/stx/jobs/<job_id>/
+        """
+        record = jobs.get(request, job_id)
+        if record is None:
+            raise rest_utils.AjaxError(404, 'Job %s not found.' % job_id)
+        return record
+
+    @rest_utils.ajax()
+    def post(self, request, job_id):
+        """Acknowledge a finished job, whose outcome the caller reported
+
+        The job is then no longer reported by the Horizon messages of the
+        next page.
+
+        POST http://localhost/api/stx/jobs/<job_id>/
+        """
+        record = jobs.get(request, job_id)
+        if record is None:
+            raise rest_utils.AjaxError(404, 'Job %s not found.' % job_id)
+        jobs.acknowledge(record)
@@ -0,0 +1,45 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import hmac
+
+from django.conf import settings
+from django import http
+from django.views import generic
+
+from openstack_dashboard.api.rest import urls
+from starlingx_dashboard.utils import metrics
+
+_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _has_token(request):
+    # Lets a Prometheus server scrape without a Horizon session
+    token = getattr(settings, 'METRICS_TOKEN', None)
+    authorization = request.META.get('HTTP_AUTHORIZATION', '')
+    return bool(token) and hmac.compare_digest(
+        authorization.encode('utf-8'), ('Bearer %s' % token).encode('utf-8'))
+
+
+@urls.register
+class Metrics(generic.View):
+    """API for scraping the dashboard metrics."""
+    url_regex = r'stx/metrics/$'
+
+    def get(self, request):
+        """Get the dashboard metrics in the Prometheus text format
+
+        GET http://localhost/api/stx/metrics/
+
+        For administrators, or with the METRICS_TOKEN bearer token.
+        """
+        if not _has_token(request):
+            if not request.user.is_authenticated:
+                return http.HttpResponse('not logged in', status=401,
+                                         content_type='text/plain')
+            if not request.user.is_superuser:
+                return http.HttpResponseForbidden(content_type='text/plain')
+        return http.HttpResponse(metrics.render(), content_type=_CONTENT_TYPE)
@@ -0,0 +1,29 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+
+def get_fields(request):
+    """Return the fields requested with ?fields=a,b,c, or None for all."""
+    fields = request.GET.get('fields')
+    if not fields:
+        return None
+    return [f for f in (f.strip() for f in fields.split(',')) if f]
+
+
+def project(resource, fields=None):
+    """Serialize an API resource wrapper, limited to some of its fields.
+
+    Only attributes of the wrapper (its _attrs) are returned; unknown
+    fields are ignored.
+    """
+    if fields is None:
+        return resource.to_dict()
+    return {f: getattr(resource, f, None) for f in fields
+            if f in resource._attrs}
+
+
+def project_list(resources, fields=None):
+    return [project(resource, fields) for resource in resources]
@@ -18,7 +18,9 @@ from django.views import generic
 
 from openstack_dashboard.api.rest import urls
 from openstack_dashboard.api.rest import utils as rest_utils
-from starlingx_dashboard.api import sysinv
+from starlingx_dashboard import api
+from starlingx_dashboard.api.rest import conditional
+from starlingx_dashboard.api.rest import projection
 
 
 @urls.register
@@ -27,7 +29,8 @@ class System(generic.View):
     url_regex = r'sysinv/system/$'
 
     @rest_utils.ajax()
+    @conditional.etag()
     def get(self, request):
         """Get the system entity"""
-        result = sysinv.system_get(request)
-        return result.to_dict()
+        result = api.sysinv.system_get(request)
+        return projection.project(result, projection.get_fields(request))
@@ -0,0 +1,101 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import copy
+import functools
+import logging
+import threading
+
+from django.conf import settings
+
+from starlingx_dashboard.api import base as stx_base
+from starlingx_dashboard.utils import metrics
+
+LOG = logging.getLogger(__name__)
+
+# Default for API_SINGLE_FLIGHT, whether identical concurrent read calls
+# share one backend request
+DEFAULT_API_SINGLE_FLIGHT = True
+
+# In-flight calls, by key
+_calls = {}
+_calls_lock = threading.Lock()
+
+
+def copy_result(result):
+    """Copy a result for one caller: lists and tuples are copied with a
+    shallow copy of each of their items (API resource wrappers), so that
+    callers can set attributes of the items without seeing each other's."""
+    if isinstance(result, (list, tuple)):
+        return type(result)(copy_result(item) for item in result)
+    if result is None or isinstance(result, (str, int, float, bool)):
+        return result
+    return copy.copy(result)
+
+
+def _page_size(request):
+    # Paginated calls list the page size of the user's session
+    session = getattr(request, 'session', None)
+    return session.get('horizon_pagesize') if session is not None else None
+
+
+class _Call(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def shared(function):
+    """Share one in-flight call between identical concurrent calls.
+
+    For read API calls taking the request first.  A call made while an
+    identical one (same function, arguments and authorization scope) is
+    in flight in another thread waits for it and gets its result, or its
+    exception, instead of sending the same request to the backend.  The
+    page size of the user's session is part of what makes calls
+    identical.
+
+    Each caller gets its own copy of the result and of its items; the
+    API resources wrapped by the items are shared and must not be
+    modified.
+    """
+    name = '%s.%s' % (function.__module__, function.__name__)
+
+    @functools.wraps(function)
+    def _wrapped(request, *args, **kwargs):
+        if not getattr(settings, 'API_SINGLE_FLIGHT',
+                       DEFAULT_API_SINGLE_FLIGHT):
+            return function(request, *args, **kwargs)
+
+        key = (name, stx_base.auth_scope(request), _page_size(request),
+               repr(args), repr(sorted(kwargs.items())))
+        with _calls_lock:
+            call = _calls.get(key)
+            leader = call is None
+            if leader:
+                call = _calls[key] = _Call()
+        metrics.cache('single_flight', not leader)
+
+        if not leader:
+            LOG.debug("Waiting for the in-flight %s call", name)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy_result(call.result)
+
+        try:
+            call.result = function(request, *args, **kwargs)
+            return copy_result(call.result)
+        except Exception as ex:
+            call.error = ex
+            raise
+        finally:
+            with _calls_lock:
+                del _calls[key]
+            call.done.set()
+
+    return _wrapped
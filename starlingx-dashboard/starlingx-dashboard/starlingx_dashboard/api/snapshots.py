@@ -0,0 +1,102 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import logging
+import threading
+import time
+
+from django.core.cache import cache
+
+from starlingx_dashboard.utils import metrics
+
+LOG = logging.getLogger(__name__)
+
+_VERSION_KEY = 'stx-snapshot-version-%s-%s'
+
+
+class SnapshotCache(object):
+    """Snapshots of backend state, such as a strategy or the USM deploy
+    state, reused by the later requests of a user in the same region.
+
+    Snapshots are kept by each process for the number of seconds given by
+    their ttl.  Changes made through the
+    dashboard invalidate the snapshots of a region in every process: each
+    invalidation increments a version number kept in the Django cache,
+    and snapshots taken at another version are not reused.
+
+    Snapshots are shared between requests, so they must not be modified
+    once fetched.  They are kept per user token, or per region only when
+    shared, for backend state that does not depend on the user.
+    """
+
+    def __init__(self, name, shared=False):
+        self.name = name
+        self.shared = shared
+        self._snapshots = {}
+        self._lock = threading.Lock()
+
+    def _version_key(self, region):
+        return _VERSION_KEY % (self.name, region)
+
+    def get(self, request, fetch, ttl, key=()):
+        """Return the snapshot of the request's region and of key.
+
+        The snapshot is shared by everything rendered for the request.
+        fetch() takes a new snapshot, and ttl(snapshot) returns the number
+        of seconds it is reused, or 0 for it not to be reused.
+        """
+        region = getattr(request.user, 'services_region', None)
+        if self.shared:
+            snapshot_key = (region,) + tuple(key)
+        else:
+            snapshot_key = (region, request.user.token.id) + tuple(key)
+        request_snapshots = request.__dict__.setdefault('_stx_snapshots', {})
+        snapshot = request_snapshots.get((self.name, snapshot_key))
+        if snapshot is not None:
+            return snapshot
+
+        version = cache.get(self._version_key(region), 0)
+        now = time.monotonic()
+        with self._lock:
+            expires, snapshot_version, snapshot = self._snapshots.get(
+                snapshot_key, (0, None, None))
+        hit = snapshot is not None and expires > now and \
+            snapshot_version == version
+        metrics.cache(self.name, hit)
+        if not hit:
+            snapshot = fetch()
+            seconds = ttl(snapshot)
+            with self._lock:
+                for k in [k for k, (e, _v, _s) in self._snapshots.items()
+                          if e <= now]:
+                    del self._snapshots[k]
+                if seconds:
+                    self._snapshots[snapshot_key] = (now + seconds, version,
+                                                     snapshot)
+
+        request_snapshots[(self.name, snapshot_key)] = snapshot
+        return snapshot
+
+    def invalidate(self, request):
+        """Stop reusing the snapshots of the request's region, in every
+        process, including the one of the request itself."""
+        region = getattr(request.user, 'services_region', None)
+        key = self._version_key(region)
+        try:
+            # incr is atomic with memcached; add creates the key first
+            if not cache.add(key, 1, None):
+                cache.incr(key)
+        except ValueError:
+            # The key was evicted since it was added
+            cache.set(key, 1, None)
+        request_snapshots = request.__dict__.get('_stx_snapshots', {})
+        for name_key in [k for k in request_snapshots if k[0] == self.name]:
+            del request_snapshots[name_key]
+
+    def clear(self):
+        """Forget the snapshots kept by this process."""
+        with self._lock:
+            self._snapshots.clear()
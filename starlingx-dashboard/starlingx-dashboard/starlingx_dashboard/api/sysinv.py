@@ -19,12 +19,18 @@ import datetime
 import logging
 import math
 
-from cgtsclient.v1 import client as cgts_client
+from cgtsclient import exc as cgts_exc
 from django.conf import settings
 from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 
+from horizon.utils.memoized import memoized
 from openstack_dashboard.api import base
+from starlingx_dashboard.api import breaker
+from starlingx_dashboard.api import singleflight
+from starlingx_dashboard.api import tracing
+from starlingx_dashboard.utils import lazy
+from starlingx_dashboard.utils import platform_config
 
 import cgcs_patch.constants as patch_constants
 import sysinv.common.constants as constants
@@ -102,10 +108,25 @@ K8S_LABEL_OPENSTACK_COMPUTE_NODE = 'openstack-compute-node'
 K8S_LABEL_OPENVSWITCH = 'openvswitch'
 K8S_LABEL_SRIOV = 'sriov'
 
+
+def _display_lookup(display_choices):
+    """Map the lowercased values of display_choices to their display.
+
+    Built once for each display choices tuple, next to it; as when
+    scanning the tuple, the first display of a value wins.
+    """
+    lookup = {}
+    for value, display in display_choices:
+        if value:
+            lookup.setdefault(value.lower(), display)
+    return lookup
+
+
 CLOCK_SYNCHRONIZATION_CHOICES = (
     (constants.NTP, _("ntp")),
     (constants.PTP, _("ptp")),
 )
+_CLOCK_SYNCHRONIZATION_DISPLAY = _display_lookup(CLOCK_SYNCHRONIZATION_CHOICES)
 
 # Host Board Management Constants
 HOST_BM_TYPE_DEPROVISIONED = "none"
@@ -120,6 +141,52 @@ IMPORTED_LOAD_STATE = 'imported'
 
 LOG = logging.getLogger(__name__)
 
+# Imported when the first client is built, rather than with this module
+cgts_client = lazy.module('cgtsclient.v1.client')
+
+
+def _platform_unreachable(error):
+    """Tell whether error is a failure of the platform API of an offline
+    subcloud.  cgtsclient then fails with a TypeError; TypeErrors raised
+    by the dashboard itself are bugs, which must not open the circuit."""
+    if isinstance(error, cgts_exc.CommunicationError):
+        return True
+    return isinstance(error, TypeError) and \
+        breaker.raised_in(error, 'cgtsclient')
+
+
+class APIRecord(object):
+    """A compact record of the fields of an API resource.
+
+    Used like base.APIResourceWrapper for resources listed in large
+    numbers, but the _attrs fields of the resource's info are copied into
+    slots and the resource itself is dropped. Subclasses declare
+    __slots__ as their _attrs plus the extension slots the views set.
+    As with the wrapper, reading a field the resource lacks, or an
+    extension slot never set, raises AttributeError.
+    """
+
+    __slots__ = ()
+    _attrs = []
+
+    def __init__(self, apiresource):
+        info = getattr(apiresource, '_info', None)
+        if info is None:
+            info = {attr: getattr(apiresource, attr) for attr in self._attrs
+                    if hasattr(apiresource, attr)}
+        for attr in self._attrs:
+            if attr in info:
+                setattr(self, attr, info[attr])
+
+    def __repr__(self):
+        return "<%s: %s>" % (self.__class__.__name__,
+                             {attr: getattr(self, attr)
+                              for attr in self._attrs
+                              if hasattr(self, attr)})
+
+    def to_dict(self):
+        return {attr: getattr(self, attr, None) for attr in self._attrs}
+
 
 def cgtsclient(request):
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
@@ -134,14 +201,16 @@ def cgtsclient(request):
     LOG.debug('user_id=%(user)s, tenant_id=%(tenant)s',
               {'user': request.user.id, 'tenant': request.user.tenant_id})
 
-    return cgts_client.Client(version=version,
-                              endpoint=endpoint,
-                              auth_url=base.url_for(request, 'identity'),
-                              token=request.user.token.id,  # os_auth_token
-                              username=request.user.username,
-                              password=request.user.token.id,
-                              tenant_id=request.user.tenant_id,  # os_tenant_id
-                              insecure=insecure, cacert=cacert)
+    c = cgts_client.Client(version=version,
+                           endpoint=endpoint,
+                           auth_url=base.url_for(request, 'identity'),
+                           token=request.user.token.id,  # os_auth_token
+                           username=request.user.username,
+                           password=request.user.token.id,
+                           tenant_id=request.user.tenant_id,  # os_tenant_id
+                           insecure=insecure, cacert=cacert,
+                           timeout=breaker.timeout('platform'))
+    return tracing.traced_client(c, request, 'platform')
 
 
 class Label(base.APIResourceWrapper):
@@ -244,7 +313,7 @@ class Cpu(base.APIResourceWrapper):
         super(Cpu, self).__init__(apiresource)
 
 
-class Port(base.APIResourceWrapper):
+class Port(APIRecord):
     """Wrapper for Inventory Ports"""
 
     _attrs = ['id', 'uuid', 'name', 'namedisplay', 'pciaddr', 'pclass',
@@ -254,6 +323,7 @@ class Port(base.APIResourceWrapper):
               'bootp', 'autoneg', 'type', 'sriov_numvfs', 'sriov_totalvfs',
               'sriov_vfs_pci_address', 'sriov_vf_driver', 'max_tx_rate',
               'driver', 'dpdksupport', 'neighbours']
+    __slots__ = _attrs + ['host_id']
 
     def __init__(self, apiresource):
         super(Port, self).__init__(apiresource)
@@ -374,7 +444,7 @@ def host_pv_delete(request, ipv_id):
     return cgtsclient(request).ipv.delete(ipv_id)
 
 
-class Partition(base.APIResourceWrapper):
+class Partition(APIRecord):
     """Wrapper for Inventory Partitions."""
 
     _attrs = ['uuid',
@@ -389,6 +459,7 @@ class Partition(base.APIResourceWrapper):
               'capabilities',
               'ihost_uuid',
               'status']
+    __slots__ = _attrs + ['host_id']
 
     def __init__(self, apiresource):
         super(Partition, self).__init__(apiresource)
@@ -512,7 +583,7 @@ def host_lvg_get_params(request, lvg_id, raw=False, lvg=None):
             key, value in params.items()]
 
 
-class Sensor(base.APIResourceWrapper):
+class Sensor(APIRecord):
     """Wrapper for Sensors"""
 
     _attrs = ['uuid',
@@ -529,6 +600,7 @@ class Sensor(base.APIResourceWrapper):
               'suppress',
               'created_at',
               'updated_at']
+    __slots__ = _attrs + ['host_id', 'sensorgroups', 'sensorgroupNameList']
 
     def __init__(self, apiresource):
         super(Sensor, self).__init__(apiresource)
@@ -614,6 +686,7 @@ class SensorGroup(base.APIResourceWrapper):
         (SENSORS_AC_POWEROFF, _("Power Off Host")),
         (SENSORS_AC_NOACTIONSCONFIGURABLE, _("No Configurable Actions")),
     )
+    _ACTIONS_DISPLAY = _display_lookup(ACTIONS_DISPLAY_CHOICES)
 
     def __init__(self, apiresource):
         super(SensorGroup, self).__init__(apiresource)
@@ -625,14 +698,9 @@ class SensorGroup(base.APIResourceWrapper):
             return '(' + str(self.uuid)[-8:] + ')'
 
     @staticmethod
-    def _get_display_value(display_choices, data):
+    def _get_display_value(display, data):
         """Lookup the display value in the provided dictionary."""
-        display_value = [display for (value, display) in display_choices
-                         if value and value.lower() == (data or '').lower()]
-
-        if display_value:
-            return display_value[0]
-        return None
+        return display.get((data or '').lower())
 
     def _get_sensorgroup_actions_critical_list(self):
         actions_critical_choices_list = []
@@ -645,7 +713,7 @@ class SensorGroup(base.APIResourceWrapper):
     @property
     def sensorgroup_actions_critical_choices(self):
         dv = self._get_display_value(
-            self.ACTIONS_DISPLAY_CHOICES,
+            self._ACTIONS_DISPLAY,
             self.actions_critical_choices)
 
         actions_critical_choices_tuple = (self.actions_critical_choices, dv)
@@ -661,20 +729,20 @@ class SensorGroup(base.APIResourceWrapper):
         if not actions_critical_choices_list:
             ac = SENSORS_AC_NOACTIONSCONFIGURABLE
             dv = self._get_display_value(
-                self.ACTIONS_DISPLAY_CHOICES, ac)
+                self._ACTIONS_DISPLAY, ac)
             actions_critical_choices_tuple_list.append((ac, dv))
         else:
             actions_critical_choices_tuple_set = set()
 
             ac = SENSORS_AC_IGNORE
             dv = self._get_display_value(
-                self.ACTIONS_DISPLAY_CHOICES, ac)
+                self._ACTIONS_DISPLAY, ac)
 
             actions_critical_choices_tuple_set.add((ac, dv))
 
             for ac in actions_critical_choices_list:
                 dv = self._get_display_value(
-                    self.ACTIONS_DISPLAY_CHOICES, ac)
+                    self._ACTIONS_DISPLAY, ac)
 
                 if not dv:
                     dv = ac
@@ -700,7 +768,7 @@ class SensorGroup(base.APIResourceWrapper):
     @property
     def sensorgroup_actions_major_choices(self):
         dv = self._get_display_value(
-            self.ACTIONS_DISPLAY_CHOICES,
+            self._ACTIONS_DISPLAY,
             self.actions_major_choices)
 
         actions_major_choices_tuple = (self.actions_major_choices, dv)
@@ -715,20 +783,20 @@ class SensorGroup(base.APIResourceWrapper):
         if not actions_major_choices_list:
             ac = SENSORS_AC_NOACTIONSCONFIGURABLE
             dv = self._get_display_value(
-                self.ACTIONS_DISPLAY_CHOICES, ac)
+                self._ACTIONS_DISPLAY, ac)
             actions_major_choices_tuple_list.append((ac, dv))
         else:
             actions_major_choices_tuple_set = set()
 
             ac = SENSORS_AC_IGNORE
             dv = self._get_display_value(
-                self.ACTIONS_DISPLAY_CHOICES, ac)
+                self._ACTIONS_DISPLAY, ac)
 
             actions_major_choices_tuple_set.add((ac, dv))
 
             for ac in actions_major_choices_list:
                 dv = self._get_display_value(
-                    self.ACTIONS_DISPLAY_CHOICES, ac)
+                    self._ACTIONS_DISPLAY, ac)
 
                 if not dv:
                     dv = ac
@@ -754,7 +822,7 @@ class SensorGroup(base.APIResourceWrapper):
     @property
     def sensorgroup_actions_minor_choices(self):
         dv = self._get_display_value(
-            self.ACTIONS_DISPLAY_CHOICES,
+            self._ACTIONS_DISPLAY,
             self.actions_minor_choices)
 
         actions_minor_choices_tuple = (self.actions_minor_choices, dv)
@@ -769,20 +837,20 @@ class SensorGroup(base.APIResourceWrapper):
         if not actions_minor_choices_list:
             ac = SENSORS_AC_NOACTIONSCONFIGURABLE
             dv = self._get_display_value(
-                self.ACTIONS_DISPLAY_CHOICES, ac)
+                self._ACTIONS_DISPLAY, ac)
             actions_minor_choices_tuple_list.append((ac, dv))
         else:
             actions_minor_choices_tuple_set = set()
 
             ac = SENSORS_AC_IGNORE
             dv = self._get_display_value(
-                self.ACTIONS_DISPLAY_CHOICES, ac)
+                self._ACTIONS_DISPLAY, ac)
 
             actions_minor_choices_tuple_set.add((ac, dv))
 
             for ac in actions_minor_choices_list:
                 dv = self._get_display_value(
-                    self.ACTIONS_DISPLAY_CHOICES, ac)
+                    self._ACTIONS_DISPLAY, ac)
 
                 if not dv:
                     dv = ac
@@ -869,19 +937,23 @@ class Host(base.APIResourceWrapper):
         (PERSONALITY_NETWORK, _("Network")),
         (PERSONALITY_STORAGE, _("Storage")),
     )
+    _PERSONALITY_DISPLAY = _display_lookup(PERSONALITY_DISPLAY_CHOICES)
     ADMIN_DISPLAY_CHOICES = (
         ('locked', _("Locked")),
         ('unlocked', _("Unlocked")),
     )
+    _ADMIN_DISPLAY = _display_lookup(ADMIN_DISPLAY_CHOICES)
     OPER_DISPLAY_CHOICES = (
         ('disabled', _("Disabled")),
         ('enabled', _("Enabled")),
     )
+    _OPER_DISPLAY = _display_lookup(OPER_DISPLAY_CHOICES)
 
     APPARMOR_DISPLAY_CHOICES = (
         (APPARMOR_STATE_ENABLED, _("enabled")),
         (APPARMOR_STATE_DISABLED, _("disabled")),
     )
+    _APPARMOR_DISPLAY = _display_lookup(APPARMOR_DISPLAY_CHOICES)
 
     AVAIL_DISPLAY_CHOICES = (
         ('available', _("Available")),
@@ -894,6 +966,7 @@ class Host(base.APIResourceWrapper):
         ('offduty', _("Offduty")),
         ('dependency', _("Dependency")),
     )
+    _AVAIL_DISPLAY = _display_lookup(AVAIL_DISPLAY_CHOICES)
     CONFIG_STATUS_DISPLAY_CHOICES = (
         ('up_to_date', _("up-to-date")),
         ('out_of_date', _("out-of-date")),
@@ -908,6 +981,7 @@ class Host(base.APIResourceWrapper):
         (patch_constants.PATCH_AGENT_STATE_INSTALL_REJECTED,
          _("Patch Install Rejected")),
     )
+    _PATCH_STATE_DISPLAY = _display_lookup(PATCH_STATE_DISPLAY_CHOICES)
 
     INSTALL_STATE_DISPLAY_CHOICES = (
         (constants.INSTALL_STATE_PRE_INSTALL, _("Pre-install")),
@@ -918,30 +992,33 @@ class Host(base.APIResourceWrapper):
         (constants.INSTALL_STATE_BOOTING, _("Booting")),
         (constants.INSTALL_STATE_COMPLETED, _("Completed")),
     )
+    _INSTALL_STATE_DISPLAY = _display_lookup(INSTALL_STATE_DISPLAY_CHOICES)
 
     def __init__(self, apiresource):
         super(Host, self).__init__(apiresource)
-        self._personality = self.personality
-        self._subfunctions = self.subfunctions
-        self._subfunction_oper = self.subfunction_oper
-        self._subfunction_avail = self.subfunction_avail
-        self._apparmor = self.apparmor
-        self._location = self.location
-        self._peers = self.peers
-        self._bm_type = self.bm_type
-        self._administrative = self.administrative
-        self._invprovision = self.invprovision
-        self._operational = self.operational
-        self._availability = self.availability
-        self._capabilities = self.capabilities
-        self._ttys_dcd = self.ttys_dcd
+        # The raw fields behind the display properties, read from the
+        # resource rather than through the properties' fallback to it
+        self._personality = apiresource.personality
+        self._subfunctions = apiresource.subfunctions
+        self._subfunction_oper = apiresource.subfunction_oper
+        self._subfunction_avail = apiresource.subfunction_avail
+        self._apparmor = apiresource.apparmor
+        self._location = apiresource.location
+        self._peers = apiresource.peers
+        self._bm_type = apiresource.bm_type
+        self._administrative = apiresource.administrative
+        self._invprovision = apiresource.invprovision
+        self._operational = apiresource.operational
+        self._availability = apiresource.availability
+        self._capabilities = apiresource.capabilities
+        self._ttys_dcd = apiresource.ttys_dcd
         self.patch_current = "N/A"
         self.requires_reboot = "N/A"
         self.allow_insvc_patching = True
         self._patch_state = patch_constants.PATCH_AGENT_STATE_IDLE
-        self._clock_synchronizations = self.clock_synchronization
+        self._clock_synchronizations = apiresource.clock_synchronization
 
-        self._install_state = self.install_state
+        self._install_state = apiresource.install_state
         if self._install_state is not None:
             self._install_state = self._install_state.strip("+")
 
@@ -955,7 +1032,7 @@ class Host(base.APIResourceWrapper):
                 return _('Controller-Active')
             else:
                 return _('Controller-Standby')
-        return self._get_display_value(self.PERSONALITY_DISPLAY_CHOICES,
+        return self._get_display_value(self._PERSONALITY_DISPLAY,
                                        self._personality)
 
     @property
@@ -977,17 +1054,17 @@ class Host(base.APIResourceWrapper):
 
     @property
     def subfunction_oper(self):
-        return self._get_display_value(self.OPER_DISPLAY_CHOICES,
+        return self._get_display_value(self._OPER_DISPLAY,
                                        self._subfunction_oper)
 
     @property
     def subfunction_avail(self):
-        return self._get_display_value(self.AVAIL_DISPLAY_CHOICES,
+        return self._get_display_value(self._AVAIL_DISPLAY,
                                        self._subfunction_avail)
 
     @property
     def apparmor(self):
-        return self._get_display_value(self.APPARMOR_DISPLAY_CHOICES,
+        return self._get_display_value(self._APPARMOR_DISPLAY,
                                        self._apparmor)
 
     @property
@@ -1019,17 +1096,17 @@ class Host(base.APIResourceWrapper):
 
     @property
     def administrative(self):
-        return self._get_display_value(self.ADMIN_DISPLAY_CHOICES,
+        return self._get_display_value(self._ADMIN_DISPLAY,
                                        self._administrative)
 
     @property
     def operational(self):
-        return self._get_display_value(self.OPER_DISPLAY_CHOICES,
+        return self._get_display_value(self._OPER_DISPLAY,
                                        self._operational)
 
     @property
     def availability(self):
-        return self._get_display_value(self.AVAIL_DISPLAY_CHOICES,
+        return self._get_display_value(self._AVAIL_DISPLAY,
                                        self._availability)
 
     @property
@@ -1043,34 +1120,33 @@ class Host(base.APIResourceWrapper):
 
     @property
     def clock_synchronization(self):
-        return self._get_display_value(CLOCK_SYNCHRONIZATION_CHOICES,
+        return self._get_display_value(_CLOCK_SYNCHRONIZATION_DISPLAY,
                                        self._clock_synchronization)
 
     @property
     def patch_state(self):
-        return self._get_display_value(self.PATCH_STATE_DISPLAY_CHOICES,
+        return self._get_display_value(self._PATCH_STATE_DISPLAY,
                                        self._patch_state)
 
     @property
     def install_state(self):
-        return self._get_display_value(self.INSTALL_STATE_DISPLAY_CHOICES,
+        return self._get_display_value(self._INSTALL_STATE_DISPLAY,
                                        self._install_state)
 
-    def _get_display_value(self, display_choices, data):
+    def _get_display_value(self, display, data):
         """Lookup the display value in the provided dictionary."""
-        display_value = [display for (value, display) in display_choices
-                         if value.lower() == (data or '').lower()]
-
-        if display_value:
-            return display_value[0]
-        return None
+        return display.get((data or '').lower())
 
 
+@singleflight.shared
+@breaker.guarded('platform', errors=_platform_unreachable)
 def system_list(request):
     systems = cgtsclient(request).isystem.list()
     return [System(n) for n in systems]
 
 
+@singleflight.shared
+@breaker.guarded('platform', errors=_platform_unreachable)
 def system_get(request):
     system = cgtsclient(request).isystem.list()[0]
     if not system:
@@ -1165,6 +1241,10 @@ def host_swact(request, host_id):
     return host
 
 
+# Fields of the Host wrapper, given a default by set_host_defaults
+_HOST_FIELDS = frozenset(Host._attrs)
+
+
 def host_get(request, host_id):
     host = cgtsclient(request).ihost.get(host_id)
     if not host:
@@ -1177,29 +1257,37 @@ def host_get(request, host_id):
     return Host(host)
 
 
+@singleflight.shared
+@breaker.guarded('platform', errors=_platform_unreachable)
 def host_list(request):
     hosts = cgtsclient(request).ihost.list()
 
     # if host received doesn't have this attribute,
-    # add it with a default value
+    # add it with a default value. The hosts of a response share their
+    # fields, so the missing ones are worked out once per set of fields.
+    missing_by_fields = {}
     for host_data in hosts:
-        set_host_defaults(host_data)
+        fields = tuple(host_data._info)
+        missing = missing_by_fields.get(fields)
+        if missing is None:
+            missing = _HOST_FIELDS.difference(fields)
+            missing_by_fields[fields] = missing
+        set_host_defaults(host_data, missing)
 
     return [Host(n) for n in hosts]
 
 
-def set_host_defaults(host):
-    default_value = None
-    attrs_list = Host._attrs
-
-    host_dict = host._info
-    for attr in attrs_list:
-        if attr not in host_dict:
-            LOG.debug("Attribute not found. Adding default value: %s: %s",
-                      attr, default_value)
-            host._add_details({attr: default_value})
+def set_host_defaults(host, missing=None):
+    """Add the Host fields host lacks, with a None value.
 
-    return
+    :param missing: the fields host lacks, when already known
+    """
+    if missing is None:
+        missing = _HOST_FIELDS.difference(host._info)
+    if missing:
+        LOG.debug("Attributes not found. Adding default value None: %s",
+                  ', '.join(sorted(missing)))
+        host._add_details(dict.fromkeys(missing))
 
 
 class DNS(base.APIResourceWrapper):
@@ -2001,7 +2089,7 @@ def host_stor_get_by_function(request, host_id, function=None):
     return [StorageVolume(n) for n in volumes]
 
 
-class Interface(base.APIResourceWrapper):
+class Interface(APIRecord):
     """Wrapper for Inventory Interfaces"""
 
     _attrs = ['id', 'uuid', 'ifname', 'ifclass', 'iftype', 'imtu', 'imac',
@@ -2010,6 +2098,12 @@ class Interface(base.APIResourceWrapper):
               'ipv4_mode', 'ipv6_mode', 'ipv4_pool', 'ipv6_pool',
               'sriov_numvfs', 'sriov_vf_driver', 'max_tx_rate',
               'max_rx_rate']
+    # Set by the views, from the ports, networks and address pools of the
+    # interface
+    __slots__ = _attrs + ['host_id', 'ports', 'portNameList',
+                          'portNeighbourList', 'platform_network_names',
+                          'data_network_names', 'dpdksupport',
+                          'ipv4_pool_name', 'ipv6_pool_name']
 
     def __init__(self, apiresource):
         super(Interface, self).__init__(apiresource)
@@ -2161,10 +2255,11 @@ def interface_datanetwork_remove(request, interface_datanetwork_uuid):
         interface_datanetwork_uuid)
 
 
-class Address(base.APIResourceWrapper):
+class Address(APIRecord):
     """Wrapper for Inventory Addresses"""
 
     _attrs = ['uuid', 'interface_uuid', 'address', 'prefix', 'enable_dad']
+    __slots__ = _attrs
 
     def __init__(self, apiresource):
         super(Address, self).__init__(apiresource)
@@ -2262,7 +2357,7 @@ def route_delete(request, route_uuid):
     return cgtsclient(request).route.delete(route_uuid)
 
 
-class Device(base.APIResourceWrapper):
+class Device(APIRecord):
     """Wrapper for Inventory Devices"""
 
     _attrs = ['uuid', 'name', 'pciaddr', 'host_uuid',
@@ -2270,6 +2365,7 @@ class Device(base.APIResourceWrapper):
               'pclass', 'pvendor', 'pdevice',
               'numa_node', 'enabled', 'extra_info',
               'sriov_totalvfs', 'sriov_numvfs', 'sriov_vfs_pci_address']
+    __slots__ = _attrs + ['host_id']
 
     def __init__(self, apiresource):
         super(Device, self).__init__(apiresource)
@@ -2301,7 +2397,7 @@ def host_device_update(request, device_uuid, **kwargs):
     return cgtsclient(request).pci_device.update(device_uuid, mypatch)
 
 
-class LldpNeighbour(base.APIResourceWrapper):
+class LldpNeighbour(APIRecord):
     """Wrapper for Inventory LLDP Neighbour"""
 
     _attrs = ['port_uuid',
@@ -2328,6 +2424,7 @@ class LldpNeighbour(base.APIResourceWrapper):
               'dot3_mac_status',
               'dot3_power_mdi',
               'dot3_max_frame']
+    __slots__ = _attrs
 
     def __init__(self, apiresource):
         super(LldpNeighbour, self).__init__(apiresource)
@@ -2419,17 +2516,11 @@ def get_sdn_enabled(request):
     # of the system table, however capabilties is not exposed
     # as an attribute through system_list() or system_get()
     # at this level. We will therefore check the platform.conf
-    # to see if SDN is configured.
+    # to see if SDN is configured; the file is only read again
+    # when it changes.
     try:
-        with open(PLATFORM_CONFIGURATION, 'r') as fd:
-            content = fd.readlines()
-        sdn_enabled = None
-        for line in content:
-            if 'sdn_enabled' in line:
-                sdn_enabled = line
-                break
-        sdn_enabled = sdn_enabled.strip('\n').split('=', 1)
-        return (sdn_enabled[1].lower() == 'yes')
+        return platform_config.config_file(
+            PLATFORM_CONFIGURATION).get_bool('sdn_enabled')
     except Exception:
         return False
 
@@ -2447,6 +2538,8 @@ def get_vswitch_type(request):
         return None
 
 
+# Asked once per host row by the host table actions
+@memoized
 def is_system_mode_simplex(request):
     systems = system_list(request)
     system_mode = systems[0].to_dict().get('system_mode')
@@ -0,0 +1,193 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import contextlib
+import functools
+import threading
+import time
+
+from django.conf import settings
+
+from starlingx_dashboard.api import budget
+from starlingx_dashboard.utils import metrics
+
+# Default for API_TRACING, whether backend calls are recorded
+DEFAULT_API_TRACING = True
+
+_local = threading.local()
+
+_PLAIN_TYPES = (str, bytes, int, float, bool, type(None), dict, list, tuple)
+
+
+class Span(object):
+    """A backend call"""
+
+    __slots__ = ('service', 'operation', 'region', 'duration', 'bytes',
+                 'outcome', 'site', 'tab')
+
+    def __init__(self, service, operation, region):
+        self.service = service
+        self.operation = operation
+        self.region = region
+        self.duration = 0.0
+        self.bytes = None
+        self.outcome = 'ok'
+        # Set when checking call budgets
+        self.site = None
+        self.tab = None
+
+
+class Trace(object):
+    """The backend calls made while handling a request"""
+
+    def __init__(self):
+        self.spans = []
+        self._lock = threading.Lock()
+
+    def add(self, span):
+        with self._lock:
+            self.spans.append(span)
+
+    @property
+    def total(self):
+        return sum(span.duration for span in self.spans)
+
+    @property
+    def slowest(self):
+        return max(self.spans, key=lambda span: span.duration, default=None)
+
+    def by_service(self):
+        """Return {service: (call count, total duration)}."""
+        services = {}
+        for span in self.spans:
+            count, duration = services.get(span.service, (0, 0.0))
+            services[span.service] = (count + 1, duration + span.duration)
+        return services
+
+
+def enabled():
+    return getattr(settings, 'API_TRACING', DEFAULT_API_TRACING)
+
+
+def start(request):
+    """Attach a new trace to a request and to the current thread."""
+    trace = Trace()
+    request._stx_trace = trace
+    _local.trace = trace
+    return trace
+
+
+def stop():
+    _local.trace = None
+
+
+def get(request=None):
+    """Return the trace of a request, or else of the current thread."""
+    trace = getattr(request, '_stx_trace', None)
+    if trace is None:
+        trace = getattr(_local, 'trace', None)
+    return trace
+
+
+def bind(function):
+    """Make function record its calls in the current trace when it runs
+    in another thread, e.g. in a thread pool."""
+    trace = get()
+    if trace is None:
+        return function
+    # The call site of calls made in the other thread is the caller's
+    origin = None
+    if budget.enabled():
+        origin = Span(None, None, None)
+        budget.locate(origin)
+
+    @functools.wraps(function)
+    def _bound(*args, **kwargs):
+        previous = getattr(_local, 'trace', None), \
+            getattr(_local, 'origin', None)
+        _local.trace, _local.origin = trace, origin
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _local.trace, _local.origin = previous
+    return _bound
+
+
+@contextlib.contextmanager
+def span(trace, service, operation, region=None):
+    """Record the backend call made in the with block in trace, and in
+    the backend metrics.
+
+    The span is yielded, and also available to add_bytes() for the
+    duration of the block.
+    """
+    current = Span(service, operation, region)
+    if trace is not None and budget.enabled():
+        budget.locate(current, getattr(_local, 'origin', None))
+    stack = _local.__dict__.setdefault('spans', [])
+    stack.append(current)
+    metrics.inc('backend_in_flight', service=service)
+    started = time.monotonic()
+    try:
+        yield current
+    except Exception as ex:
+        current.outcome = type(ex).__name__
+        metrics.inc('backend_errors_total', service=service,
+                    operation=operation, error=current.outcome)
+        raise
+    finally:
+        current.duration = time.monotonic() - started
+        stack.pop()
+        metrics.inc('backend_in_flight', -1, service=service)
+        metrics.observe('backend_duration_seconds', current.duration,
+                        service=service, operation=operation)
+        if trace is not None:
+            trace.add(current)
+
+
+def add_bytes(count):
+    """Count bytes received by the innermost backend call in progress."""
+    stack = getattr(_local, 'spans', None)
+    if stack:
+        stack[-1].bytes = (stack[-1].bytes or 0) + count
+
+
+class _TracedClient(object):
+    """Proxy of a client recording the calls of its methods and of the
+    methods of its managers (e.g. client.ihost.list)."""
+
+    def __init__(self, target, trace, service, region, path=()):
+        self._target = target
+        self._trace = trace
+        self._service = service
+        self._region = region
+        self._path = path
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        if name.startswith('_') or isinstance(value, _PLAIN_TYPES):
+            return value
+        path = self._path + (name,)
+        if not callable(value):
+            return _TracedClient(value, self._trace, self._service,
+                                 self._region, path)
+
+        @functools.wraps(value)
+        def _call(*args, **kwargs):
+            with span(self._trace, self._service, '.'.join(path),
+                      self._region):
+                return value(*args, **kwargs)
+        return _call
+
+
+def traced_client(client, request, service):
+    """Return client, recording its calls in the trace of request (or of
+    the current thread when request is None) and in the metrics."""
+    trace = get(request) if enabled() else None
+    if trace is None and not metrics.enabled():
+        return client
+    region = getattr(getattr(request, 'user', None), 'services_region', None)
+    return _TracedClient(client, trace, service, region)
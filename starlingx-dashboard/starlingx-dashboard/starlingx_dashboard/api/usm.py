@@ -3,26 +3,45 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
+from concurrent import futures
 import logging
 from urllib.parse import urlparse
+import uuid
+
+from django.conf import settings
 
 from horizon import messages
 from openstack_dashboard.api import base
 
+from starlingx_dashboard.api import breaker
+from starlingx_dashboard.api import snapshots
+from starlingx_dashboard.api import tracing
+from starlingx_dashboard.utils import lazy
+from starlingx_dashboard.utils import subrequest
+
 import requests
-from requests_toolbelt import MultipartEncoder
 
 LOG = logging.getLogger(__name__)
 
+# Imported by the first upload, rather than with this module
+requests_toolbelt = lazy.module('requests_toolbelt')
+
 USM_API_SERVICENAME = "usm"
 USM_API_VERSION = "v1"
 
+# Default number of seconds a deploy-state snapshot is reused
+DEFAULT_USM_SNAPSHOT_TTL = 5
+
+# The deploy state of a region is the same for all its users
+_snapshots = snapshots.SnapshotCache('usm_deploy', shared=True)
+
 
 class Client(object):
-    def __init__(self, version, url, token_id):
+    def __init__(self, version, url, token_id, region=None):
         self.version = version
         self.url = url
         self.token_id = token_id
+        self.region = region
 
     def _make_request(self, token_id, method, api_version, api_cmd,
                       encoder=None):
@@ -32,15 +51,25 @@ class Client(object):
         headers = {"X-Auth-Token": token_id,
                    "Accept": "application/json"}
 
+        timeout = breaker.timeout(USM_API_SERVICENAME)
+        # Actions, such as uploads and prechecks, may take long and only
+        # have a deadline to connect
+        action_timeout = (timeout, None)
         if method == 'GET':
-            req = requests.get(url, headers=headers)
+            req = breaker.call(USM_API_SERVICENAME, self.region, requests.get,
+                               url, headers=headers, timeout=timeout)
         elif method == 'POST':
             if encoder is not None:
                 headers['Content-Type'] = encoder.content_type
-            req = requests.post(url, headers=headers, data=encoder)
+            req = breaker.call(USM_API_SERVICENAME, self.region,
+                               requests.post, url, headers=headers,
+                               data=encoder, timeout=action_timeout)
         elif method == 'DELETE':
-            req = requests.delete(url, headers=headers)
+            req = breaker.call(USM_API_SERVICENAME, self.region,
+                               requests.delete, url, headers=headers,
+                               timeout=action_timeout)
 
+        tracing.add_bytes(len(req.content))
         resp = req.json()
 
         return resp
@@ -62,10 +91,14 @@ class Client(object):
                                   "deploy_host/%s" % hostname)
 
     def upload_release(self, release):
-        encoder = MultipartEncoder(fields=release)
+        encoder = requests_toolbelt.MultipartEncoder(fields=release)
         return self._make_request(self.token_id, "POST", self.version,
                                   "release", encoder=encoder)
 
+    def upload_release_stream(self, stream):
+        return self._make_request(self.token_id, "POST", self.version,
+                                  "release", encoder=stream)
+
     def delete_releases(self, release_ids):
         releases = "/".join(release_ids)
         return self._make_request(self.token_id, "DELETE", self.version,
@@ -113,10 +146,48 @@ class Client(object):
                                   "deploy/activate_rollback")
 
 
+class MultipartStream(object):
+    """multipart/form-data body produced from a stream of file parts.
+
+    The body is sent with chunked transfer encoding as the parts are
+    produced, so files do not need to be fully available (or staged on
+    disk) before the upload starts.  parts is an iterable of
+    (field_name, file_name, chunks) tuples.
+    """
+
+    def __init__(self, parts):
+        self.parts = parts
+        self.boundary = uuid.uuid4().hex
+        self.content_type = \
+            "multipart/form-data; boundary=%s" % self.boundary
+
+    @staticmethod
+    def _quote(value):
+        # Escaped as browsers do (HTML form submission), so that a name
+        # cannot end the quoted string or the header
+        return value.replace('"', '%22').replace('\r', '%0D') \
+            .replace('\n', '%0A')
+
+    def __iter__(self):
+        for field_name, file_name, chunks in self.parts:
+            yield (f'--{self.boundary}\r\n'
+                   'Content-Disposition: form-data; '
+                   f'name="{self._quote(field_name)}"; '
+                   f'filename="{self._quote(file_name)}"\r\n'
+                   'Content-Type: application/octet-stream\r\n\r\n'
+                   ).encode('utf-8')
+            for chunk in chunks:
+                yield chunk
+            yield b'\r\n'
+        yield f'--{self.boundary}--\r\n'.encode('utf-8')
+
+
 def _usm_client(request):
     o = urlparse(base.url_for(request, USM_API_SERVICENAME, 'internalURL'))
     url = "://".join((o.scheme, o.netloc))
-    return Client(USM_API_VERSION, url, token_id=request.user.token.id)
+    client = Client(USM_API_VERSION, url, token_id=request.user.token.id,
+                    region=getattr(request.user, 'services_region', None))
+    return tracing.traced_client(client, request, USM_API_SERVICENAME)
 
 
 class Release(object):
@@ -220,9 +291,90 @@ def get_deploy_hosts(request):
 
 
 def get_deploy_host(request, hostname):
-    phosts = get_deploy_hosts(request)
-    return next((phost for phost in phosts if phost.hostname == hostname),
-                None)
+    return get_deploy_snapshot(request).get_deploy_host(hostname)
+
+
+class DeploySnapshot(object):
+    """Releases, deploy state and deploy hosts fetched together.
+
+    Releases are indexed by release id and deploy hosts by hostname.
+    deploy_show_error holds the exception raised while retrieving the
+    deploy state, if any.  Releases being deployed or removed are given
+    the deploy state as their deploy_host_state.
+
+    Snapshots are shared between requests, and must not be modified.
+    """
+
+    def __init__(self, releases, deploy_show, deploy_hosts,
+                 deploy_show_error=None):
+        self.releases = releases
+        self.deploy_show = deploy_show or []
+        self.deploy_hosts = deploy_hosts
+        self.deploy_show_error = deploy_show_error
+        self._releases_by_id = {r.release_id: r for r in releases}
+        self._deploy_hosts_by_name = {h.hostname: h for h in deploy_hosts}
+        for release in releases:
+            if release.state in ['deploying', 'removing']:
+                release.deploy_host_state = self.deploy_state
+
+    @property
+    def deploy_state(self):
+        if self.deploy_show:
+            return self.deploy_show[0]['state']
+        return None
+
+    def get_release(self, release_id):
+        return self._releases_by_id.get(release_id)
+
+    def get_deploy_host(self, hostname):
+        return self._deploy_hosts_by_name.get(hostname)
+
+
+def _fetch_deploy_snapshot(request):
+    # Each worker acts on behalf of its own copy of the request
+    with futures.ThreadPoolExecutor(max_workers=3) as executor:
+        releases = executor.submit(
+            get_releases, subrequest.copy_request(request))
+        deploy_show = executor.submit(
+            deploy_show_req, subrequest.copy_request(request))
+        deploy_hosts = executor.submit(
+            get_deploy_hosts, subrequest.copy_request(request))
+
+    deploy_show_data = None
+    deploy_show_error = None
+    try:
+        deploy_show_data = deploy_show.result()
+    except Exception as ex:
+        LOG.exception("Unable to retrieve deploy state")
+        deploy_show_error = ex
+    return DeploySnapshot(releases.result(), deploy_show_data,
+                          deploy_hosts.result(), deploy_show_error)
+
+
+def _deploy_snapshot_ttl(snapshot):
+    # A snapshot missing the deploy state is not reused
+    if snapshot.deploy_show_error is not None:
+        return 0
+    return getattr(settings, 'USM_SNAPSHOT_TTL', DEFAULT_USM_SNAPSHOT_TTL)
+
+
+def get_deploy_snapshot(request):
+    """Return the deploy state of the request's region.
+
+    The snapshot is fetched with one parallel round of get_releases,
+    deploy_show and get_deploy_hosts, and is shared by everything
+    rendered for the request.  It is also reused by later requests of
+    all users of the region for USM_SNAPSHOT_TTL seconds, until a change
+    made through the dashboard invalidates it.
+    """
+    return _snapshots.get(
+        request, lambda: _fetch_deploy_snapshot(request),
+        _deploy_snapshot_ttl)
+
+
+def invalidate_deploy_snapshot(request):
+    """Stop reusing the cached deploy state of the request's region."""
+    _snapshots.invalidate(request)
 
 
 def get_message(request, data):
@@ -242,6 +394,7 @@ def get_message(request, data):
 
 def deploy_host(request, hostname):
     resp = _usm_client(request).deploy_host(hostname)
+    invalidate_deploy_snapshot(request)
     return get_message(request, resp)
 
 
@@ -254,21 +407,31 @@ def release_upload_req(request, release, name,
     if release_extra is not None and name_extra is not None:
         _file['file_1'] = (name_extra, release_extra)
     resp = _usm_client(request).upload_release(_file)
+    invalidate_deploy_snapshot(request)
+    return get_message(request, resp)
+
+
+def release_upload_stream_req(request, parts):
+    resp = _usm_client(request).upload_release_stream(MultipartStream(parts))
+    invalidate_deploy_snapshot(request)
     return get_message(request, resp)
 
 
 def release_delete_req(request, release_id):
     resp = _usm_client(request).delete_releases(release_id)
+    invalidate_deploy_snapshot(request)
     return get_message(request, resp)
 
 
 def release_commit_req(request, release_id):
     resp = _usm_client(request).commit_releases(release_id)
+    invalidate_deploy_snapshot(request)
     return get_message(request, resp)
 
 
 def deploy_start_req(request, release_id):
     resp = _usm_client(request).deploy_start(release_id)
+    invalidate_deploy_snapshot(request)
     return get_message(request, resp)
 
 
@@ -279,11 +442,13 @@ def deploy_precheck_req(request, release_id):
 
 def deploy_complete_req(request):
     resp = _usm_client(request).deploy_complete()
+    invalidate_deploy_snapshot(request)
     return get_message(request, resp)
 
 
 def deploy_activate_req(request):
     resp = _usm_client(request).deploy_activate()
+    invalidate_deploy_snapshot(request)
     return get_message(request, resp)
 
 
@@ -294,19 +459,23 @@ def deploy_show_req(request):
 
 def deploy_abort_req(request):
     resp = _usm_client(request).deploy_abort()
+    invalidate_deploy_snapshot(request)
     return get_message(request, resp)
 
 
 def deploy_delete_req(request):
     resp = _usm_client(request).deploy_delete()
+    invalidate_deploy_snapshot(request)
     return get_message(request, resp)
 
 
 def deploy_host_rollback_req(request, hostname):
     resp = _usm_client(request).deploy_host_rollback(hostname)
+    invalidate_deploy_snapshot(request)
     return get_message(request, resp)
 
 
 def deploy_activate_rollback_req(request):
     resp = _usm_client(request).deploy_activate_rollback()
+    invalidate_deploy_snapshot(request)
     return get_message(request, resp)
@@ -12,17 +12,26 @@
 #
 # Copyright (c) 2016-2024 Wind River Systems, Inc.
 #
+import copy
 import logging
 
 from six.moves.urllib.parse import urlparse
 
-from nfv_client.openstack import sw_update
 from openstack_dashboard.api import base
+from starlingx_dashboard.api import singleflight
+from starlingx_dashboard.api import snapshots
+from starlingx_dashboard.api import tracing
+from starlingx_dashboard.utils import lazy
 
 LOG = logging.getLogger(__name__)
 
+# Imported by the first strategy request, rather than with this module
+sw_update = lazy.module('nfv_client.openstack.sw_update')
+
 STRATEGY_SW_DEPLOY = 'sw-upgrade'
 
+_snapshots = snapshots.SnapshotCache('vim_strategy')
+
 
 class Client(object):
     def __init__(self, url, token_id, username=None, user_domain_name=None,
@@ -74,17 +83,75 @@ class Client(object):
 def _sw_update_client(request):
     o = urlparse(base.url_for(request, 'nfv'))
     url = "://".join((o.scheme, o.netloc))
-    return Client(url, token_id=request.user.token.id,
-                  username=request.user.username,
-                  user_domain_name=request.user.user_domain_name,
-                  tenant=request.user.tenant_name)
+    client = Client(url, token_id=request.user.token.id,
+                    username=request.user.username,
+                    user_domain_name=request.user.user_domain_name,
+                    tenant=request.user.tenant_name)
+    return tracing.traced_client(client, request, 'nfv')
 
 
+@singleflight.shared
 def get_strategy(request, strategy_name):
     strategy = _sw_update_client(request).get_strategy(strategy_name)
     return strategy
 
 
+class StrategySnapshot(object):
+    """A strategy with its stages and steps indexed.
+
+    Stages are indexed by (phase name, stage id) and steps by
+    (phase name, stage id, step id); ids are compared as strings.
+    """
+
+    def __init__(self, strategy):
+        self.strategy = strategy
+        self.stages = []
+        self._stages = {}
+        self._steps = {}
+        if not strategy:
+            return
+
+        for phase in (strategy.build_phase, strategy.apply_phase,
+                      strategy.abort_phase):
+            # The stages refer to their phase without its stage list
+            stage_phase = copy.copy(phase)
+            stage_phase.stages = None
+            for stage in phase.stages:
+                # The strategy may be shared by concurrent requests
+                stage = copy.copy(stage)
+                stage.phase = stage_phase
+                self.stages.append(stage)
+                key = (stage_phase.phase_name, str(stage.stage_id))
+                self._stages[key] = stage
+                for step in stage.steps:
+                    self._steps[key + (str(step.step_id),)] = step
+
+    def get_stage(self, phase_name, stage_id):
+        return self._stages.get((phase_name, str(stage_id)))
+
+    def get_step(self, phase_name, stage_id, step_id):
+        return self._steps.get((phase_name, str(stage_id), str(step_id)))
+
+
+def get_strategy_snapshot(request, strategy_name):
+    """Return the indexed strategy of the request's region.
+
+    The strategy is downloaded at most once per request.  Concurrent
+    requests of the same user (e.g. the ajax refresh of each stage and
+    step row) share one download, but a strategy is never reused once
+    downloaded: VIM has no cheaper way to tell whether its state changed.
+    """
+    return _snapshots.get(
+        request,
+        lambda: StrategySnapshot(get_strategy(request, strategy_name)),
+        lambda snapshot: 0, key=(strategy_name,))
+
+
+def invalidate_strategy_snapshot(request, strategy_name):
+    """Stop reusing the cached strategies of the request's region."""
+    _snapshots.invalidate(request)
+
+
 def create_strategy(
         request, strategy_name, controller_apply_type, storage_apply_type,
         swift_apply_type, worker_apply_type, max_parallel_worker_hosts,
@@ -93,60 +160,39 @@ def create_strategy(
         strategy_name, controller_apply_type, storage_apply_type,
         swift_apply_type, worker_apply_type, max_parallel_worker_hosts,
         default_instance_action, alarm_restrictions, **kwargs)
+    invalidate_strategy_snapshot(request, strategy_name)
     return strategy
 
 
 def delete_strategy(request, strategy_name, force=False):
     response = _sw_update_client(request).delete_strategy(strategy_name, force)
+    invalidate_strategy_snapshot(request, strategy_name)
     return response
 
 
 def apply_strategy(request, strategy_name, stage_id=None):
     response = _sw_update_client(request).apply_strategy(strategy_name,
                                                          stage_id)
+    invalidate_strategy_snapshot(request, strategy_name)
     return response
 
 
 def abort_strategy(request, strategy_name, stage_id=None):
     response = _sw_update_client(request).abort_strategy(strategy_name,
                                                          stage_id)
+    invalidate_strategy_snapshot(request, strategy_name)
     return response
 
 
 def get_stages(request, strategy_name):
-    strategy = _sw_update_client(request).get_strategy(strategy_name)
-    if not strategy:
-        return []
-    stages = []
-    for stage in strategy.build_phase.stages:
-        phase = strategy.build_phase
-        phase.stages = None
-        stage.phase = phase
-        stages.append(stage)
-    for stage in strategy.apply_phase.stages:
-        phase = strategy.apply_phase
-        phase.stages = None
-        stage.phase = phase
-        stages.append(stage)
-    for stage in strategy.abort_phase.stages:
-        phase = strategy.abort_phase
-        phase.stages = None
-        stage.phase = phase
-        stages.append(stage)
-
-    return stages
+    return get_strategy_snapshot(request, strategy_name).stages
 
 
 def get_stage(request, strategy_name, phase_name, stage_id):
-    stages = get_stages(request, strategy_name)
-    for stage in stages:
-        if stage.phase.phase_name == phase_name and \
-                str(stage.stage_id) == str(stage_id):
-            return stage
+    return get_strategy_snapshot(request, strategy_name).get_stage(
+        phase_name, stage_id)
 
 
 def get_step(request, strategy_name, phase_name, stage_id, step_id):
-    stage = get_stage(request, strategy_name, phase_name, stage_id)
-    for step in stage.steps:
-        if str(step.step_id) == str(step_id):
-            return step
+    return get_strategy_snapshot(request, strategy_name).get_step(
+        phase_name, stage_id, step_id)
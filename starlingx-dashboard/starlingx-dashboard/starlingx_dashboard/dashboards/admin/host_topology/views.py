@@ -5,12 +5,9 @@
 #
 
 
-import json
 import logging
 
 from django.conf import settings
-from django.core.serializers.json import DjangoJSONEncoder
-from django.http import HttpResponse  # noqa
 from django.urls import reverse
 from django.urls import reverse_lazy
 from django.utils.translation import ugettext_lazy as _
@@ -28,6 +25,7 @@ from starlingx_dashboard.dashboards.admin.host_topology import\
     tabs as topology_tabs
 from starlingx_dashboard.dashboards.admin.inventory import\
     views as i_views
+from starlingx_dashboard.utils import fastjson
 
 LOG = logging.getLogger(__name__)
 
@@ -218,6 +216,4 @@ class JSONView(View):
         data = {'hosts': self._get_hosts(request),
                 'networks': self._get_dnets(request),
                 'alarms': self._get_alarms(request), }
-        json_string = json.dumps(data, ensure_ascii=False,
-                                 cls=DjangoJSONEncoder)
-        return HttpResponse(json_string, content_type='text/json')
+        return fastjson.response(request, data, content_type='text/json')
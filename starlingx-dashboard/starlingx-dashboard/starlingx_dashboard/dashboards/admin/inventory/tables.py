@@ -21,6 +21,9 @@ from horizon.utils import filters
 from horizon.utils import functions
 
 from starlingx_dashboard import api as stx_api
+from starlingx_dashboard.utils import bulk
+from starlingx_dashboard.utils import jobs
+from starlingx_dashboard.utils import subrequest
 
 LOG = logging.getLogger(__name__)
 
@@ -55,11 +58,94 @@ def host_offline(host=None):
     return host._availability == 'offline'
 
 
-def handle_sysinv(self, table, request, obj_ids):
+def bulk_order(datum):
+    # Controllers are acted upon only once all other hosts are done
+    if getattr(datum, '_personality', None) == \
+            stx_api.sysinv.PERSONALITY_CONTROLLER:
+        return 1
+    return 0
+
+
+def _run_sysinv_action(self, request, allowed):
     action_success = []
     action_failure = []
-    action_not_allowed = []
+    action_running = []
+    success_ids = []
     emessage = ""
+
+    def _act(entry):
+        (datum_id, datum, _display), sub = entry
+        self.action(sub, datum_id)
+        # Call update to invoke changes if needed
+        self.update(sub, datum)
+
+    # Each item is acted upon with its own copy of the request, and the
+    # messages added by the action are forwarded once all are done.
+    entries = [(entry, subrequest.copy_request(request)) for entry in allowed]
+    results = bulk.run_bulk(_act, entries,
+                            order_key=lambda entry: bulk_order(entry[0][1]))
+    for result in results:
+        (datum_id, datum, datum_display), sub = result.item
+        if not isinstance(result.error, bulk.BulkTimeout):
+            subrequest.forward_messages(sub, request)
+        if result.error is None:
+            action_success.append(datum_display)
+            success_ids.append(datum_id)
+            LOG.info('%s: "%s"',
+                     self._get_action_name(past=True), datum_display)
+        elif isinstance(result.error, bulk.BulkTimeout):
+            action_running.append(datum_display)
+        elif not getattr(result.error, "_safe_message", None):
+            # Handle the exception but silence it since we'll display
+            # an aggregate error message later. Otherwise we'd get
+            # multiple error messages displayed to the user.
+            action_failure.append(datum_display)
+            emessage = result.error
+
+    return action_success, action_failure, action_running, emessage, \
+        success_ids
+
+
+def _sysinv_action_messages(self, action_success, action_failure,
+                            action_running, emessage):
+    error_msgs = []
+    info_msgs = []
+    success_msgs = []
+    if action_failure:
+        msg = _('Unable to %(action)s: %(objs)s. Reason/Action: %(emessage)s')
+        params = {"action": self._get_action_name(action_failure).lower(),
+                  "objs": functions.lazy_join(", ", action_failure),
+                  "emessage": emessage}
+        error_msgs.append(msg % params)
+    if action_running:
+        msg = _('%(action)s still in progress: %(objs)s')
+        params = {"action": self._get_action_name(action_running),
+                  "objs": functions.lazy_join(", ", action_running)}
+        info_msgs.append(msg % params)
+    if action_success:
+        msg = _('%(action)s: %(objs)s')
+        params = {"action": self._get_action_name(action_success, True),
+                  "objs": functions.lazy_join(", ", action_success)}
+        success_msgs.append(msg % params)
+    return error_msgs, info_msgs, success_msgs
+
+
+def _sysinv_action_job(job, self, allowed):
+    action_success, action_failure, action_running, emessage, _ids = \
+        _run_sysinv_action(self, job.request, allowed)
+    error_msgs, info_msgs, success_msgs = _sysinv_action_messages(
+        self, action_success, action_failure, action_running, emessage)
+    for msg in error_msgs:
+        job.error(msg)
+    for msg in info_msgs:
+        job.info(msg)
+    for msg in success_msgs:
+        job.success(msg)
+
+
+def handle_sysinv(self, table, request, obj_ids):
+    action_not_allowed = []
+    allowed = []
     for datum_id in obj_ids:
         datum = table.get_object_by_id(datum_id)
         datum_display = table.get_object_display(datum) or _("N/A")
@@ -68,21 +154,7 @@ def handle_sysinv(self, table, request, obj_ids):
             LOG.info('Permission denied to %s: "%s"',
                      self._get_action_name(past=True).lower(), datum_display)
             continue
-        try:
-            self.action(request, datum_id)
-            # Call update to invoke changes if needed
-            self.update(request, datum)
-            action_success.append(datum_display)
-            self.success_ids.append(datum_id)
-            LOG.info('%s: "%s"',
-                     self._get_action_name(past=True), datum_display)
-        except Exception as ex:
-            # Handle the exception but silence it since we'll display
-            # an aggregate error message later. Otherwise we'd get
-            # multiple error messages displayed to the user.
-            if not getattr(ex, "_safe_message", None):
-                action_failure.append(datum_display)
-                emessage = ex
+        allowed.append((datum_id, datum, datum_display))
 
     # Begin with success message class, downgrade to info if problems.
     success_message_level = messages.success
@@ -92,18 +164,33 @@ def handle_sysinv(self, table, request, obj_ids):
                   "objs": functions.lazy_join(", ", action_not_allowed)}
         messages.error(request, msg % params)
         success_message_level = messages.info
-    if action_failure:
-        msg = _('Unable to %(action)s: %(objs)s. Reason/Action: %(emessage)s')
-        params = {"action": self._get_action_name(action_failure).lower(),
-                  "objs": functions.lazy_join(", ", action_failure),
-                  "emessage": emessage}
-        messages.error(request, msg % params)
+
+    if len(allowed) > bulk.get_job_threshold():
+        # Large selections are acted upon in the background; the outcome
+        # is reported once the job has finished.
+        name = self._get_action_name(allowed, True)
+        jobs.submit(request, name, _sysinv_action_job, self, allowed)
+        # The rows of the hosts acted upon are updated as for a bulk
+        # action run within the request
+        self.success_ids.extend(datum_id for datum_id, _datum, _display
+                                in allowed)
+        msg = _('%(action)s: %(count)d started in the background.')
+        messages.info(request, msg % {"action": name, "count": len(allowed)})
+        return shortcuts.redirect(self.get_success_url(request))
+
+    action_success, action_failure, action_running, emessage, \
+        success_ids = _run_sysinv_action(self, request, allowed)
+    self.success_ids.extend(success_ids)
+    error_msgs, info_msgs, success_msgs = _sysinv_action_messages(
+        self, action_success, action_failure, action_running, emessage)
+    for msg in error_msgs:
+        messages.error(request, msg)
         success_message_level = messages.info
-    if action_success:
-        msg = _('%(action)s: %(objs)s')
-        params = {"action": self._get_action_name(action_success, True),
-                  "objs": functions.lazy_join(", ", action_success)}
-        success_message_level(request, msg % params)
+    for msg in info_msgs:
+        messages.info(request, msg)
+        success_message_level = messages.info
+    for msg in success_msgs:
+        success_message_level(request, msg)
 
     return shortcuts.redirect(self.get_success_url(request))
 
@@ -536,28 +623,49 @@ class DeploySoftwareAsync(tables.BatchAction):
     def allowed(self, request, host=None):
         if host is None:
             return True
-        release_on = stx_api.usm.deploy_show_req(request)
-        deploy_host = stx_api.usm.get_deploy_host(request, host.hostname)
+        snapshot = stx_api.usm.get_deploy_snapshot(request)
+        deploy_host = snapshot.get_deploy_host(host.hostname)
 
         return (host.patch_current is not True and
                 (host_locked(host) or host.allow_insvc_patching) and
-                (release_on and deploy_host.host_state == "pending"))
+                (snapshot.deploy_show and deploy_host is not None and
+                 deploy_host.host_state == "pending"))
 
     def handle(self, table, request, obj_ids):
 
+        def _deploy(entry):
+            ihost, sub = entry
+            LOG.info("Installing patch for host %s ...", ihost.hostname)
+            return stx_api.usm.deploy_host(sub, ihost.hostname)
+
+        # Hosts are looked up here, so that errors are handled in the
+        # thread of the request; each deployment gets its own copy of it.
+        entries = []
         for host_id in obj_ids:
-            try:
-                ihost = stx_api.sysinv.host_get(request, host_id)
-            except Exception:
-                exceptions.handle(request,
-                                  _('Unable to retrieve host.'))
-
-            try:
-                LOG.info("Installing patch for host %s ...", ihost.hostname)
-                result = stx_api.usm.deploy_host(request, ihost.hostname)
-                messages.success(request, result)
-            except Exception as ex:
-                messages.error(request, ex)
+            ihost = table.get_object_by_id(host_id)
+            if ihost is None:
+                try:
+                    ihost = stx_api.sysinv.host_get(request, host_id)
+                except Exception:
+                    exceptions.handle(request,
+                                      _('Unable to retrieve host.'))
+                    continue
+            entries.append((ihost, subrequest.copy_request(request)))
+
+        results = bulk.run_bulk(_deploy, entries,
+                                order_key=lambda entry: bulk_order(entry[0]))
+        for result in results:
+            ihost, sub = result.item
+            if isinstance(result.error, bulk.BulkTimeout):
+                messages.info(request,
+                              _('Deployment to %s still in progress') %
+                              ihost.hostname)
+                continue
+            subrequest.forward_messages(sub, request)
+            if result.error is not None:
+                messages.error(request, result.error)
+            elif result.value is not None:
+                messages.success(request, result.value)
 
         LOG.info("End of deploy-software-async")
         url = reverse('horizon:admin:inventory:index')
@@ -575,19 +683,18 @@ class DeployRollbackSoftware(tables.Action):
             "rollback-pending",
             "rollback-failed",
         }
-        release_on = stx_api.usm.deploy_show_req(request)
-        deploy_host = stx_api.usm.get_deploy_host(request, host.hostname)
-
         if host is None:
             return True
 
-        if deploy_host is None or release_on is None or len(release_on) == 0:
+        snapshot = stx_api.usm.get_deploy_snapshot(request)
+        deploy_host = snapshot.get_deploy_host(host.hostname)
+        if deploy_host is None or snapshot.deploy_state is None:
             return False
 
         is_valid_host_state = deploy_host.host_state in valid_states
         is_valid_release_state = (
-            release_on[0]['state'] == 'activate-rollback-done' or
-            release_on[0]['state'] == 'host-rollback'
+            snapshot.deploy_state == 'activate-rollback-done' or
+            snapshot.deploy_state == 'host-rollback'
         )
 
         return is_valid_host_state and is_valid_release_state
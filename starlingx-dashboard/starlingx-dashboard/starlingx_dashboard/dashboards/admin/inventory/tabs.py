@@ -53,6 +53,9 @@ class HostsTab(tabs.TableTab):
     name = _("Hosts")
     slug = "hosts"
     template_name = ("admin/inventory/_hosts.html")
+    # The host list and the patching host list, whatever the number of
+    # hosts (see API_CALL_CHECK)
+    api_call_budget = 2
 
     # for optimization, the complete hosts list, and phosts list from
     # patching service, are in class scope.
@@ -69,6 +72,8 @@ class HostsTab(tabs.TableTab):
         # TypeError and CommunicationError exception are being caught.
         # The user is redirected to System
         # controller and have visibility of the subcloud status.
+        # Once the subcloud is known to be offline, host_list fails fast
+        # with a CircuitOpen, which is a CommunicationError.
         except (TypeError, exc.CommunicationError):
             if(getattr(settings, 'DC_MODE', False)):
                 failure_url = "/auth/switch_services_region/" \
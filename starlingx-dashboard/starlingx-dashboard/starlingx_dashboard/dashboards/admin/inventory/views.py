@@ -23,6 +23,7 @@ from starlingx_dashboard.dashboards.admin.inventory.tabs import HostDetailTabs
 from starlingx_dashboard.dashboards.admin.inventory.tabs import InventoryTabs
 from starlingx_dashboard.dashboards.admin.inventory.workflows import AddHost
 from starlingx_dashboard.dashboards.admin.inventory.workflows import UpdateHost
+from starlingx_dashboard.utils import jobs
 
 
 LOG = logging.getLogger(__name__)
@@ -32,8 +33,13 @@ class IndexView(tabs.TabbedTableView):
     tab_group_class = InventoryTabs
     template_name = 'admin/inventory/index.html'
     page_title = _("Host Inventory")
+    # Backend calls of the page, whatever the number of hosts (see
+    # API_CALL_CHECK)
+    api_call_budget = 10
 
     def get_tabs(self, request, *args, **kwargs):
+        # Report background jobs finished since the last visit
+        jobs.add_messages(request)
         return self.tab_group_class(request, **kwargs)
 
 
@@ -4,8 +4,10 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import io
 import logging
 
+from django.conf import settings
 from django.forms import FileField
 from django.forms import FileInput
 from django.urls import reverse  # noqa
@@ -15,9 +17,17 @@ from horizon import exceptions
 from horizon import forms
 from horizon import messages
 from starlingx_dashboard import api as stx_api
+from starlingx_dashboard.dashboards.admin.software_management import \
+    upload_handlers
+from starlingx_dashboard.utils import bulk
+from starlingx_dashboard.utils import jobs
+from starlingx_dashboard.utils import subrequest
 
 LOG = logging.getLogger(__name__)
 
+# Default number of staged release uploads sent to USM concurrently
+DEFAULT_RELEASE_UPLOAD_MAX_PARALLEL = 4
+
 
 class MultipleFileInput(FileInput):
     allow_multiple_selected = True
@@ -37,6 +47,114 @@ class MultipleFileField(FileField):
         return result
 
 
+def _consolidate(responses):
+    # Consolidate server responses into one success/error message
+    if len(responses) == 1:
+        return responses[0]
+    msg = ""
+    for i in range(len(responses)):
+        msg += str(i + 1) + ") " + responses[i]
+    return msg
+
+
+def _detach_upload(uploaded_file):
+    """Keep an uploaded file readable once the request has completed.
+
+    Django removes the temporary copy of an upload when the request ends;
+    an open file object keeps the data available to a background job.
+    """
+    if hasattr(uploaded_file, 'temporary_file_path'):
+        return open(uploaded_file.temporary_file_path(), 'rb')
+    uploaded_file.seek(0)
+    return io.BytesIO(uploaded_file.read())
+
+
+def _release_part(field_name, uploaded_file):
+    return (field_name, uploaded_file.name, _detach_upload(uploaded_file),
+            getattr(uploaded_file, 'sha256', None))
+
+
+def _pair_releases(files):
+    """Group release files into uploads, an .iso with its .sig.
+
+    :returns: a (uploads, failures) tuple: the list of (field_name, file)
+              lists of each upload, and messages about unpaired files.
+    """
+    uploads = []
+    failures = []
+    iso_sig_pairs = {}
+    for f in files:
+        if f.name.endswith('.iso'):
+            iso_sig_pairs.setdefault(f.name[:-4], {})['iso'] = f
+        elif f.name.endswith('.sig'):
+            iso_sig_pairs.setdefault(f.name[:-4], {})['sig'] = f
+        else:
+            uploads.append([('file', f)])
+
+    # iso and sig file should be uploaded together
+    for base_name, pair in iso_sig_pairs.items():
+        if 'iso' in pair and 'sig' in pair:
+            uploads.append([('file', pair['iso']), ('file_1', pair['sig'])])
+        else:
+            missing_file = 'iso' if 'iso' not in pair else 'sig'
+            failures.append(f"Missing {missing_file} file for {base_name}")
+    return uploads, failures
+
+
+def _report_uploads(job, success_responses, failure_responses):
+    if success_responses:
+        job.success(_consolidate(success_responses))
+    if failure_responses:
+        job.error(_consolidate(failure_responses))
+
+
+def _upload_release(request, upload):
+    # The staged files are streamed to USM, and checked against the
+    # checksums they were received with as they are sent
+    parts = [(field_name, name,
+              upload_handlers.verified_chunks(release, name, checksum))
+             for field_name, name, release, checksum in upload]
+    try:
+        return stx_api.usm.release_upload_stream_req(request, parts)
+    finally:
+        for _field_name, _name, release, _checksum in upload:
+            release.close()
+
+
+def _upload_releases(job, uploads):
+    job.update(message=_("Uploading %d release(s)") % len(uploads))
+    # Independent uploads are sent concurrently, each on behalf of its own
+    # copy of the job's request
+    results = bulk.run_bulk(
+        lambda item: _upload_release(*item),
+        [(subrequest.copy_request(job.request), upload)
+         for upload in uploads],
+        max_parallel=getattr(settings, 'RELEASE_UPLOAD_MAX_PARALLEL',
+                             DEFAULT_RELEASE_UPLOAD_MAX_PARALLEL),
+        timeout=0)
+    _report_uploads(job,
+                    [r.value for r in results if r.error is None],
+                    [str(r.error) for r in results if r.error is not None])
+
+
+def _wait_release_streams(job, streams):
+    success_responses = []
+    failure_responses = []
+    # The uploads run concurrently; their outcome is collected in order
+    for count, stream in enumerate(streams):
+        job.update(progress=100 * count / len(streams),
+                   message=_("Uploading %s") % stream.name)
+        stream.wait()
+        if stream.aborted:
+            # Missing .sig files are reported by the form itself
+            continue
+        if stream.error is not None:
+            failure_responses.append(str(stream.error))
+        else:
+            success_responses.append(stream.result)
+    _report_uploads(job, success_responses, failure_responses)
+
+
 class UploadReleaseForm(forms.SelfHandlingForm):
     failure_url = 'horizon:admin:software_management:index'
     release_files = MultipleFileField(
@@ -53,66 +171,42 @@ class UploadReleaseForm(forms.SelfHandlingForm):
         return data
 
     def handle(self, request, data):
-        success_responses = []
-        failure_responses = []
-        iso_sig_pairs = {}
-
-        files = request.FILES.getlist('release_files')
-
-        for f in files:
-            if f.name.endswith('.iso'):
-                iso_sig_pairs.setdefault(f.name[:-4], {})['iso'] = f
-            elif f.name.endswith('.sig'):
-                iso_sig_pairs.setdefault(f.name[:-4], {})['sig'] = f
-            else:
-                try:
-                    success_responses.append(
-                        stx_api.usm.release_upload_req(request, f, f.name))
-                except Exception as ex:
-                    failure_responses.append(str(ex))
-
-        # iso and sig file should be uploaded together
-        if iso_sig_pairs:
-            for base_name, pair in iso_sig_pairs.items():
-                if 'iso' in pair and 'sig' in pair:
-                    try:
-                        success_responses.append(
-                            stx_api.usm.release_upload_req(
-                                request,
-                                release=pair['iso'], name=f'{base_name}.iso',
-                                release_extra=pair['sig'],
-                                name_extra=f'{base_name}.sig')
-                        )
-                    except Exception as ex:
-                        failure_responses.append(str(ex))
-                else:
-                    missing_file = 'iso' if 'iso' not in pair else 'sig'
-                    failure_responses.append(
-                        f"Missing {missing_file} file for {base_name}")
-
-        # Consolidate server responses into one success/error message
-        # respectively
-        if success_responses:
-            if len(success_responses) == 1:
-                messages.success(request, success_responses[0])
-            else:
-                success_msg = ""
-                for i in range(len(success_responses)):
-                    success_msg += str(i + 1) + ") " + success_responses[i]
-                messages.success(request, success_msg)
-
+        uploads, failure_responses = _pair_releases(
+            request.FILES.getlist('release_files'))
         if failure_responses:
-            if len(failure_responses) == 1:
-                messages.error(request, failure_responses[0])
-            else:
-                error_msg = ""
-                for i in range(len(failure_responses)):
-                    error_msg += str(i + 1) + ") " + failure_responses[i]
-                messages.error(request, error_msg)
+            messages.error(request, _consolidate(failure_responses))
+
+        # Release files streamed to USM while the request was received only
+        # need the outcome of their uploads collected
+        streams = getattr(request, 'release_upload_streams', None)
+        if streams is not None:
+            if streams:
+                jobs.submit(request, _("Upload releases"),
+                            _wait_release_streams, streams)
+        elif uploads:
+            jobs.submit(request, _("Upload releases"), _upload_releases,
+                        [[_release_part(field_name, f)
+                          for field_name, f in upload]
+                         for upload in uploads])
+        if uploads:
+            messages.info(request,
+                          _("Upload of %d release(s) started in the "
+                            "background.") % len(uploads))
 
         return True
 
 
+def _create_strategy(job, *args, **kwargs):
+    try:
+        response = stx_api.vim.create_strategy(
+            job.request, stx_api.vim.STRATEGY_SW_DEPLOY, *args, **kwargs)
+    except Exception as ex:
+        LOG.exception(ex)
+        response = None
+    if not response:
+        job.error("Strategy creation failed")
+
+
 class CreateSoftwareDeployStrategyForm(forms.SelfHandlingForm):
     failure_url = 'horizon:admin:software_management:index'
 
@@ -277,23 +371,16 @@ class CreateSoftwareDeployStrategyForm(forms.SelfHandlingForm):
             release = data.get('release')
             delete = data.get('delete')
             snapshot = data.get('snapshot')
-        try:
-            response = stx_api.vim.create_strategy(
-                request, stx_api.vim.STRATEGY_SW_DEPLOY,
-                data.get('controller_apply_type', 'ignore'),
-                data.get('storage_apply_type', 'ignore'), 'ignore',
-                data['worker_apply_type'],
-                data['max_parallel_worker_hosts'],
-                data['default_instance_action'],
-                data['alarm_restrictions'],
-                release=release, rollback=rollback,
-                delete=delete, snapshot=snapshot)
-            if not response:
-                messages.error(request, "Strategy creation failed")
-        except Exception:
-            redirect = reverse(self.failure_url)
-            exceptions.handle(request, "Strategy creation failed",
-                              redirect=redirect)
+        jobs.submit(request, _("Create strategy"), _create_strategy,
+                    data.get('controller_apply_type', 'ignore'),
+                    data.get('storage_apply_type', 'ignore'), 'ignore',
+                    data['worker_apply_type'],
+                    data['max_parallel_worker_hosts'],
+                    data['default_instance_action'],
+                    data['alarm_restrictions'],
+                    release=release, rollback=rollback,
+                    delete=delete, snapshot=snapshot)
+        messages.info(request, _("Strategy creation started."))
         return True
 
 
@@ -259,11 +259,11 @@ class DeployActivateRollback(tables.Action):
     verbose_name = _("Deploy Activate Rollback")
 
     def allowed(self, request, release=None):
-        deploy_show = stx_api.usm.deploy_show_req(request)
-        if not deploy_show:
+        deploy_show_state = stx_api.usm.get_deploy_snapshot(
+            request).deploy_state
+        if deploy_show_state is None:
             return False
 
-        deploy_show_state = deploy_show[0]['state']
         valid_states = {
             "activate-rollback-failed",
             "activate-rollback-pending",
@@ -306,10 +306,8 @@ class UpdateReleaseRow(tables.Row):
         release = stx_api.usm.get_release(request, release_id)
 
         if release is not None and release.state in ["deploying", "removing"]:
-            deploy_show_data = stx_api.usm.deploy_show_req(request)
-            deploy_host_release = deploy_show_data[0]
-            release.deploy_host_state = deploy_host_release[
-                'state']
+            release.deploy_host_state = stx_api.usm.get_deploy_snapshot(
+                request).deploy_state
 
             if release.reboot_required is False:
                 release.reboot_required = "N"
@@ -410,8 +408,9 @@ class ReleasesTable(tables.DataTable):
 def get_cached_strategy(request, strategy_name, table):
     if stx_api.vim.STRATEGY_SW_DEPLOY == strategy_name:
         if 'softwaredeploystrategy' not in table.kwargs:
-            table.kwargs['softwaredeploystrategy'] = stx_api.vim.get_strategy(
-                request, strategy_name)
+            table.kwargs['softwaredeploystrategy'] = \
+                stx_api.vim.get_strategy_snapshot(
+                    request, strategy_name).strategy
         return table.kwargs['softwaredeploystrategy']
 
 
@@ -9,6 +9,7 @@ import logging
 from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
+from horizon import messages
 from horizon import tabs
 from starlingx_dashboard import api as stx_api
 from starlingx_dashboard.dashboards.admin.software_management import \
@@ -23,26 +24,15 @@ class BaseReleasesTab(tabs.TableTab):
             request = self.request
         releases = []
         try:
-            releases = stx_api.usm.get_releases(request)
+            snapshot = stx_api.usm.get_deploy_snapshot(request)
+            releases = snapshot.releases
         except Exception:
             exceptions.handle(request, _('Unable to retrieve release list.'))
+            return releases
 
-        if releases:
-            for release in releases:
-                if release.state in ['deploying', 'removing']:
-                    deploy_show_data = None
-                    try:
-                        deploy_show_data = stx_api.usm.deploy_show_req(request)
-                    except Exception:
-                        exceptions.handle(
-                            request,
-                            _('Unable to retrieve release deploy list.')
-                        )
-                    release.deploy_host_state = None
-                    if deploy_show_data:
-                        deploy_host_release = deploy_show_data[0]
-                        release.deploy_host_state = deploy_host_release[
-                            'state']
+        if snapshot.deploy_show_error is not None:
+            messages.error(request,
+                           _('Unable to retrieve release deploy list.'))
         return releases
 
 
@@ -57,7 +47,7 @@ class ReleasesTab(BaseReleasesTab):
 
         phosts = []
         try:
-            phosts = stx_api.usm.get_deploy_hosts(request)
+            phosts = stx_api.usm.get_deploy_snapshot(request).deploy_hosts
         except Exception:
             exceptions.handle(request,
                               _('Unable to retrieve host list.'))
@@ -79,8 +69,8 @@ class DeployOrchestrationTab(tabs.TableTab):
 
         strategy = None
         try:
-            strategy = stx_api.vim.get_strategy(
-                request, stx_api.vim.STRATEGY_SW_DEPLOY)
+            strategy = stx_api.vim.get_strategy_snapshot(
+                request, stx_api.vim.STRATEGY_SW_DEPLOY).strategy
         except Exception as ex:
             LOG.exception(ex)
             exceptions.handle(request,
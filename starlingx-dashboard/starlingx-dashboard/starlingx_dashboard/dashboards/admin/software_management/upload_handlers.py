@@ -0,0 +1,301 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import hashlib
+import io
+import logging
+import queue
+import threading
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+from django.core.files.uploadhandler import StopFutureHandlers
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+
+from starlingx_dashboard import api as stx_api
+from starlingx_dashboard.utils import subrequest
+
+LOG = logging.getLogger(__name__)
+
+RELEASE_FILES_FIELD = 'release_files'
+
+# Size of the chunks read from a staged release file while it is sent
+RELEASE_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Default number of request chunks buffered for each streamed upload
+DEFAULT_RELEASE_UPLOAD_BUFFER_CHUNKS = 16
+
+# Markers passed along with the file data to the uploading thread
+_PART_END = object()
+_END = object()
+_ABORT = object()
+
+
+class ReleaseChecksumError(Exception):
+    """Raised when a staged release file differs from the one received"""
+
+    def __init__(self, name):
+        super(ReleaseChecksumError, self).__init__(
+            "%s changed since it was received (checksum mismatch)" % name)
+
+
+class ReleaseUploadAborted(Exception):
+    pass
+
+
+class ReleaseChecksumUploadHandler(TemporaryFileUploadHandler):
+    """Stage uploaded release files on disk, as Django does, and compute
+    their sha256 checksum while they are received.
+
+    Release files are only staged when they could not be streamed to USM
+    (see ReleaseUploadHandler).  The checksum is kept as the sha256
+    attribute of the uploaded file, for verified_chunks() to check the file
+    against it while it is sent to USM.  Files of other fields are left to
+    the next handlers.
+    """
+
+    def __init__(self, request=None):
+        super(ReleaseChecksumUploadHandler, self).__init__(request)
+        self._checksum = None
+
+    def new_file(self, field_name, file_name, *args, **kwargs):
+        if field_name != RELEASE_FILES_FIELD:
+            self._checksum = None
+            return
+        super(ReleaseChecksumUploadHandler, self).new_file(
+            field_name, file_name, *args, **kwargs)
+        self._checksum = hashlib.sha256()
+        raise StopFutureHandlers()
+
+    def receive_data_chunk(self, raw_data, start):
+        if self._checksum is None:
+            return raw_data
+        self._checksum.update(raw_data)
+        return super(ReleaseChecksumUploadHandler, self).receive_data_chunk(
+            raw_data, start)
+
+    def file_complete(self, file_size):
+        if self._checksum is None:
+            return None
+        uploaded = super(ReleaseChecksumUploadHandler, self).file_complete(
+            file_size)
+        uploaded.sha256 = self._checksum.hexdigest()
+        self._checksum = None
+        LOG.info("Received %s (%d bytes, sha256 %s)",
+                 uploaded.name, file_size, uploaded.sha256)
+        return uploaded
+
+
+def verified_chunks(release, name, checksum):
+    """Read the staged release file release in chunks, and raise
+    ReleaseChecksumError after its last chunk if it does not match the
+    checksum it was received with (when known).
+
+    The error is raised before the upload body is complete, so that USM
+    does not accept a file that differs from the one received.
+    """
+    digest = hashlib.sha256()
+    while True:
+        chunk = release.read(RELEASE_UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        digest.update(chunk)
+        yield chunk
+    if checksum is not None and digest.hexdigest() != checksum:
+        raise ReleaseChecksumError(name)
+
+
+class StreamedReleaseFile(UploadedFile):
+    """Placeholder for a release file already streamed to USM"""
+
+    def __init__(self, name, size, content_type, checksum):
+        super(StreamedReleaseFile, self).__init__(
+            io.BytesIO(), name, content_type, size)
+        self.sha256 = checksum
+
+
+class ReleaseStream(object):
+    """Release upload to USM fed with the data of the incoming request.
+
+    The upload runs in its own thread, on behalf of a copy of the request,
+    so that it goes on while the next files of the request are received.
+    At most RELEASE_UPLOAD_BUFFER_CHUNKS chunks are buffered between the
+    request and the outgoing connection.
+    """
+
+    def __init__(self, request, name):
+        self.name = name
+        self.checksums = {}
+        self.result = None
+        self.error = None
+        self.aborted = False
+        self.done = threading.Event()
+        self._queue = queue.Queue(maxsize=getattr(
+            settings, 'RELEASE_UPLOAD_BUFFER_CHUNKS',
+            DEFAULT_RELEASE_UPLOAD_BUFFER_CHUNKS))
+        self._thread = threading.Thread(
+            target=self._upload, args=(subrequest.copy_request(request),),
+            name='release-upload-%s' % name, daemon=True)
+        self._thread.start()
+
+    def _get(self):
+        item = self._queue.get()
+        if item is _ABORT:
+            raise ReleaseUploadAborted(self.name)
+        return item
+
+    def _chunks(self):
+        while True:
+            item = self._get()
+            if item is _PART_END:
+                return
+            yield item
+
+    def _parts(self):
+        while True:
+            item = self._get()
+            if item is _END:
+                return
+            field_name, file_name = item
+            yield field_name, file_name, self._chunks()
+
+    def _upload(self, request):
+        try:
+            self.result = stx_api.usm.release_upload_stream_req(
+                request, self._parts())
+        except ReleaseUploadAborted:
+            self.aborted = True
+        except Exception as ex:
+            LOG.exception("Upload of %s failed", self.name)
+            self.error = ex
+        finally:
+            self.done.set()
+
+    def put(self, item):
+        # Data is dropped once the upload has ended, e.g. on error
+        while not self.done.is_set():
+            try:
+                self._queue.put(item, timeout=1)
+                return
+            except queue.Full:
+                continue
+
+    def start_part(self, field_name, file_name):
+        self.put((field_name, file_name))
+
+    def end_part(self, file_name, checksum):
+        self.checksums[file_name] = checksum
+        self.put(_PART_END)
+
+    def finish(self):
+        self.put(_END)
+
+    def abort(self):
+        self.put(_ABORT)
+
+    def wait(self):
+        self.done.wait()
+
+
+class ReleaseUploadHandler(FileUploadHandler):
+    """Stream uploaded release files straight to USM.
+
+    Every release file is sent to USM while it is received, instead of
+    being staged in FILE_UPLOAD_TEMP_DIR and re-read afterwards, and its
+    sha256 checksum is computed on the way.  Each file has its own upload,
+    so independent files are uploaded concurrently; an .iso and its .sig
+    are sent in the same upload, the small .sig being kept in memory until
+    both are available.  The uploads are made available to the view as
+    request.release_upload_streams.
+
+    The handler must only be installed once the CSRF check of the request
+    passed, as it acts on the request body while it is read.
+    """
+
+    def __init__(self, request=None):
+        super(ReleaseUploadHandler, self).__init__(request)
+        self.streams = []
+        self._pending_isos = {}
+        self._sigs = {}
+        self._active = False
+        self._stream = None
+        self._sig = None
+        self._checksum = None
+        request.release_upload_streams = self.streams
+
+    def new_file(self, field_name, file_name, *args, **kwargs):
+        super(ReleaseUploadHandler, self).new_file(field_name, file_name,
+                                                   *args, **kwargs)
+        self._active = field_name == RELEASE_FILES_FIELD
+        if not self._active:
+            return
+
+        self._checksum = hashlib.sha256()
+        if file_name.endswith('.sig'):
+            self._stream = None
+            self._sig = io.BytesIO()
+        else:
+            self._sig = None
+            self._stream = ReleaseStream(self.request, file_name)
+            self._stream.start_part('file', file_name)
+            self.streams.append(self._stream)
+        raise StopFutureHandlers()
+
+    def receive_data_chunk(self, raw_data, start):
+        if not self._active:
+            return raw_data
+        self._checksum.update(raw_data)
+        if self._sig is not None:
+            self._sig.write(raw_data)
+        else:
+            self._stream.put(raw_data)
+        return None
+
+    def _add_sig(self, stream, base_name):
+        sig_name = '%s.sig' % base_name
+        data, checksum = self._sigs[base_name]
+        stream.start_part('file_1', sig_name)
+        stream.put(data)
+        stream.end_part(sig_name, checksum)
+        stream.finish()
+
+    def file_complete(self, file_size):
+        if not self._active:
+            return None
+        self._active = False
+
+        checksum = self._checksum.hexdigest()
+        LOG.info("Received %s (%d bytes, sha256 %s)",
+                 self.file_name, file_size, checksum)
+        base_name = self.file_name[:-4]
+        if self._sig is not None:
+            self._sigs[base_name] = (self._sig.getvalue(), checksum)
+            if base_name in self._pending_isos:
+                self._add_sig(self._pending_isos.pop(base_name), base_name)
+        else:
+            self._stream.end_part(self.file_name, checksum)
+            if not self.file_name.endswith('.iso'):
+                self._stream.finish()
+            elif base_name in self._sigs:
+                self._add_sig(self._stream, base_name)
+            else:
+                # Wait for the matching .sig later in the request
+                self._pending_isos[base_name] = self._stream
+
+        return StreamedReleaseFile(self.file_name, file_size,
+                                   self.content_type, checksum)
+
+    def upload_complete(self):
+        # An .iso without its .sig is not uploaded
+        for stream in self._pending_isos.values():
+            stream.abort()
+        self._pending_isos = {}
+
+    def upload_interrupted(self):
+        for stream in self.streams:
+            if not stream.done.is_set():
+                stream.abort()
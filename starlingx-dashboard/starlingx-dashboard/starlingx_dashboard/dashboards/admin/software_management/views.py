@@ -4,12 +4,18 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import copy
 import datetime
 import logging
 
+from django.conf import settings
+from django.middleware import csrf
 from django.urls import reverse
 from django.urls import reverse_lazy
+from django.utils.decorators import method_decorator
 from django.utils.translation import ugettext_lazy as _
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.csrf import csrf_protect
 
 from horizon import exceptions
 from horizon import forms
@@ -27,6 +33,9 @@ from starlingx_dashboard.dashboards.admin.software_management import \
     tables as toplevel_tables
 from starlingx_dashboard.dashboards.admin.software_management.tabs \
     import SoftwareManagementTabs
+from starlingx_dashboard.dashboards.admin.software_management import \
+    upload_handlers
+from starlingx_dashboard.utils import jobs
 
 LOG = logging.getLogger(__name__)
 
@@ -37,6 +46,8 @@ class IndexView(tabs.TabbedTableView):
     page_title = _("Software Management")
 
     def get_tabs(self, request, *args, **kwargs):
+        # Report background jobs finished since the last visit
+        jobs.add_messages(request)
         return self.tab_group_class(request, **kwargs)
 
 
@@ -66,12 +77,42 @@ class DetailReleaseView(views.HorizonTemplateView):
         return self._release
 
 
+def _csrf_header_valid(request):
+    """Return whether the CSRF token of the X-CSRFToken header of request
+    is valid, without reading the request body."""
+    if settings.CSRF_HEADER_NAME not in request.META:
+        return False
+    # The CSRF middleware only reads the token of the header when the
+    # request is not a POST, as it would otherwise parse the body first
+    check = copy.copy(request)
+    check.method = 'PUT'
+    middleware = csrf.CsrfViewMiddleware(lambda r: None)
+    return middleware.process_view(check, None, (), {}) is None
+
+
+@method_decorator(csrf_exempt, name='dispatch')
 class UploadReleaseView(forms.ModalFormView):
     form_class = UploadReleaseForm
     template_name = 'admin/software_management/upload_release.html'
     context_object_name = 'releaseupload'
     success_url = reverse_lazy("horizon:admin:software_management:index")
 
+    def post(self, request, *args, **kwargs):
+        # Release files are streamed to USM while the body is read, so the
+        # CSRF check must pass beforehand, with the token of the header
+        if _csrf_header_valid(request):
+            request.upload_handlers.insert(
+                0, upload_handlers.ReleaseUploadHandler(request))
+            return super(UploadReleaseView, self).post(
+                request, *args, **kwargs)
+        # Otherwise the files are staged on disk, and the token of the
+        # form is checked as usual
+        return self._staged_post(request, *args, **kwargs)
+
+    @method_decorator(csrf_protect)
+    def _staged_post(self, request, *args, **kwargs):
+        return super(UploadReleaseView, self).post(request, *args, **kwargs)
+
 
 class CreateSoftwareDeployStrategyView(forms.ModalFormView):
     form_class = CreateSoftwareDeployStrategyForm
@@ -83,12 +124,10 @@ class CreateSoftwareDeployStrategyView(forms.ModalFormView):
     def get_context_data(self, **kwargs):
         context = super(CreateSoftwareDeployStrategyView, self).\
             get_context_data(**kwargs)
-        alarms = stx_api.fm.alarm_list(self.request)
-        affecting = \
-            len([alarm for alarm in alarms if alarm.mgmt_affecting == 'True'])
+        counts = stx_api.fm.alarm_counts(self.request)
 
-        context['alarms'] = len(alarms)
-        context['affecting'] = affecting
+        context['alarms'] = counts['total']
+        context['affecting'] = counts['mgmt_affecting']
         return context
 
 
@@ -9,6 +9,7 @@ import logging
 
 from dcmanagerclient import exceptions as exc
 
+from django.conf import settings
 from django import forms as django_forms
 from django.urls import reverse  # noqa
 from django.utils.translation import ugettext_lazy as _
@@ -18,9 +19,119 @@ from horizon import forms
 from horizon import messages
 
 from starlingx_dashboard import api
+from starlingx_dashboard.utils import choices
+from starlingx_dashboard.utils import jobs
 
 LOG = logging.getLogger(__name__)
 
+# Default number of subclouds above which subclouds are picked with a
+# typeahead rather than a select listing every subcloud
+DEFAULT_SUBCLOUD_TYPEAHEAD_THRESHOLD = 200
+
+
+def _release_versions(request):
+    return [(release.release_id, release.sw_version)
+            for release in api.usm.get_releases(request)]
+
+
+def _subcloud_group_names(request):
+    return [group.name
+            for group in api.dc_manager.list_subcloud_groups(request)]
+
+
+def _kube_versions(request):
+    return [(k.version, k.state)
+            for k in api.sysinv.kube_version_list(request)]
+
+
+class SubcloudNameInput(forms.TextInput):
+    """Text input showing the label of the default choice, rather than
+    its value, and reading that label (or nothing) back as the value"""
+
+    def __init__(self, default, attrs=None):
+        super(SubcloudNameInput, self).__init__(attrs)
+        self.default = default
+
+    def format_value(self, value):
+        if value == self.default[0]:
+            value = self.default[1]
+        return super(SubcloudNameInput, self).format_value(value)
+
+    def value_from_datadict(self, data, files, name):
+        value = super(SubcloudNameInput, self).value_from_datadict(
+            data, files, name)
+        if value is None:
+            return value
+        if value.strip() in ('', self.default[0], str(self.default[1])):
+            return self.default[0]
+        return value
+
+
+class SubcloudNameField(forms.CharField):
+    """Subcloud picked by typing its name, checked with dcmanager"""
+
+    def __init__(self, request, default, *args, **kwargs):
+        super(SubcloudNameField, self).__init__(*args, **kwargs)
+        self.request = request
+        self.default = default
+
+    def validate(self, value):
+        super(SubcloudNameField, self).validate(value)
+        if not value or value == self.default:
+            return
+        try:
+            subcloud = api.dc_manager.subcloud_get(self.request, value)
+        except Exception as ex:
+            LOG.exception(ex)
+            raise django_forms.ValidationError(
+                _("Unable to check subcloud: %s") % value)
+        # dcmanager also looks subclouds up by id
+        if subcloud is None or subcloud.name != value:
+            raise django_forms.ValidationError(
+                _("Unknown subcloud: %s") % value)
+
+
+def set_subcloud_choices(form, field_name, names, default):
+    """Offer the subclouds named in names, plus default, in a field.
+
+    Large fleets get a text input completed through the subcloud-names
+    REST API instead of a select listing every subcloud.  The input shows
+    the label of default, and is left empty to pick it.  names is None
+    for bound forms, whose subcloud is checked on its own rather than
+    against the names of every subcloud.
+
+    The input keeps the data-slug of the select, for the fields switched
+    on the subcloud; horizon.subcloud_typeahead.js switches them on the
+    subcloud typed rather than on the text of the input.
+    """
+    field = form.fields[field_name]
+    threshold = getattr(settings, 'SUBCLOUD_TYPEAHEAD_THRESHOLD',
+                        DEFAULT_SUBCLOUD_TYPEAHEAD_THRESHOLD)
+    if names is not None and len(names) <= threshold:
+        field.choices = [default] + [(name, name) for name in names]
+        return
+
+    attrs = dict(field.widget.attrs)
+    classes = [c for c in attrs.pop('class', '').split()
+               if c != 'switchable']
+    if classes:
+        attrs['class'] = ' '.join(classes)
+    attrs.update({
+        'autocomplete': 'off',
+        'placeholder': default[1],
+        'data-default-value': default[0],
+        'data-default-label': default[1],
+        'data-typeahead-url':
+            settings.WEBROOT + 'api/dc_manager/subcloud-names/',
+    })
+    form.fields[field_name] = SubcloudNameField(
+        form.request, default[0],
+        label=field.label,
+        required=field.required,
+        help_text=field.help_text,
+        initial=form.initial.get(field_name, default[0]),
+        widget=SubcloudNameInput(default, attrs=attrs))
+
 
 class ApplyCloudStrategyForm(forms.SelfHandlingForm):
     failure_url = 'horizon:dc_admin:dc_orchestration:index'
@@ -41,6 +152,20 @@ class ApplyCloudStrategyForm(forms.SelfHandlingForm):
         return True
 
 
+def _create_cloud_strategy(job, data):
+    try:
+        response = api.dc_manager.strategy_create(job.request, data)
+    except exc.APIException as e:
+        LOG.error(e.error_message)
+        job.error(e.error_message)
+        return
+    except Exception as ex:
+        LOG.exception(ex)
+        response = None
+    if not response:
+        job.error("Strategy creation failed")
+
+
 class CreateCloudStrategyForm(forms.SelfHandlingForm):
     failure_url = 'horizon:dc_admin:dc_orchestration:index'
 
@@ -369,45 +494,48 @@ class CreateCloudStrategyForm(forms.SelfHandlingForm):
     def __init__(self, request, *args, **kwargs):
         super().__init__(request, *args, **kwargs)
 
-        releases = api.usm.get_releases(request)
+        loaders = [_release_versions, _subcloud_group_names, _kube_versions]
+        # Bound forms check their subcloud on its own, without the names of
+        # every subcloud (see set_subcloud_choices)
+        if not self.is_bound:
+            loaders.append(api.dc_manager.subcloud_name_list)
+        releases, subcloud_groups, kube_version_list, *subclouds = \
+            choices.load(request, loaders)
+
         # Match all releases for sw-deploy
         sw_releases_list = [
-            (release.release_id, release.release_id) for release in releases
+            (release_id, release_id) for release_id, _sw in releases
         ]
         sw_releases_list.insert(0, ('--', '--'))
         self.fields['release_id'].choices = sw_releases_list
         # Match only major releases for prestage
         release_choices_dict = {
-            ".".join(release.sw_version.split(".")[0:2]):
-            ".".join(release.sw_version.split(".")[0:2])
-            for release in releases
+            ".".join(sw_version.split(".")[0:2]):
+            ".".join(sw_version.split(".")[0:2])
+            for _id, sw_version in releases
         }
         self.fields['release'].choices = sorted(release_choices_dict.items())
 
-        subcloud_list = [('default', 'All subclouds')]
-        subclouds = api.dc_manager.subcloud_list(self.request)
-        subcloud_list.extend([(c.name, c.name) for c in subclouds])
-        self.fields['cloud_name'].choices = subcloud_list
+        set_subcloud_choices(self, 'cloud_name',
+                             subclouds[0] if subclouds else None,
+                             ('default', 'All subclouds'))
         if self.initial.get('cloud_name', None):
             self.fields['cloud_name'].widget.attrs['disabled'] = 'disabled'
 
-        subcloud_groups = api.dc_manager.list_subcloud_groups(self.request)
         self.fields['subcloud_group'].choices = [
-            (subcloud_group.name, subcloud_group.name) for subcloud_group
-            in subcloud_groups
+            (name, name) for name in subcloud_groups
         ]
 
         kube_versions = []
         version = []
-        kube_version_list = api.sysinv.kube_version_list(self.request)
-        for k in kube_version_list:
-            if k.state == "active":
-                version = [(k.version, '--')]
+        for k_version, k_state in kube_version_list:
+            if k_state == "active":
+                version = [(k_version, '--')]
                 kube_versions[:0] = version
-                version = [(k.version, k.version + " - " + k.state)]
+                version = [(k_version, k_version + " - " + k_state)]
                 kube_versions.extend(version)
             else:
-                version = [(k.version, k.version)]
+                version = [(k_version, k_version)]
                 kube_versions.extend(version)
         self.fields['to_version'].choices = kube_versions
 
@@ -479,9 +607,9 @@ class CreateCloudStrategyForm(forms.SelfHandlingForm):
                 if not value:
                     data.pop(key, None)
 
-            response = api.dc_manager.strategy_create(request, data)
-            if not response:
-                messages.error(request, "Strategy creation failed")
+            jobs.submit(request, _("Create strategy"), _create_cloud_strategy,
+                        data)
+            messages.info(request, _("Strategy creation started."))
         except Exception as ex:
             LOG.exception(ex)
             redirect = reverse(self.failure_url)
@@ -559,11 +687,13 @@ class CreateSubcloudConfigForm(forms.SelfHandlingForm):
     def __init__(self, request, *args, **kwargs):
         super(CreateSubcloudConfigForm, self).__init__(request, *args,
                                                        **kwargs)
-        subcloud_list = [(api.dc_manager.DEFAULT_CONFIG_NAME,
-                          api.dc_manager.DEFAULT_CONFIG_NAME), ]
-        subclouds = api.dc_manager.subcloud_list(self.request)
-        subcloud_list.extend([(c.name, c.name) for c in subclouds])
-        self.fields['subcloud'].choices = subcloud_list
+        subclouds = None
+        if not self.is_bound:
+            subclouds = choices.load(
+                request, [api.dc_manager.subcloud_name_list])[0]
+        set_subcloud_choices(self, 'subcloud', subclouds,
+                             (api.dc_manager.DEFAULT_CONFIG_NAME,
+                              api.dc_manager.DEFAULT_CONFIG_NAME))
 
         if self.initial.get('subcloud', None):
             self.fields['subcloud'].widget.attrs['disabled'] = 'disabled'
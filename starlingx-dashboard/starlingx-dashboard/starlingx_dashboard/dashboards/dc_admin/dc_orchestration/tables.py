@@ -191,26 +191,12 @@ def get_state(step):
     return state
 
 
-class UpdateStepRow(tables.Row):
-    ajax = True
-
-    def get_data(self, request, cloud_name):
-        step = api.dc_manager.step_detail(request, cloud_name)
-        return step
-
-
 class StepFilterAction(tables.FilterAction):
-    def filter(self, table, steps, filter_string):
-        """Naive case-insensitive search."""
-        q = filter_string.lower().strip()
-
-        def comp(step):
-            if (q in step.state.lower() or
-               q in step.stage):
-                return True
-            return False
-
-        return list(filter(comp, steps))
+    # Steps are filtered by StrategyTab on the full step list, before
+    # being paged
+    filter_type = "server"
+    filter_choices = (('search', _("Stage or State"), True),
+                      ('state', _("State ="), True))
 
 
 class CloudPatchStepsTable(tables.DataTable):
@@ -235,8 +221,8 @@ class CloudPatchStepsTable(tables.DataTable):
     class Meta(object):
         name = "cloudpatchsteps"
         multi_select = False
+        # Rows are refreshed together by StepUpdatesView
         status_columns = ['state', ]
-        row_class = UpdateStepRow
 
         table_actions = (StepFilterAction,
                          CreateCloudStrategy, ApplyCloudStrategy,
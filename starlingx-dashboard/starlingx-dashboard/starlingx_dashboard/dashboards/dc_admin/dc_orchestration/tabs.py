@@ -10,6 +10,7 @@ from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
 from horizon import tabs
+from horizon.utils import functions as utils
 from starlingx_dashboard import api
 from starlingx_dashboard.dashboards.dc_admin.dc_orchestration \
     import tables as tables
@@ -17,6 +18,15 @@ from starlingx_dashboard.dashboards.dc_admin.dc_orchestration \
 LOG = logging.getLogger(__name__)
 
 
+def filter_steps(snapshot, table):
+    """Return the steps of snapshot matching the server filter of the
+    steps table: a state, or a string found in their stage or state."""
+    value = table.get_filter_string().strip()
+    if table.get_filter_field() == 'state':
+        return snapshot.filter(state=value)
+    return snapshot.filter(value)
+
+
 class StrategyTab(tabs.TableTab):
     table_classes = (tables.CloudPatchStepsTable,)
     name = _("Strategy")
@@ -25,6 +35,11 @@ class StrategyTab(tabs.TableTab):
                      "_cloud_strategy_orchestration.html")
     preload = False
 
+    def __init__(self, *args, **kwargs):
+        super(StrategyTab, self).__init__(*args, **kwargs)
+        self._has_prev = False
+        self._has_more = False
+
     def get_context_data(self, request):
         context = super(StrategyTab, self).get_context_data(request)
 
@@ -36,19 +51,44 @@ class StrategyTab(tabs.TableTab):
             exceptions.handle(request,
                               _('Unable to retrieve current strategy.'))
         context['strategy'] = strategy
+
+        step_counts = []
+        step_marker = None
+        if strategy:
+            try:
+                snapshot = api.dc_manager.get_step_snapshot(request)
+                step_counts = sorted(snapshot.state_counts.items())
+                step_marker = snapshot.marker
+            except Exception as ex:
+                LOG.exception(ex)
+        context['step_counts'] = step_counts
+        # The steps shown are refreshed with the steps changed since then
+        context['step_marker'] = step_marker
         return context
 
     def get_cloudpatchsteps_data(self):
         request = self.request
+        table = self._tables['cloudpatchsteps']
         steps = []
         try:
-            steps = api.dc_manager.step_list(request)
+            snapshot = api.dc_manager.get_step_snapshot(request)
+            steps = filter_steps(snapshot, table)
         except Exception:
             exceptions.handle(self.request,
                               _('Unable to retrieve steps list.'))
 
+        marker = request.GET.get(table._meta.pagination_param)
+        prev_marker = request.GET.get(table._meta.prev_pagination_param)
+        steps, self._has_prev, self._has_more = api.dc_manager.page_steps(
+            steps, utils.get_page_size(request), marker, prev_marker)
         return steps
 
+    def has_prev_data(self, table):
+        return self._has_prev
+
+    def has_more_data(self, table):
+        return self._has_more
+
 
 class SubcloudStrategyConfigTab(tabs.TableTab):
     table_classes = (tables.SubcloudStrategyConfigTable,)
@@ -22,9 +22,12 @@ from starlingx_dashboard.dashboards.dc_admin.dc_orchestration.views \
     import EditSubCloudStrategyConfigView
 from starlingx_dashboard.dashboards.dc_admin.dc_orchestration.views \
     import IndexView
+from starlingx_dashboard.dashboards.dc_admin.dc_orchestration.views \
+    import StepUpdatesView
 
 urlpatterns = [
     url(r'^$', IndexView.as_view(), name='index'),
+    url(r'^steps/$', StepUpdatesView.as_view(), name='steps'),
     url(r'^(?P<patch_id>[^/]+)/patchdetail/$',
         DetailPatchView.as_view(), name='dc_patchdetail'),
     url(r'^createcloudstrategy/$', CreateCloudStrategyView.as_view(),
@@ -9,6 +9,7 @@ import logging
 
 from django.urls import reverse_lazy
 from django.utils.translation import ugettext_lazy as _
+from django.views import generic
 
 from horizon import exceptions
 from horizon import forms
@@ -27,8 +28,14 @@ from starlingx_dashboard.dashboards.dc_admin.dc_orchestration.forms \
     import CreateSubcloudGroupForm
 from starlingx_dashboard.dashboards.dc_admin.dc_orchestration.forms \
     import UpdateSubcloudGroupForm
+from starlingx_dashboard.dashboards.dc_admin.dc_orchestration.tables \
+    import CloudPatchStepsTable
 from starlingx_dashboard.dashboards.dc_admin.dc_orchestration.tabs \
     import DCSoftwareManagementTabs
+from starlingx_dashboard.dashboards.dc_admin.dc_orchestration.tabs \
+    import filter_steps
+from starlingx_dashboard.utils import fastjson
+from starlingx_dashboard.utils import jobs
 
 LOG = logging.getLogger(__name__)
 
@@ -41,8 +48,41 @@ class IndexView(tabs.TabbedTableView):
     page_title = _("Orchestration")
 
     def get_tabs(self, request, *args, **kwargs):
+        # Report background jobs finished since the last visit
+        jobs.add_messages(request)
         return self.tab_group_class(request, **kwargs)
 
+    def post(self, request, *args, **kwargs):
+        # The steps are filtered by the server: keep the filter of the
+        # steps table in the session, as DataTableView does
+        self.handle_server_filter(
+            request, table=CloudPatchStepsTable(request))
+        return super(IndexView, self).post(request, *args, **kwargs)
+
+
+class StepUpdatesView(generic.View):
+    """Rows of the steps table updated since a marker.
+
+    GET ?marker=<marker> returns the rendered rows of the steps updated
+    since the marker and matching the filter of the table, with the
+    marker of the next call and the number of steps in each state.  The
+    rows shown by the strategy tab are refreshed together with it,
+    rather than each with its own request.
+    """
+
+    def get(self, request, *args, **kwargs):
+        table = CloudPatchStepsTable(request)
+        snapshot = api.dc_manager.get_step_snapshot(request)
+        changed = set(step.cloud for step in
+                      snapshot.changed_since(request.GET.get('marker')))
+        rows = [table._meta.row_class(table, step).render()
+                for step in filter_steps(snapshot, table)
+                if step.cloud in changed]
+        data = {'marker': snapshot.marker,
+                'counts': sorted(snapshot.state_counts.items()),
+                'rows': rows}
+        return fastjson.response(request, data)
+
 
 class DetailPatchView(AdminDetailPatchView):
     template_name = 'dc_admin/dc_orchestration/_detail_releases.html'
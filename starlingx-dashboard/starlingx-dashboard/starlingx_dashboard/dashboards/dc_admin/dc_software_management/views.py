@@ -9,11 +9,12 @@ import logging
 from django.urls import reverse_lazy
 from django.utils.translation import ugettext_lazy as _
 
-from horizon import forms
 from horizon import tabs
 
 from starlingx_dashboard.dashboards.admin.software_management.views import \
     DetailReleaseView as AdminDetailReleaseView
+from starlingx_dashboard.dashboards.admin.software_management.views import \
+    UploadReleaseView as AdminUploadReleaseView
 from starlingx_dashboard.dashboards.dc_admin.dc_software_management.forms \
     import UploadReleaseForm
 from starlingx_dashboard.dashboards.dc_admin.dc_software_management.tabs \
@@ -33,7 +34,7 @@ class IndexView(tabs.TabbedTableView):
         return self.tab_group_class(request, **kwargs)
 
 
-class UploadReleaseView(forms.ModalFormView):
+class UploadReleaseView(AdminUploadReleaseView):
     form_class = UploadReleaseForm
     template_name = 'dc_admin/dc_software_management/upload_release.html'
     context_object_name = 'release'
@@ -25,26 +25,26 @@
     '$q',
     '$scope',
     '$timeout',
-    '$interval',
     '$window',
     '$cookies',
     'horizon.framework.widgets.toast.service',
     'horizon.framework.util.i18n.gettext',
     'horizon.app.core.openstack-service-api.sysinv',
     'horizon.app.core.openstack-service-api.fm',
+    'horizon.app.core.openstack-service-api.poller'
   ];
 
   function dcOverviewCentralTableController(
     $q,
     $scope,
     $timeout,
-    $interval,
     $window,
     $cookies,
     toast,
     gettext,
     sysinv,
-    fm
+    fm,
+    poller
   ){
 
     var ctrl = this;
@@ -55,8 +55,7 @@
     ctrl.goToCentralHostDetails = goToCentralHostDetails;
 
     // Auto-refresh
-    ctrl.$interval = $interval;
-    ctrl.refreshInterval;
+    ctrl.refreshPoll;
     ctrl.refreshWaitTime = 5000;
 
     getData();
@@ -66,7 +65,7 @@
 
     function getData() {
       // Fetch central cloud data to populate the table
-      $q.all([
+      return $q.all([
         sysinv.getSystem().success(getSystemSuccess),
         fm.getAlarmSummary().success(getAlarmSummarySuccess)
       ]).then(function(){
@@ -87,18 +86,18 @@
     ///////////////////////////
 
     function startRefresh() {
-      if (angular.isDefined(ctrl.refreshInterval)) return;
-      ctrl.refreshInterval = ctrl.$interval(getData, ctrl.refreshWaitTime);
+      if (angular.isDefined(ctrl.refreshPoll)) return;
+      ctrl.refreshPoll = poller.start(getData, {interval: ctrl.refreshWaitTime});
     }
 
     $scope.$on('$destroy',function(){
-      ctrl.stopRefresh();
+      stopRefresh();
     });
 
     function stopRefresh() {
-      if (angular.isDefined(ctrl.refreshInterval)) {
-        ctrl.$interval.cancel(ctrl.refreshInterval);
-        ctrl.refreshInterval = undefined;
+      if (angular.isDefined(ctrl.refreshPoll)) {
+        ctrl.refreshPoll.stop();
+        ctrl.refreshPoll = undefined;
       }
     }
 
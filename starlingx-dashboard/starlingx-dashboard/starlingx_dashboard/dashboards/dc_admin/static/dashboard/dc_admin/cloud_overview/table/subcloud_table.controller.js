@@ -25,7 +25,6 @@
     '$q',
     '$scope',
     '$timeout',
-    '$interval',
     '$window',
     '$cookies',
     'horizon.framework.widgets.toast.service',
@@ -35,6 +34,7 @@
     'horizon.framework.widgets.modal.deleteModalService',
     'horizon.app.core.openstack-service-api.dc_manager',
     'horizon.app.core.openstack-service-api.keystone',
+    'horizon.app.core.openstack-service-api.poller',
     '$filter'
   ];
 
@@ -42,7 +42,6 @@
     $q,
     $scope,
     $timeout,
-    $interval,
     $window,
     $cookies,
     toast,
@@ -52,6 +51,7 @@
     deleteModal,
     dc_manager,
     keystone,
+    poller,
     $filter
   ){
 
@@ -75,10 +75,15 @@
     ctrl.goToHostDetails = goToHostDetails;
 
     // Auto-refresh
-    ctrl.$interval = $interval;
-    ctrl.refreshInterval;
+    ctrl.refreshPoll;
     ctrl.refreshWaitTime = 5000;
 
+    // Deploy states of subclouds being installed, deployed or restored
+    var TRANSITION_DEPLOY_STATES = [
+      'pre-install', 'installing', 'bootstrapping', 'pre-deploy', 'deploying',
+      'migrating-data', 'pre-restore', 'restoring'
+    ];
+
     // Messages
     ctrl.endpointErrorMsg = gettext("This subcloud's endpoints are not yet accessible by horizon.  Please log out and log back in to access this subcloud.");
 
@@ -168,7 +173,7 @@
 
     function getData() {
       // Fetch subcloud data to populate the table
-      $q.all([
+      return $q.all([
         dc_manager.getSubCloudGroups().success(getSubCloudGroupsSuccess),
         dc_manager.getSubClouds().success(getSubCloudsSuccess),
         dc_manager.getSummaries().success(getSummariesSuccess)
@@ -226,18 +231,27 @@
     ///////////////////////////
 
     function startRefresh() {
-      if (angular.isDefined(ctrl.refreshInterval)) return;
-      ctrl.refreshInterval = ctrl.$interval(getData, ctrl.refreshWaitTime);
+      if (angular.isDefined(ctrl.refreshPoll)) return;
+      ctrl.refreshPoll = poller.start(getData, {
+        interval: ctrl.refreshWaitTime,
+        inTransition: subCloudsInTransition
+      });
+    }
+
+    function subCloudsInTransition() {
+      return ctrl.subClouds.some(function (subCloud) {
+        return TRANSITION_DEPLOY_STATES.indexOf(subCloud.deploy_status) !== -1;
+      });
     }
 
     $scope.$on('$destroy',function(){
-      ctrl.stopRefresh();
+      stopRefresh();
     });
 
     function stopRefresh() {
-      if (angular.isDefined(ctrl.refreshInterval)) {
-        ctrl.$interval.cancel(ctrl.refreshInterval);
-        ctrl.refreshInterval = undefined;
+      if (angular.isDefined(ctrl.refreshPoll)) {
+        ctrl.refreshPoll.stop();
+        ctrl.refreshPoll = undefined;
       }
     }
 
@@ -16,10 +16,12 @@
     '$q',
     'horizon.framework.util.http.service',
     'horizon.framework.widgets.toast.service',
-    '$http'
+    '$http',
+    '$timeout',
+    'horizon.app.core.openstack-service-api.batch'
   ];
 
-  function DCManagerAPI($q, apiService, toastService, $http) {
+  function DCManagerAPI($q, apiService, toastService, $http, $timeout, batch) {
     var service = {
       getSummaries: getSummaries,
       createSubcloud: createSubcloud,
@@ -27,9 +29,16 @@
       getSubClouds: getSubClouds,
       deleteSubcloud: deleteSubcloud,
       generateConfig: generateConfig,
-      getSubCloudGroups: getSubCloudGroups
+      getSubCloudGroups: getSubCloudGroups,
+      getJob: getJob,
+      acknowledgeJob: acknowledgeJob
     };
 
+    // Interval at which the progress of a background job is polled
+    var JOB_POLL_INTERVAL = 3000;
+    // Number of failed polls of a background job before giving up on it
+    var JOB_POLL_MAX_FAILURES = 5;
+
     var csrf_token = $('input[name=csrfmiddlewaretoken]').val();
     $http.defaults.headers.post['X-CSRFToken'] = csrf_token;
     $http.defaults.headers.common['X-CSRFToken'] = csrf_token;
@@ -43,7 +52,7 @@
     ///////////////
 
     function getSummaries() {
-      return apiService.get('/api/dc_manager/alarm_summaries/')
+      return batch.get('/api/dc_manager/alarm_summaries/')
         .error(function (error) {
 
           toastService.clearErrors();
@@ -89,9 +98,10 @@
         toastService.clearErrors();
         toastService.add('error', gettext(msg));
       })
-      .success(function () {
+      .success(function (response) {
         toastService.clearErrors();
-        toastService.add('success', gettext('Subcloud created succesfully.'));
+        toastService.add('info', gettext('Subcloud creation started.'));
+        waitForJob(response.job_id);
       });
     }
 
@@ -127,7 +137,7 @@
     }
 
     function getSubClouds() {
-      return apiService.get('/api/dc_manager/subclouds/')
+      return batch.get('/api/dc_manager/subclouds/')
         .error(function (error) {
           toastService.clearErrors();
 
@@ -188,12 +198,72 @@
     }
 
 
+    //////////
+    // Jobs //
+    //////////
+
+    /**
+     * @name getJob
+     * @description
+     * Get the state and progress of a background job
+     * @param {string} job_id The id of the job.
+     * @returns {Object} The result of the API call
+     */
+    function getJob(job_id) {
+      return apiService.get('/api/stx/jobs/' + job_id + '/');
+    }
+
+    /**
+     * @name acknowledgeJob
+     * @description
+     * Mark a finished job as reported, so that the next page does not
+     * report it again
+     * @param {string} job_id The id of the job.
+     * @returns {Object} The result of the API call
+     */
+    function acknowledgeJob(job_id) {
+      return apiService.post('/api/stx/jobs/' + job_id + '/');
+    }
+
+    function waitForJob(job_id, failures) {
+      failures = failures || 0;
+      getJob(job_id).success(function (job) {
+        if (job.state !== 'success' && job.state !== 'error') {
+          $timeout(function () { waitForJob(job_id); }, JOB_POLL_INTERVAL);
+          return;
+        }
+        toastService.clearErrors();
+        job.error_messages.forEach(function (msg) {
+          toastService.add('error', gettext(msg));
+        });
+        (job.info_messages || []).forEach(function (msg) {
+          toastService.add('info', gettext(msg));
+        });
+        job.success_messages.forEach(function (msg) {
+          toastService.add('success', gettext(msg));
+        });
+        acknowledgeJob(job_id);
+      })
+      .error(function (error, status) {
+        // A job unknown to the server expired or was lost; other errors
+        // are retried a few times before giving up on the job.
+        if (status !== 404 && failures + 1 < JOB_POLL_MAX_FAILURES) {
+          $timeout(function () { waitForJob(job_id, failures + 1); },
+                   JOB_POLL_INTERVAL);
+          return;
+        }
+        toastService.add('error',
+          gettext('Unable to retrieve the progress of the subcloud creation.'));
+      });
+    }
+
+
     ///////////////
     // SubCloud Groups //
     ///////////////
 
     function getSubCloudGroups() {
-      return apiService.get('/api/dc_manager/subcloud-groups/')
+      return batch.get('/api/dc_manager/subcloud-groups/')
         .error(function (error) {
           toastService.clearErrors();
         });
@@ -16,10 +16,11 @@
     '$q',
     'horizon.framework.util.http.service',
     'horizon.framework.widgets.toast.service',
-    '$http'
+    '$http',
+    'horizon.app.core.openstack-service-api.batch'
   ];
 
-  function SysinvAPI($q, apiService, toastService, $http) {
+  function SysinvAPI($q, apiService, toastService, $http, batch) {
     var service = {
       getSystem: getSystem
     };
@@ -37,7 +38,7 @@
     ////////////
 
     function getSystem() {
-      return apiService.get('/api/sysinv/system/')
+      return batch.get('/api/sysinv/system/')
         .error(function () {
           toastService.clearErrors();
           toastService.add('error', gettext("Unable to retrieve the System Controller's system."));
@@ -11,6 +11,7 @@ from openstack_dashboard.settings import HORIZON_CONFIG
 from openstack_dashboard.settings import ROOT_PATH
 from openstack_dashboard.settings import TEMPLATES
 from starlingx_dashboard import configss
+from starlingx_dashboard.utils import platform_config
 from tsconfig.tsconfig import distributed_cloud_role
 
 LOG = logging.getLogger(__name__)
@@ -18,12 +19,11 @@ LOG = logging.getLogger(__name__)
 
 def get_region_name() -> str:
     try:
-        with open("/etc/platform/openrc", "r", encoding="utf-8") as file:
-            for line in file:
-                if line.strip().startswith("export OS_REGION_NAME="):
-                    region_name = line.strip().split("=", 1)[1].strip("'\"")
-                    LOG.info(f"Read region from openrc: {region_name}")
-                    return region_name
+        region_name = platform_config.config_file(
+            "/etc/platform/openrc").get("OS_REGION_NAME")
+        if region_name:
+            LOG.info(f"Read region from openrc: {region_name}")
+            return region_name
         LOG.warning(
             "OS_REGION_NAME not found in openrc, using default: RegionOne"
         )
@@ -109,6 +109,102 @@ SECONDARY_ENDPOINT_TYPE = "adminURL"
 # directory
 FILE_UPLOAD_TEMP_DIR = "/scratch/horizon"
 
+# Release files are streamed to USM as they are received when the upload
+# carries its CSRF token in the X-CSRFToken header. Number of request chunks
+# buffered for each streamed upload.
+RELEASE_UPLOAD_BUFFER_CHUNKS = 16
+
+# Otherwise release files are staged in FILE_UPLOAD_TEMP_DIR with their
+# sha256 checksum, which is verified as they are sent to USM, at most
+# RELEASE_UPLOAD_MAX_PARALLEL uploads at a time.
+RELEASE_UPLOAD_MAX_PARALLEL = 4
+FILE_UPLOAD_HANDLERS = [
+    'starlingx_dashboard.dashboards.admin.software_management.'
+    'upload_handlers.ReleaseChecksumUploadHandler',
+    'django.core.files.uploadhandler.MemoryFileUploadHandler',
+    'django.core.files.uploadhandler.TemporaryFileUploadHandler',
+]
+
+# Number of seconds the USM deploy state (releases, deploy and deploy hosts)
+# fetched for a region is reused. 0 disables reuse across requests.
+USM_SNAPSHOT_TTL = 5
+
+# Number of seconds the Distributed Cloud strategy step list is reused by the
+# steps table and its row refreshes
+DC_STEP_SNAPSHOT_TTL = 5
+
+# Number of seconds the choices offered by forms (releases, subclouds,
+# subcloud groups, kubernetes versions) are shared by the users of a region
+CHOICES_CACHE_TTL = 30
+
+# Subclouds are picked with a typeahead instead of a select above this
+# number of subclouds
+SUBCLOUD_TYPEAHEAD_THRESHOLD = 200
+
+# Number of seconds alarm counts are shared by the users of a region
+ALARM_COUNTS_TTL = 10
+
+# JSON views (such as the host topology) with lists longer than
+# JSON_STREAM_MIN_ITEMS stream them JSON_STREAM_CHUNK_ITEMS items at a time;
+# other JSON responses, including the REST API ones, are gzipped above
+# JSON_GZIP_MIN_SIZE bytes
+JSON_STREAM_MIN_ITEMS = 500
+JSON_STREAM_CHUNK_ITEMS = 200
+JSON_GZIP_MIN_SIZE = 16384
+
+# Maximum number of requests in a /api/stx/batch/ call, and number of them
+# run concurrently
+BATCH_MAX_REQUESTS = 20
+BATCH_MAX_WORKERS = 8
+
+# Share one backend request between identical concurrent read API calls
+API_SINGLE_FLIGHT = True
+
+# Number of seconds calls to a platform service may take, by service type
+# (defaults: platform 60, faultmanagement 10, dcmanager 20, patching 10,
+# usm 30, ceph 10); after API_BREAKER_FAILURES consecutive failures to
+# reach a service of a region, calls to it fail fast, or return their
+# last result, for API_BREAKER_COOLDOWN seconds.  At most API_MAX_IN_FLIGHT
+# calls without a client timeout run at once for a service of a region, and
+# the last results of API_LAST_KNOWN_SIZE calls are kept
+API_TIMEOUTS = {}
+API_BREAKER_FAILURES = 3
+API_BREAKER_COOLDOWN = 30
+API_MAX_IN_FLIGHT = 4
+API_LAST_KNOWN_SIZE = 256
+
+# Record the calls to platform services made while handling each request,
+# reported in a Server-Timing response header (to admins only with 'admin',
+# to every user with True) and, for requests spending at least
+# API_TRACING_LOG_THRESHOLD milliseconds in them, summarized to the
+# starlingx_dashboard.tracing logger
+API_TRACING = True
+API_TRACING_SERVER_TIMING = 'admin'
+API_TRACING_LOG_THRESHOLD = 1000
+
+# Development aid: 'warn' or 'raise' when a request makes more backend calls
+# than the api_call_budget of its view or tabs, or makes the same call from
+# the same place more than API_CALL_REPEAT_LIMIT times (e.g. a call per
+# table row). Requires API_TRACING.
+API_CALL_CHECK = None
+API_CALL_REPEAT_LIMIT = 10
+
+# Collect latency histograms of views, REST API endpoints and backend
+# calls, and cache and error counters, served in the Prometheus text
+# format by /api/stx/metrics/ to administrators, or with the METRICS_TOKEN
+# bearer token. Each Horizon process writes its metrics to METRICS_DIR at
+# most every METRICS_FLUSH_INTERVAL seconds, and the endpoint sums the
+# metrics of all processes.
+API_METRICS = True
+METRICS_TOKEN = None
+METRICS_DIR = '/var/tmp/horizon-metrics'
+METRICS_FLUSH_INTERVAL = 10
+
+MIDDLEWARE = tuple(MIDDLEWARE) + (  # noqa
+    'starlingx_dashboard.middleware.MetricsMiddleware',
+    'starlingx_dashboard.middleware.TracingMiddleware',
+)
+
 # Override openstack-dashboard NG_CACHE_TEMPLATE_AGE
 NG_TEMPLATE_CACHE_AGE = 300
 
@@ -178,6 +274,28 @@ HORIZON_CONFIG["disable_password_reveal"] = True
 # Size of thread batch
 THREAD_BATCH_SIZE = 100
 
+# Maximum number of hosts acted upon concurrently by a bulk host action, and
+# the number of seconds to wait for the action on a single host
+BULK_ACTION_MAX_PARALLEL = 10
+BULK_ACTION_ITEM_TIMEOUT = 120
+
+# Bulk host actions on more hosts than this are run as background jobs
+BULK_ACTION_JOB_THRESHOLD = 20
+
+# Background jobs (release uploads, strategy and subcloud creation, large
+# bulk host actions). The job table lives in a file based cache so that
+# job progress can be polled from any Horizon process. Each process running
+# jobs records a heartbeat every JOB_HEARTBEAT seconds; its jobs are failed
+# once it stopped.
+JOB_MAX_WORKERS = 4
+JOB_RETENTION = 3600
+JOB_HEARTBEAT = 30
+JOB_CACHE_ALIAS = 'stx_jobs'
+CACHES[JOB_CACHE_ALIAS] = {  # noqa
+    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+    'LOCATION': '/var/tmp/horizon-jobs',
+}
+
 try:
     if os.path.exists('/etc/openstack-dashboard/horizon-config.ini'):
         if not configss.CONFSS or 'horizon_params' not in configss.CONFSS:
@@ -225,7 +343,12 @@ LOGGING['loggers'].update({  # noqa
         'handlers': ['console'],
         'level': 'DEBUG',
         'propagate': False,
-    }
+    },
+    'starlingx_dashboard.tracing': {
+        'handlers': ['console'],
+        'level': 'INFO',
+        'propagate': False,
+    },
 })
 
 
@@ -0,0 +1,153 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import logging
+import time
+
+from django.conf import settings
+
+from starlingx_dashboard.api import budget
+from starlingx_dashboard.api import tracing
+from starlingx_dashboard.utils import metrics
+
+# Per-request summaries of backend calls
+LOG = logging.getLogger('starlingx_dashboard.tracing')
+
+# Default number of milliseconds of backend calls from which a request's
+# summary is logged
+DEFAULT_API_TRACING_LOG_THRESHOLD = 1000
+
+# Default for API_TRACING_SERVER_TIMING, who gets the Server-Timing header:
+# True for every user, 'admin' for admins only, False for nobody
+DEFAULT_API_TRACING_SERVER_TIMING = 'admin'
+
+_REST_MODULE_PREFIX = 'starlingx_dashboard.api.rest.'
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 1)
+
+
+def server_timing(trace):
+    """Return the Server-Timing header value of a trace: the number of
+    calls and time spent by backend service, and in total."""
+    entries = ['%s;dur=%s;desc="%d calls"' % (service, _ms(duration), count)
+               for service, (count, duration)
+               in sorted(trace.by_service().items())]
+    entries.append('backend;dur=%s;desc="%d calls"' % (
+        _ms(trace.total), len(trace.spans)))
+    return ', '.join(entries)
+
+
+def _shows_server_timing(request):
+    show = getattr(settings, 'API_TRACING_SERVER_TIMING',
+                   DEFAULT_API_TRACING_SERVER_TIMING)
+    if show == 'admin':
+        user = getattr(request, 'user', None)
+        return bool(getattr(user, 'is_superuser', False))
+    return bool(show)
+
+
+class TracingMiddleware(object):
+    """Record the backend calls made while handling each request.
+
+    Adds a Server-Timing header to the response of the users allowed by
+    API_TRACING_SERVER_TIMING, which browsers show along with the request
+    timings, and logs a summary of the calls of slow requests to the
+    starlingx_dashboard.tracing logger.  With API_CALL_CHECK, also
+    checks the calls against the call budgets of the view and its tabs.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not tracing.enabled():
+            return self.get_response(request)
+
+        trace = tracing.start(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            tracing.stop()
+
+        report(request, response, trace)
+        return response
+
+
+def report(request, response, trace):
+    """Check and report the backend calls of a request recorded in
+    trace, as TracingMiddleware does once the request is handled."""
+    if not trace.spans:
+        return
+    if budget.enabled():
+        budget.check(request, trace)
+    if _shows_server_timing(request):
+        response['Server-Timing'] = server_timing(trace)
+
+    threshold = getattr(settings, 'API_TRACING_LOG_THRESHOLD',
+                        DEFAULT_API_TRACING_LOG_THRESHOLD)
+    if _ms(trace.total) >= threshold:
+        slowest = trace.slowest
+        LOG.info("%s %s %s: %d backend calls in %s ms, slowest "
+                 "%s %s in %s ms (region %s, %s)",
+                 request.method, request.path, response.status_code,
+                 len(trace.spans), _ms(trace.total), slowest.service,
+                 slowest.operation, _ms(slowest.duration),
+                 slowest.region, slowest.outcome)
+        if LOG.isEnabledFor(logging.DEBUG):
+            for span in trace.spans:
+                LOG.debug("%s %s %s in %s ms, %s bytes (region %s)",
+                          span.service, span.operation, span.outcome,
+                          _ms(span.duration), span.bytes, span.region)
+
+
+def _endpoint(request):
+    """Return the metric name prefix and the endpoint label of the view
+    that handled a request, or None."""
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return None
+    view_class = getattr(match.func, 'view_class', None)
+    if view_class is not None and \
+            view_class.__module__.startswith(_REST_MODULE_PREFIX):
+        return 'rest', '%s.%s' % (view_class.__module__[
+            len(_REST_MODULE_PREFIX):], view_class.__name__)
+    return 'view', match.view_name or match._func_path
+
+
+class MetricsMiddleware(object):
+    """Measure the requests of each Horizon view and REST API endpoint.
+
+    The metrics are served by the stx/metrics/ REST API endpoint.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not metrics.enabled():
+            return self.get_response(request)
+
+        started = time.monotonic()
+        response = self.get_response(request)
+        observe(request, response.status_code, time.monotonic() - started)
+        metrics.flush()
+        return response
+
+
+def observe(request, status_code, seconds):
+    """Record a request handled in seconds in the metrics of its view or
+    REST API endpoint, as MetricsMiddleware does."""
+    endpoint = _endpoint(request)
+    if endpoint is None:
+        return
+    kind, name = endpoint
+    metrics.observe('%s_duration_seconds' % kind, seconds,
+                    endpoint=name, method=request.method)
+    if status_code >= 500:
+        metrics.inc('%s_errors_total' % kind, endpoint=name,
+                    method=request.method)
@@ -16,10 +16,11 @@
     '$q',
     'horizon.framework.util.http.service',
     'horizon.framework.widgets.toast.service',
-    '$http'
+    '$http',
+    'horizon.app.core.openstack-service-api.batch'
   ];
 
-  function FmAPI($q, apiService, toastService, $http) {
+  function FmAPI($q, apiService, toastService, $http, batch) {
     var service = {
       getAlarmSummary: getAlarmSummary,
       getAlarms: getAlarms,
@@ -38,15 +39,19 @@
     // Alarms
 
     function getAlarmSummary() {
-      return apiService.get('/api/fm/alarm_summary/')
+      return batch.get('/api/fm/alarm_summary/')
         .error(function () {
           toastService.clearErrors();
           toastService.add('error', gettext("Unable to retrieve alarm summary."));
         });
     }
 
-    function getAlarms() {
-      var results = apiService.get('/api/fm/alarm_list/')
+    /**
+     * params.fields limits the fields returned for each alarm, e.g.
+     * {fields: 'uuid,severity'}.
+     */
+    function getAlarms(params) {
+      var results = batch.get('/api/fm/alarm_list/', {params: params})
       return results
         .error(function () {
           toastService.clearErrors();
@@ -66,8 +71,12 @@
     ///////////////////////////////
     // Events
 
-    function getEvents() {
-      var results = apiService.get('/api/fm/event_log_list/')
+    /**
+     * params.fields limits the fields returned for each event, e.g.
+     * {fields: 'uuid,state'}.
+     */
+    function getEvents(params) {
+      var results = batch.get('/api/fm/event_log_list/', {params: params})
       return results
         .error(function () {
           toastService.clearErrors();
@@ -0,0 +1,126 @@
+/**
+ *  Copyright (c) 2026 Wind River Systems, Inc.
+ *
+ *  SPDX-License-Identifier: Apache-2.0
+ *
+ */
+
+(function () {
+  'use strict';
+
+  angular
+    .module('horizon.app.core.openstack-service-api')
+    .factory('horizon.app.core.openstack-service-api.batch', BatchAPI);
+
+  BatchAPI.$inject = [
+    '$q',
+    '$timeout',
+    'horizon.framework.util.http.service',
+    'horizon.app.core.openstack-service-api.conditionalGet'
+  ];
+
+  function BatchAPI($q, $timeout, apiService, conditionalGet) {
+    var service = {
+      get: get
+    };
+
+    // GETs queued during the current tick
+    var queue = [];
+
+    return service;
+
+    /**
+     * @name get
+     * @description
+     * GET a starlingx REST API URL. The GETs made during the same tick
+     * are sent together through /api/stx/batch/, paying the session load
+     * and authentication once; a lone GET is sent as is.
+     * @param {string} url The URL, e.g. '/api/fm/alarm_summary/'.
+     * @param {object} config Optional, only config.params is used.
+     * @returns {Object} A promise with the success and error methods of
+     * the $http ones.
+     */
+    function get(url, config) {
+      var deferred = $q.defer();
+      queue.push({url: url, params: config && config.params, deferred: deferred});
+      if (queue.length === 1) {
+        $timeout(flush);
+      }
+      return withCallbacks(deferred.promise);
+    }
+
+    function flush() {
+      var items = queue;
+      queue = [];
+
+      if (items.length === 1) {
+        apiService.get(items[0].url, {params: items[0].params})
+          .then(items[0].deferred.resolve, items[0].deferred.reject);
+        return;
+      }
+
+      apiService.post('/api/stx/batch/', {requests: items.map(toRequest)})
+        .then(function (response) {
+          response.data.responses.forEach(function (sub, index) {
+            settle(items[index], sub);
+          });
+        }, function (rejection) {
+          items.forEach(function (item) {
+            item.deferred.reject(rejection);
+          });
+        });
+    }
+
+    function toRequest(item) {
+      var last = conditionalGet.lookup(item.url, item.params);
+      return {url: item.url, params: item.params, etag: last && last.etag};
+    }
+
+    function settle(item, sub) {
+      var response = {
+        data: sub.data,
+        status: sub.status,
+        headers: headers,
+        config: {method: 'GET', url: item.url, params: item.params}
+      };
+      var last = conditionalGet.lookup(item.url, item.params);
+
+      if (sub.status === 304 && last) {
+        response.status = 200;
+        response.data = last.data;
+        response.notModified = true;
+      }
+      else if (sub.etag && sub.status >= 200 && sub.status < 300) {
+        conditionalGet.store(item.url, item.params, sub.etag, sub.data);
+      }
+
+      if (response.status >= 200 && response.status < 300) {
+        item.deferred.resolve(response);
+      }
+      else {
+        item.deferred.reject(response);
+      }
+
+      function headers(name) {
+        var values = {etag: sub.etag};
+        return name ? values[name.toLowerCase()] : values;
+      }
+    }
+
+    function withCallbacks(promise) {
+      promise.success = function (fn) {
+        promise.then(function (response) {
+          fn(response.data, response.status, response.headers, response.config);
+        });
+        return promise;
+      };
+      promise.error = function (fn) {
+        promise.then(null, function (response) {
+          fn(response.data, response.status, response.headers, response.config);
+        });
+        return promise;
+      };
+      return promise;
+    }
+  }
+}());
@@ -0,0 +1,48 @@
+/**
+ *  Copyright (c) 2026 Wind River Systems, Inc.
+ *
+ *  SPDX-License-Identifier: Apache-2.0
+ *
+ */
+(function() {
+  "use strict";
+
+  describe('Batch API service', function() {
+    var service, $httpBackend, $timeout;
+    beforeEach(module('horizon.framework'));
+    beforeEach(module('horizon.app.core.openstack-service-api'));
+    beforeEach(inject(function($injector) {
+      service = $injector.get('horizon.app.core.openstack-service-api.batch');
+      $httpBackend = $injector.get('$httpBackend');
+      $timeout = $injector.get('$timeout');
+    }));
+
+    it("sends the GETs of a tick in one batch", function() {
+      var summary, system;
+      $httpBackend.expectPOST('/api/stx/batch/', function(body) {
+        return angular.fromJson(body).requests.length === 2;
+      }).respond(200, {responses: [
+        {status: 200, data: {critical: 1}},
+        {status: 404, data: 'not found'}
+      ]});
+      service.get('/api/fm/alarm_summary/').success(function(data) {
+        summary = data;
+      });
+      service.get('/api/sysinv/system/').error(function(data, status) {
+        system = status;
+      });
+      $timeout.flush();
+      $httpBackend.flush();
+
+      expect(summary.critical).toBe(1);
+      expect(system).toBe(404);
+    });
+
+    it("sends a lone GET as is", function() {
+      $httpBackend.expectGET('/api/fm/alarm_summary/').respond(200, {});
+      service.get('/api/fm/alarm_summary/');
+      $timeout.flush();
+      $httpBackend.flush();
+    });
+  });
+})();
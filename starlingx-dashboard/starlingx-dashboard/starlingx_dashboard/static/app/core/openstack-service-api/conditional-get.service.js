@@ -0,0 +1,120 @@
+/**
+ *  Copyright (c) 2026 Wind River Systems, Inc.
+ *
+ *  SPDX-License-Identifier: Apache-2.0
+ *
+ */
+
+(function () {
+  'use strict';
+
+  /**
+   * Revalidate the GET requests of the REST API.
+   *
+   * The last response carrying an ETag is kept for each URL and query
+   * string; the next GET of the same URL is sent with If-None-Match, and a
+   * 304 answer is turned back into the kept response, flagged with
+   * notModified. Polls of unchanged data then cost a few hundred bytes.
+   * Only the MAX_RESPONSES most recently stored responses are kept.
+   */
+  angular
+    .module('horizon.app.core.openstack-service-api')
+    .factory('horizon.app.core.openstack-service-api.conditionalGet', ConditionalGet)
+    .config(config);
+
+  config.$inject = ['$httpProvider'];
+
+  function config($httpProvider) {
+    $httpProvider.interceptors.push('horizon.app.core.openstack-service-api.conditionalGet');
+  }
+
+  ConditionalGet.$inject = [
+    '$q',
+    '$httpParamSerializer'
+  ];
+
+  function ConditionalGet($q, $httpParamSerializer) {
+    // Number of responses kept, the least recently stored being dropped
+    var MAX_RESPONSES = 50;
+
+    // Last response with an ETag, by URL, in the order they were stored
+    var responses = {};
+    var keys = [];
+
+    var service = {
+      request: request,
+      response: response,
+      responseError: responseError,
+      lookup: lookup,
+      store: store
+    };
+
+    return service;
+
+    function keyFor(url, params) {
+      var query = $httpParamSerializer(params);
+      return query ? url + '?' + query : url;
+    }
+
+    function cacheKey(config) {
+      if (config.method !== 'GET' || config.url.indexOf('/api/') === -1) {
+        return null;
+      }
+      return keyFor(config.url, config.params);
+    }
+
+    /**
+     * Return the last response with an ETag of a GET, as {etag, data},
+     * for requests not sent through $http (e.g. batched ones).
+     */
+    function lookup(url, params) {
+      return responses[keyFor(url, params)];
+    }
+
+    function store(url, params, etag, data) {
+      put(keyFor(url, params), etag, data);
+    }
+
+    function put(key, etag, data) {
+      var index = keys.indexOf(key);
+      if (index !== -1) {
+        keys.splice(index, 1);
+      }
+      keys.push(key);
+      responses[key] = {etag: etag, data: data};
+      while (keys.length > MAX_RESPONSES) {
+        delete responses[keys.shift()];
+      }
+    }
+
+    function request(config) {
+      var key = cacheKey(config);
+      if (key && responses[key]) {
+        config.headers = config.headers || {};
+        config.headers['If-None-Match'] = responses[key].etag;
+      }
+      return config;
+    }
+
+    function response(result) {
+      var key = cacheKey(result.config);
+      var etag = result.headers('ETag');
+      if (key && etag) {
+        put(key, etag, result.data);
+      }
+      return result;
+    }
+
+    function responseError(rejection) {
+      var key = rejection.status === 304 ? cacheKey(rejection.config) : null;
+      if (key && responses[key]) {
+        return angular.extend({}, rejection, {
+          status: 200,
+          data: responses[key].data,
+          notModified: true
+        });
+      }
+      return $q.reject(rejection);
+    }
+  }
+}());
@@ -0,0 +1,60 @@
+/**
+ *  Copyright (c) 2026 Wind River Systems, Inc.
+ *
+ *  SPDX-License-Identifier: Apache-2.0
+ *
+ */
+(function() {
+  "use strict";
+
+  describe('Conditional GET interceptor', function() {
+    var $http, $httpBackend;
+    beforeEach(module('horizon.app.core.openstack-service-api'));
+    beforeEach(inject(function($injector) {
+      $http = $injector.get('$http');
+      $httpBackend = $injector.get('$httpBackend');
+    }));
+
+    it("answers an unchanged GET with the last response", function() {
+      var data = {items: [{uuid: '123abc'}]};
+      var result;
+      $httpBackend.expectGET('/api/fm/alarm_list/?fields=uuid')
+        .respond(200, data, {ETag: 'W/"1"'});
+      $http.get('/api/fm/alarm_list/', {params: {fields: 'uuid'}});
+      $httpBackend.flush();
+
+      $httpBackend.expectGET('/api/fm/alarm_list/?fields=uuid', function(headers) {
+        return headers['If-None-Match'] === 'W/"1"';
+      }).respond(304, '');
+      $http.get('/api/fm/alarm_list/', {params: {fields: 'uuid'}})
+        .then(function(response) { result = response; });
+      $httpBackend.flush();
+
+      expect(result.notModified).toBe(true);
+      expect(result.data.items[0].uuid).toBe('123abc');
+    });
+
+    it("does not revalidate other URLs", function() {
+      $httpBackend.expectGET('/api/fm/alarm_list/')
+        .respond(200, {items: []}, {ETag: 'W/"1"'});
+      $http.get('/api/fm/alarm_list/');
+      $httpBackend.flush();
+
+      $httpBackend.expectGET('/api/fm/event_log_list/', function(headers) {
+        return angular.isUndefined(headers['If-None-Match']);
+      }).respond(200, {items: []});
+      $http.get('/api/fm/event_log_list/');
+      $httpBackend.flush();
+    });
+
+    it("only keeps the most recently stored responses", inject(function($injector) {
+      var conditionalGet = $injector.get(
+        'horizon.app.core.openstack-service-api.conditionalGet');
+      for (var i = 0; i < 51; i++) {
+        conditionalGet.store('/api/fm/alarm_get/' + i + '/', {}, 'W/"1"', {});
+      }
+      expect(conditionalGet.lookup('/api/fm/alarm_get/0/', {})).toBeUndefined();
+      expect(conditionalGet.lookup('/api/fm/alarm_get/50/', {}).etag).toBe('W/"1"');
+    }));
+  });
+})();
@@ -0,0 +1,134 @@
+/**
+ *  Copyright (c) 2026 Wind River Systems, Inc.
+ *
+ *  SPDX-License-Identifier: Apache-2.0
+ *
+ */
+
+(function () {
+  'use strict';
+
+  angular
+    .module('horizon.app.core.openstack-service-api')
+    .factory('horizon.app.core.openstack-service-api.poller', Poller);
+
+  Poller.$inject = [
+    '$q',
+    '$timeout',
+    '$document'
+  ];
+
+  /**
+   * Scheduler shared by the auto-refreshing widgets.
+   *
+   * A poll runs its task again once the previous run has ended, so slow
+   * requests never overlap. Polls are paused while the page is hidden and
+   * run as soon as it is shown again. The delay doubles, up to
+   * maxInterval, after a failed or slow run, and drops to
+   * transitionInterval while options.inTransition() is true.
+   */
+  function Poller($q, $timeout, $document) {
+    var service = {
+      start: start
+    };
+
+    // Polls paused while the page is hidden
+    var paused = [];
+
+    $document.on('visibilitychange', function () {
+      if (!$document[0].hidden) {
+        paused.splice(0).forEach(function (poll) {
+          $timeout(poll.run);
+        });
+      }
+    });
+
+    return service;
+
+    /**
+     * @name start
+     * @description
+     * Run task every options.interval milliseconds.
+     * @param {function} task Returns a promise (or a thenable, such as a
+     * jQuery XHR) of the refresh.
+     * @param {object} options interval (required), and optionally
+     * transitionInterval (default interval / 4), maxInterval (default
+     * interval * 8), slowThreshold, the duration in milliseconds above
+     * which a run is slow (default interval / 2), inTransition, a
+     * function telling whether items are in transition, and immediate,
+     * to run the task right away.
+     * @returns {Object} The poll, with stop() and run() methods.
+     */
+    function start(task, options) {
+      var poll = {
+        run: run,
+        stop: stop
+      };
+      var delay = options.interval;
+      var timer = null;
+      var running = false;
+      var stopped = false;
+
+      if (options.immediate) {
+        run();
+      }
+      else {
+        schedule(delay);
+      }
+      return poll;
+
+      function interval(name, fallback) {
+        return angular.isDefined(options[name]) ? options[name] : fallback;
+      }
+
+      function schedule(ms) {
+        $timeout.cancel(timer);
+        timer = stopped ? null : $timeout(run, ms);
+      }
+
+      function run() {
+        // Skip the tick while a run is in flight
+        if (stopped || running) {
+          return;
+        }
+        $timeout.cancel(timer);
+        if ($document[0].hidden) {
+          if (paused.indexOf(poll) === -1) {
+            paused.push(poll);
+          }
+          return;
+        }
+
+        var started = Date.now();
+        running = true;
+        $q.when(task()).then(function () {
+          var slow = Date.now() - started >
+            interval('slowThreshold', options.interval / 2);
+          delay = slow ? backOff() : options.interval;
+        }, function () {
+          delay = backOff();
+        }).finally(function () {
+          running = false;
+          var inTransition = options.inTransition && options.inTransition();
+          schedule(inTransition ?
+            Math.min(delay, interval('transitionInterval', options.interval / 4)) :
+            delay);
+        });
+      }
+
+      function backOff() {
+        return Math.min(delay * 2, interval('maxInterval', options.interval * 8));
+      }
+
+      function stop() {
+        stopped = true;
+        $timeout.cancel(timer);
+        timer = null;
+        var index = paused.indexOf(poll);
+        if (index !== -1) {
+          paused.splice(index, 1);
+        }
+      }
+    }
+  }
+}());
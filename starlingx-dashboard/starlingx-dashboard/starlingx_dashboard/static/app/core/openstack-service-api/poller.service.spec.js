@@ -0,0 +1,55 @@
+/**
+ *  Copyright (c) 2026 Wind River Systems, Inc.
+ *
+ *  SPDX-License-Identifier: Apache-2.0
+ *
+ */
+(function() {
+  "use strict";
+
+  describe('Poller service', function() {
+    var service, $q, $rootScope, $timeout, task, fail;
+    beforeEach(module('horizon.app.core.openstack-service-api'));
+    beforeEach(inject(function($injector) {
+      service = $injector.get('horizon.app.core.openstack-service-api.poller');
+      $q = $injector.get('$q');
+      $rootScope = $injector.get('$rootScope');
+      $timeout = $injector.get('$timeout');
+      fail = false;
+      task = jasmine.createSpy('task').and.callFake(function() {
+        return fail ? $q.reject() : $q.when();
+      });
+    }));
+
+    it("runs the task at the interval", function() {
+      var poll = service.start(task, {interval: 1000});
+      $timeout.flush(999);
+      expect(task).not.toHaveBeenCalled();
+      $timeout.flush(1);
+      $timeout.flush(1000);
+      expect(task.calls.count()).toBe(2);
+      poll.stop();
+      $timeout.flush(5000);
+      expect(task.calls.count()).toBe(2);
+    });
+
+    it("backs off after errors", function() {
+      fail = true;
+      service.start(task, {interval: 1000});
+      $timeout.flush(1000);
+      expect(task.calls.count()).toBe(1);
+      $timeout.flush(1999);
+      expect(task.calls.count()).toBe(1);
+      $timeout.flush(1);
+      expect(task.calls.count()).toBe(2);
+    });
+
+    it("speeds up while items are in transition", function() {
+      service.start(task, {interval: 1000, immediate: true,
+                           inTransition: function() { return true; }});
+      $rootScope.$apply();
+      $timeout.flush(250);
+      expect(task.calls.count()).toBe(2);
+    });
+  });
+})();
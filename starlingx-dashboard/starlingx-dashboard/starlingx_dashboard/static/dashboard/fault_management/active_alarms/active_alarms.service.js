@@ -48,6 +48,13 @@
 
     var showSuppressColumn = null;
 
+    // Fields of the alarms shown or filtered on in the table; the drawer
+    // loads the remaining fields of an alarm when it is opened.
+    var LIST_FIELDS = [
+      'uuid', 'alarm_id', 'reason_text', 'entity_instance_id', 'severity',
+      'suppression_status', 'timestamp', 'mgmt_affecting'
+    ];
+
     return {
       getPromise: getPromise,
       urlFunction: urlFunction,
@@ -57,11 +64,15 @@
 
 
     function getPromise(params) {
-      return api.getAlarms(params).then(modifyResponse);
+      return api.getAlarms(angular.extend({}, params, {fields: LIST_FIELDS.join(',')}))
+        .then(modifyResponse);
     }
 
     function modifyResponse(response) {
-      return {data: {items: response.data.items.map(modifyItem)}};
+      return {
+        data: {items: response.data.items.map(modifyItem)},
+        notModified: response.notModified
+      };
 
       function modifyItem(item) {
 
@@ -0,0 +1,47 @@
+/**
+ * Copyright (c) 2026 Wind River Systems, Inc.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ *
+ */
+
+(function() {
+  "use strict";
+
+  angular
+    .module('horizon.dashboard.fault_management.events')
+    .controller('horizon.dashboard.fault_management.events.DrawerController', controller);
+
+  controller.$inject = [
+    '$scope',
+    'horizon.app.core.openstack-service-api.fm'
+  ];
+
+  /*
+   * The event table only holds the fields of its columns; the other
+   * fields shown in the drawer are loaded with the drawer, once per event.
+   * They are kept on the row item, and merged with its latest fields
+   * whenever the table refreshes it.
+   */
+  function controller($scope, api) {
+    var ctrl = this;
+    ctrl.item = $scope.item;
+
+    $scope.$watch('item', function(item) {
+      ctrl.item = item;
+      if (!item) {
+        return;
+      }
+      if (!item.$details) {
+        item.$details = api.getEvent(item.uuid).then(function(response) {
+          return response.data;
+        });
+      }
+      item.$details.then(function(details) {
+        if ($scope.item === item) {
+          ctrl.item = angular.extend({}, details, item);
+        }
+      });
+    });
+  }
+})();
@@ -47,6 +47,13 @@
 
     var showSuppressColumn = null;
 
+    // Fields of the events shown, filtered on or downloaded from the table;
+    // the drawer loads the remaining fields of an event when it is opened.
+    var LIST_FIELDS = [
+      'uuid', 'timestamp', 'state', 'event_log_id', 'reason_text',
+      'entity_instance_id', 'suppression_status', 'severity'
+    ];
+
     return {
       getPromise: getPromise,
       suppressColAllowedPromiseFunction: suppressColAllowedPromiseFunction,
@@ -55,11 +62,15 @@
     };
 
     function getPromise(params) {
-      return api.getEvents(params).then(modifyResponse);
+      return api.getEvents(angular.extend({}, params, {fields: LIST_FIELDS.join(',')}))
+        .then(modifyResponse);
     }
 
     function modifyResponse(response) {
-      return {data: {items: response.data.items.map(modifyItem)}};
+      return {
+        data: {items: response.data.items.map(modifyItem)},
+        notModified: response.notModified
+      };
 
       function modifyItem(item) {
         var timestamp = item.updated_at ? item.updated_at : item.created_at;
@@ -44,6 +44,23 @@
         expect(api.getEvents).toHaveBeenCalled();
         expect(result.$$state.value.data.items[0].reason_text).toBe('resource1');
       }));
+
+      it("requests only the fields used by the table", inject(function($q, $injector) {
+        var api = $injector.get('horizon.app.core.openstack-service-api.fm');
+        spyOn(api, 'getEvents').and.returnValue($q.defer().promise);
+        service.getPromise({});
+        var fields = api.getEvents.calls.argsFor(0)[0].fields.split(',');
+        expect(fields).toContain('uuid');
+        expect(fields).toContain('reason_text');
+        expect(fields).not.toContain('proposed_repair_action');
+      }));
+
+      it("passes the table parameters on", inject(function($q, $injector) {
+        var api = $injector.get('horizon.app.core.openstack-service-api.fm');
+        spyOn(api, 'getEvents').and.returnValue($q.defer().promise);
+        service.getPromise({sort_key: 'timestamp'});
+        expect(api.getEvents.calls.argsFor(0)[0].sort_key).toBe('timestamp');
+      }));
     });
 
   });
@@ -16,6 +16,7 @@
  *
  * Changes made:
  * - Added auto-refresh functionality
+ * - Moved the auto-refresh to the shared poller service
  */
 (function() {
   'use strict';
@@ -27,32 +28,33 @@
   controller.$inject = [
     '$q',
     '$scope',
-    '$interval',
     'horizon.framework.widgets.table.events',
     'horizon.framework.widgets.magic-search.events',
     'horizon.framework.widgets.magic-search.service',
     'horizon.framework.util.actions.action-result.service',
     'horizon.framework.conf.resource-type-registry.service',
-    'horizon.app.core.openstack-service-api.settings'
+    'horizon.app.core.openstack-service-api.settings',
+    'horizon.framework.widgets.toast.service',
+    'horizon.app.core.openstack-service-api.poller'
   ];
 
   function controller(
     $q,
     $scope,
-    $interval,
     hzTableEvents,
     magicSearchEvents,
     searchService,
     actionResultService,
     registry,
     settings,
-    toastService
+    toastService,
+    poller
   ) {
     var ctrl = this;
 
     var lastSearchQuery = {};
-    var timerRunning = false;
-    var refreshInterval;
+    var listedParams;
+    var poll;
 
     // 'Public' Controller members
     ctrl.actionResultHandler = actionResultHandler;
@@ -70,16 +72,28 @@
       });
 
     $scope.$on('$destroy', function () {
-      if (refreshInterval) {
-        $interval.cancel(refreshInterval);
+      if (poll) {
+        poll.stop();
       }
     });
 
     function startAutoRefresh() {
-      if (refreshInterval) {
-        $interval.cancel(refreshInterval);
+      if (poll) {
+        poll.stop();
+      }
+      if (ctrl.ajaxPollInterval) {
+        poll = poller.start(listResources, {
+          interval: ctrl.ajaxPollInterval,
+          inTransition: itemsInTransition
+        });
       }
-      refreshInterval = $interval(listResources, ctrl.ajaxPollInterval);
+    }
+
+    function itemsInTransition() {
+      var inTransition = ctrl.resourceType &&
+        ctrl.resourceType.itemInTransitionFunction;
+      return Boolean(inTransition && angular.isArray(ctrl.itemsSrc) &&
+        ctrl.itemsSrc.some(inTransition));
     }
 
     // Watch for changes to search bar
@@ -179,14 +193,21 @@
      */
     function listResources() {
       if (ctrl.resourceType) {
-        ctrl.resourceType
-            .list(angular.extend({}, lastSearchQuery, ctrl.listFunctionExtraParams))
+        var params = angular.extend({}, lastSearchQuery, ctrl.listFunctionExtraParams);
+        return ctrl.resourceType
+            .list(params)
             .then(function (response) {
+              // Keep the table as is when nothing changed since it was listed
+              if (response.notModified && angular.equals(params, listedParams)) {
+                return;
+              }
+              listedParams = params;
               ctrl.itemsSrc = response.data.items;
             })
-            .catch(function () {
+            .catch(function (error) {
               toastService.add('error', gettext('Failed to load resources. Please try again.'));
               ctrl.itemsSrc = []; // Reset the items list in case of failure
+              return $q.reject(error);
         });
       }
     }
@@ -208,7 +229,6 @@
 
     function onLoad(response) {
       ctrl.itemsSrc = response.data.items;
-      timerRunning = false;
     }
 
     function actionResultHandler(returnValue) {
@@ -274,12 +294,8 @@
     }
 
     function itemInTransitionFunction(item) {
-      var itemInTransition = ctrl.resourceType.itemInTransitionFunction(item);
-      if (ctrl.ajaxPollInterval && itemInTransition && !timerRunning) {
-        timerRunning = true;
-        setTimeout(listResources, ctrl.ajaxPollInterval);
-      }
-      return itemInTransition;
+      // The poll speeds up while items are in transition
+      return ctrl.resourceType.itemInTransitionFunction(item);
     }
   }
 
@@ -0,0 +1,73 @@
+/**
+ *  Copyright (c) 2026 Wind River Systems, Inc.
+ *
+ *  SPDX-License-Identifier: Apache-2.0
+ *
+ */
+
+/* Refreshes the rows of the Distributed Cloud strategy steps table with one
+ * request for all the steps changed since the last refresh, rather than one
+ * request per step in transition. */
+horizon.dc_strategy_steps = {
+  // Interval at which the steps are refreshed while some are in transition
+  interval: 10000,
+  timer: null,
+
+  init: function () {
+    var self = horizon.dc_strategy_steps;
+    if (self.timer === null && $('#cloud-strategy-steps').length) {
+      self.schedule();
+      $(window).one('pagehide.dcstrategysteps', self.stop);
+    }
+  },
+
+  schedule: function () {
+    var self = horizon.dc_strategy_steps;
+    self.timer = setTimeout(self.refresh, self.interval);
+  },
+
+  stop: function () {
+    var self = horizon.dc_strategy_steps;
+    clearTimeout(self.timer);
+    self.timer = null;
+  },
+
+  refresh: function () {
+    var self = horizon.dc_strategy_steps;
+    var $steps = $('#cloud-strategy-steps');
+    self.timer = null;
+    if (!$steps.length) {
+      // The tab or the page is gone
+      return;
+    }
+    // As with the row updates of Horizon, only steps in transition are
+    // watched
+    if (!$steps.find('tr.status_unknown').length) {
+      self.schedule();
+      return;
+    }
+    $.ajax({
+      url: $steps.data('update-url'),
+      data: {marker: $steps.attr('data-marker')},
+      dataType: 'json',
+      success: function (data) {
+        $.each(data.rows, function (index, html) {
+          var $row = $(html);
+          var current = document.getElementById($row.attr('id'));
+          if (current) {
+            $(current).replaceWith($row);
+          }
+        });
+        $steps.attr('data-marker', data.marker);
+        $('#cloud-strategy-step-counts').text($.map(data.counts,
+          function (count) {
+            return count[0] + ': ' + count[1];
+          }).join(', '));
+      },
+      complete: self.schedule
+    });
+  }
+};
+
+horizon.addInitFunction(horizon.dc_strategy_steps.init);
+horizon.tabs.addTabLoadFunction(horizon.dc_strategy_steps.init);
@@ -14,6 +14,12 @@ horizon.host_topology = {
   zoom : null,
   network_index: {},
   reload_duration: 10000,
+  // Wait for angular to be bootstrapped at most injector_max_attempts
+  // times injector_wait milliseconds
+  injector_wait: 100,
+  injector_max_attempts: 50,
+  injector_timer: null,
+  poll: null,
   labels: true,
   detail_url: null,
   selected_entity: null,
@@ -131,20 +137,76 @@ horizon.host_topology = {
     this.$network_list = $('#network_list');
     this.$host_list = $('#host_list');
 
-    self.load_host_info();
+    self.start_polling();
   },
-  load_host_info:function(){
+  start_polling:function(attempt){
     var self = this;
+    attempt = attempt || 0;
+    self.stop_polling();
     if($('#hosttopology').length === 0) {
       return;
     }
-    $.getJSON($('#hosttopology').data('hosttopology') + '?' + $.now(),
+    // Refresh through the poller shared with the angular widgets once
+    // angular is bootstrapped, or on a plain timer if it never is
+    var injector = angular.element(document.body).injector();
+    if (!injector && attempt < self.injector_max_attempts) {
+      self.injector_timer = setTimeout(function(){
+        self.start_polling(attempt + 1);
+      }, self.injector_wait);
+      return;
+    }
+    var task = function() {
+      // Stop once the topology is no longer part of the page
+      if($('#hosttopology').length === 0) {
+        self.stop_polling();
+        return null;
+      }
+      return self.load_host_info();
+    };
+    if (injector) {
+      self.poll = injector.get('horizon.app.core.openstack-service-api.poller')
+        .start(task, {interval: self.reload_duration, immediate: true});
+    } else {
+      self.poll = self.start_timer(task);
+    }
+    $(window).off('pagehide.hosttopology').on('pagehide.hosttopology',
+      function() {
+        self.stop_polling();
+      });
+  },
+  start_timer:function(task){
+    var self = this;
+    var timer = null;
+    var stopped = false;
+    var run = function() {
+      $.when(task()).always(function() {
+        if (!stopped) {
+          timer = setTimeout(run, self.reload_duration);
+        }
+      });
+    };
+    run();
+    return {
+      stop: function() {
+        stopped = true;
+        clearTimeout(timer);
+      }
+    };
+  },
+  stop_polling:function(){
+    clearTimeout(this.injector_timer);
+    this.injector_timer = null;
+    if (this.poll) {
+      this.poll.stop();
+      this.poll = null;
+    }
+  },
+  load_host_info:function(){
+    var self = this;
+    return $.getJSON($('#hosttopology').data('hosttopology') + '?' + $.now(),
       function(data) {
         self.model = data;
         self.data_convert();
-        setTimeout(function(){
-          self.load_host_info();
-        }, self.reload_duration);
       }
     );
   },
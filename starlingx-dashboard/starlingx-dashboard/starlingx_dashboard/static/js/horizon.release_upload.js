@@ -0,0 +1,25 @@
+/**
+ *  Copyright (c) 2026 Wind River Systems, Inc.
+ *
+ *  SPDX-License-Identifier: Apache-2.0
+ *
+ */
+
+horizon.addInitFunction(function () {
+  // Release uploads carry their CSRF token in the X-CSRFToken header, which
+  // the server can check before reading the request body: the release files
+  // are then streamed to USM as they are received, instead of being staged
+  // on disk first.
+  $.ajaxPrefilter(function (options, originalOptions, xhr) {
+    var data = options.data;
+    var type = String(options.type).toUpperCase();
+    if (type !== 'POST' || typeof FormData === 'undefined' ||
+        !(data instanceof FormData) || !data.has('release_files')) {
+      return;
+    }
+    var token = data.get('csrfmiddlewaretoken');
+    if (token) {
+      xhr.setRequestHeader('X-CSRFToken', token);
+    }
+  });
+});
@@ -0,0 +1,99 @@
+/**
+ *  Copyright (c) 2026 Wind River Systems, Inc.
+ *
+ *  SPDX-License-Identifier: Apache-2.0
+ *
+ */
+
+/* Completes the subcloud names typed in the fields of large fleets, which
+ * get a text input rather than a select (see set_subcloud_choices), and
+ * switches the fields depending on the subcloud picked, as Horizon does for
+ * switchable selects. */
+horizon.subcloud_typeahead = {
+  // Delay after the last key typed before names are looked up
+  delay: 250,
+
+  init: function (container) {
+    $(container).find('input[data-typeahead-url]')
+      .each(horizon.subcloud_typeahead.setup);
+  },
+
+  setup: function () {
+    var self = horizon.subcloud_typeahead;
+    var $input = $(this);
+    if ($input.attr('list')) {
+      return;
+    }
+    var list_id = $input.attr('id') + '_names';
+    var $list = $('<datalist>').attr('id', list_id).insertAfter($input);
+    var timer = null;
+    $input.attr('list', list_id).on('input', function () {
+      clearTimeout(timer);
+      timer = setTimeout(function () {
+        self.complete($input, $list);
+      }, self.delay);
+    });
+
+    if ($input.data('slug')) {
+      $input.on('input change', function () {
+        self.switchFields($input);
+      });
+      // Fields switched on the input follow the switchable fields it
+      // depends on, once Horizon has shown or hidden it
+      $input.closest('form').on('change', '.switchable', function () {
+        setTimeout(function () {
+          self.switchFields($input);
+        }, 0);
+      });
+      self.switchFields($input);
+    }
+  },
+
+  complete: function ($input, $list) {
+    $.getJSON($input.data('typeahead-url'), {q: $input.val()},
+      function (data) {
+        $list.empty();
+        if ($input.data('default-label')) {
+          $list.append($('<option>').attr('value',
+                                           $input.data('default-label')));
+        }
+        $.each(data.items, function (index, name) {
+          $list.append($('<option>').attr('value', name));
+        });
+      });
+  },
+
+  // The choice made with the input: its default value when it is empty or
+  // shows the default label, or else the name typed
+  value: function ($input) {
+    var text = $.trim($input.val());
+    if (!text || text === String($input.data('default-label'))) {
+      return $input.data('default-value');
+    }
+    return text;
+  },
+
+  switchFields: function ($input) {
+    var slug = $input.data('slug');
+    var value = horizon.subcloud_typeahead.value($input);
+    var visible = $input.is(':visible');
+    $input.closest('form')
+      .find('.switched[data-switch-on*="' + slug + '"]')
+      .each(function () {
+        var $field = $(this);
+        var $group = $field.closest('.form-group');
+        var label = $field.data(slug + '-' + value);
+        if (visible && label !== undefined && label !== null) {
+          $group.find('label[for="' + $field.attr('id') + '"]').html(label);
+          $group.show();
+        } else {
+          $group.hide();
+        }
+      });
+  }
+};
+
+horizon.addInitFunction(function () {
+  horizon.subcloud_typeahead.init(document);
+});
+horizon.modals.addModalInitFunction(horizon.subcloud_typeahead.init);
@@ -6,10 +6,15 @@
 
 import netaddr
 
-from dcmanagerclient.api.v1 import client
 from django import template
 from openstack_dashboard.api import base
 
+from starlingx_dashboard.utils import lazy
+
+# Imported when a subcloud URL is first aligned, rather than with the
+# template tags
+client = lazy.module('dcmanagerclient.api.v1.client')
+
 register = template.Library()
 AUTH_PORT = '5000'
 
@@ -0,0 +1,167 @@
+#
+#  Copyright (c) 2026 Wind River Systems, Inc.
+#
+#  SPDX-License-Identifier: Apache-2.0
+#
+
+import collections
+from concurrent import futures
+import logging
+import time
+
+from django.conf import settings
+
+LOG = logging.getLogger(__name__)
+
+# Default number of items acted upon concurrently by a bulk action
+DEFAULT_BULK_MAX_PARALLEL = 10
+
+# Default number of seconds to wait for a single item of a bulk action
+DEFAULT_BULK_ITEM_TIMEOUT = 120
+
+# Default number of items above which a bulk action is run as a background
+# job instead of within the request
+DEFAULT_BULK_JOB_THRESHOLD = 20
+
+# How often pending items are checked against their timeout
+_POLL_INTERVAL = 0.5
+
+
+class BulkTimeout(Exception):
+    """Given in place of the result of an item that did not finish in
+    time.  The item is still in progress, and may yet succeed."""
+
+    def __init__(self, timeout):
+        super(BulkTimeout, self).__init__(
+            "Operation still in progress after %d seconds" % timeout)
+
+
+class BulkNotStarted(Exception):
+    """Given in place of the result of an item that was not started,
+    because items of an earlier wave were still in progress."""
+
+    def __init__(self):
+        super(BulkNotStarted, self).__init__(
+            "Operation not started, as operations it must follow are "
+            "still in progress")
+
+
+BulkResult = collections.namedtuple('BulkResult', ['item', 'value', 'error'])
+
+
+def get_max_parallel():
+    return max(1, int(getattr(settings, 'BULK_ACTION_MAX_PARALLEL',
+                              DEFAULT_BULK_MAX_PARALLEL)))
+
+
+def get_item_timeout():
+    return getattr(settings, 'BULK_ACTION_ITEM_TIMEOUT',
+                   DEFAULT_BULK_ITEM_TIMEOUT)
+
+
+def get_job_threshold():
+    return getattr(settings, 'BULK_ACTION_JOB_THRESHOLD',
+                   DEFAULT_BULK_JOB_THRESHOLD)
+
+
+def _group_waves(items, order_key):
+    indexed = list(enumerate(items))
+    if order_key is None:
+        return [indexed]
+    waves = {}
+    for index, item in indexed:
+        waves.setdefault(order_key(item), []).append((index, item))
+    return [waves[key] for key in sorted(waves)]
+
+
+def _log_late_result(future):
+    # The outcome of an item reported as still in progress
+    if future.exception() is not None:
+        LOG.error("Bulk action failed after its timeout: %s",
+                  future.exception())
+    else:
+        LOG.info("Bulk action completed after its timeout")
+
+
+def _run_wave(executor, func, wave, timeout, results):
+    """Run the items of wave, and return whether some are still in
+    progress after their timeout."""
+    started = {}
+
+    def _call(index, item):
+        started[index] = time.monotonic()
+        return func(item)
+
+    pending = {executor.submit(_call, index, item): (index, item)
+               for index, item in wave}
+    running = False
+    while pending:
+        done, _not_done = futures.wait(
+            pending, timeout=_POLL_INTERVAL,
+            return_when=futures.FIRST_COMPLETED)
+        for future in done:
+            index, item = pending.pop(future)
+            try:
+                results[index] = BulkResult(item, future.result(), None)
+            except Exception as ex:
+                results[index] = BulkResult(item, None, ex)
+
+        if not timeout:
+            continue
+        now = time.monotonic()
+        for future, (index, item) in list(pending.items()):
+            start = started.get(index)
+            if start is not None and now - start > timeout:
+                # The worker thread cannot be interrupted; stop waiting on
+                # it, report the item as still in progress and log its
+                # outcome once it is known.
+                LOG.warning("Bulk action still in progress after %ss",
+                            timeout)
+                pending.pop(future)
+                results[index] = BulkResult(item, None, BulkTimeout(timeout))
+                future.add_done_callback(_log_late_result)
+                running = True
+    return running
+
+
+def run_bulk(func, items, max_parallel=None, timeout=None, order_key=None):
+    """Call func(item) for every item with bounded parallelism.
+
+    Items are split into waves by order_key; waves are run one after the
+    other in ascending key order, and the items within a wave are run
+    concurrently using at most max_parallel threads.  An item that does
+    not complete within timeout seconds of starting is reported with a
+    BulkTimeout error, as still in progress; the waves after it are then
+    not started, and their items are reported with a BulkNotStarted
+    error.
+
+    func is called in other threads: it must not use the request of the
+    caller, but a copy made by subrequest.copy_request(), and leave the
+    reporting of errors to the caller.
+
+    :returns: a list of BulkResult, in the same order as items.
+    """
+    items = list(items)
+    if not items:
+        return []
+    if max_parallel is None:
+        max_parallel = get_max_parallel()
+    if timeout is None:
+        timeout = get_item_timeout()
+
+    results = {}
+    executor = futures.ThreadPoolExecutor(
+        max_workers=min(max_parallel, len(items)))
+    try:
+        running = False
+        for wave in _group_waves(items, order_key):
+            if running:
+                for index, item in wave:
+                    results[index] = BulkResult(item, None, BulkNotStarted())
+                continue
+            running = _run_wave(executor, func, wave, timeout, results)
+    finally:
+        # Items still in progress after their timeout keep their thread
+        executor.shutdown(wait=False)
+
+    return [results[index] for index in range(len(items))]
@@ -0,0 +1,58 @@
+#
+#  Copyright (c) 2026 Wind River Systems, Inc.
+#
+#  SPDX-License-Identifier: Apache-2.0
+#
+
+from concurrent import futures
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+from starlingx_dashboard.utils import metrics
+from starlingx_dashboard.utils import subrequest
+
+LOG = logging.getLogger(__name__)
+
+# Default number of seconds form choices are reused
+DEFAULT_CHOICES_CACHE_TTL = 30
+
+_CHOICES_KEY = 'stx-choices-%s-%s.%s'
+
+
+def _key(request, loader):
+    return _CHOICES_KEY % (getattr(request.user, 'services_region', None),
+                           loader.__module__, loader.__name__)
+
+
+def load(request, loaders):
+    """Return the values of loader(request) for each loader.
+
+    Values are shared by all users of a region for CHOICES_CACHE_TTL
+    seconds, so loaders must return plain (picklable) data such as lists
+    of names.  Values missing from the cache are loaded concurrently,
+    each on behalf of its own copy of the request; an
+    exception raised by a loader is raised again here.
+
+    :returns: a list of values, in the same order as loaders.
+    """
+    ttl = getattr(settings, 'CHOICES_CACHE_TTL', DEFAULT_CHOICES_CACHE_TTL)
+    keys = [_key(request, loader) for loader in loaders]
+    values = cache.get_many(keys) if ttl else {}
+
+    missing = [(key, loader) for key, loader in zip(keys, loaders)
+               if key not in values]
+    for key in keys:
+        metrics.cache('choices', key in values)
+    if missing:
+        with futures.ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            pending = [(key, executor.submit(
+                loader, subrequest.copy_request(request)))
+                for key, loader in missing]
+        loaded = {key: future.result() for key, future in pending}
+        if ttl:
+            cache.set_many(loaded, ttl)
+        values.update(loaded)
+
+    return [values[key] for key in keys]
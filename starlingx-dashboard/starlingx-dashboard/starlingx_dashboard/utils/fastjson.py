@@ -0,0 +1,148 @@
+#
+#  Copyright (c) 2026 Wind River Systems, Inc.
+#
+#  SPDX-License-Identifier: Apache-2.0
+#
+
+import gzip
+import json
+import logging
+import zlib
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django import http
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+LOG = logging.getLogger(__name__)
+
+# Default number of items of a list above which a response is streamed
+DEFAULT_JSON_STREAM_MIN_ITEMS = 500
+
+# Default number of list items encoded in each chunk of a streamed response
+DEFAULT_JSON_STREAM_CHUNK_ITEMS = 200
+
+# Default size, in bytes, above which a response is gzipped
+DEFAULT_JSON_GZIP_MIN_SIZE = 16384
+
+_django_encoder = DjangoJSONEncoder()
+
+
+def dumps(data):
+    """Encode data as UTF-8 JSON.
+
+    orjson is used when installed; values it does not support natively
+    (dates, decimals, lazy translations...) are encoded as
+    DjangoJSONEncoder does, so that both encoders give the same result.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data, default=_django_encoder.default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+    return json.dumps(data, ensure_ascii=False,
+                      cls=DjangoJSONEncoder).encode('utf-8')
+
+
+def _iter_list(items, chunk_items):
+    yield b'['
+    for start in range(0, len(items), chunk_items):
+        if start:
+            yield b','
+        # Encode a slice of the list and drop its brackets
+        yield dumps(items[start:start + chunk_items])[1:-1]
+    yield b']'
+
+
+def iter_dumps(data, chunk_items=None):
+    """Encode data as UTF-8 JSON, chunk by chunk.
+
+    Lists, at the top level or as values of a top level dict, are encoded
+    chunk_items items at a time, so that the encoded document is never
+    held in memory at once.
+    """
+    if chunk_items is None:
+        chunk_items = getattr(settings, 'JSON_STREAM_CHUNK_ITEMS',
+                              DEFAULT_JSON_STREAM_CHUNK_ITEMS)
+    if isinstance(data, list):
+        yield from _iter_list(data, chunk_items)
+    elif isinstance(data, dict):
+        yield b'{'
+        for index, (key, value) in enumerate(data.items()):
+            yield (b',' if index else b'') + dumps(str(key)) + b':'
+            if isinstance(value, list):
+                yield from _iter_list(value, chunk_items)
+            else:
+                yield dumps(value)
+        yield b'}'
+    else:
+        yield dumps(data)
+
+
+def _count_items(data):
+    if isinstance(data, list):
+        return len(data)
+    if isinstance(data, dict):
+        return max([len(v) for v in data.values() if isinstance(v, list)],
+                   default=0)
+    return 0
+
+
+def _accepts_gzip(request):
+    return 'gzip' in request.META.get('HTTP_ACCEPT_ENCODING', '')
+
+
+def _iter_gzip(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _is_streamed(data):
+    return _count_items(data) > getattr(settings, 'JSON_STREAM_MIN_ITEMS',
+                                        DEFAULT_JSON_STREAM_MIN_ITEMS)
+
+
+def body_response(request, body, status=200,
+                  content_type='application/json'):
+    """Return already encoded JSON, gzipped above JSON_GZIP_MIN_SIZE."""
+    gzip_ok = _accepts_gzip(request) and len(body) > getattr(
+        settings, 'JSON_GZIP_MIN_SIZE', DEFAULT_JSON_GZIP_MIN_SIZE)
+    if gzip_ok:
+        # A fixed mtime keeps the compressed body stable
+        body = gzip.compress(body, compresslevel=6, mtime=0)
+    resp = http.HttpResponse(body, status=status, content_type=content_type)
+    resp['Vary'] = 'Accept-Encoding'
+    if gzip_ok:
+        resp['Content-Encoding'] = 'gzip'
+    return resp
+
+
+def response(request, data, status=200, content_type='application/json'):
+    """Return data as a JSON response, from a view that is not wrapped in
+    rest_utils.ajax(), which cannot return streamed responses.
+
+    Responses with lists longer than JSON_STREAM_MIN_ITEMS are streamed
+    as they are encoded; other responses are gzipped when they are larger
+    than JSON_GZIP_MIN_SIZE.  Streamed responses are always gzipped when
+    the client accepts it.
+    """
+    if not _is_streamed(data):
+        return body_response(request, dumps(data), status, content_type)
+
+    chunks = iter_dumps(data)
+    gzip_ok = _accepts_gzip(request)
+    if gzip_ok:
+        chunks = _iter_gzip(chunks)
+    resp = http.StreamingHttpResponse(chunks, status=status,
+                                      content_type=content_type)
+    resp['Vary'] = 'Accept-Encoding'
+    if gzip_ok:
+        resp['Content-Encoding'] = 'gzip'
+    return resp
@@ -0,0 +1,358 @@
+#
+#  Copyright (c) 2026 Wind River Systems, Inc.
+#
+#  SPDX-License-Identifier: Apache-2.0
+#
+
+import contextlib
+import logging
+import os
+import threading
+import time
+import uuid
+
+from concurrent import futures
+
+from django.conf import settings
+from django.contrib.messages import constants as message_constants
+from django.core.cache import caches
+
+from horizon import messages
+
+from starlingx_dashboard.utils import subrequest
+
+LOG = logging.getLogger(__name__)
+
+# Job states
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_SUCCESS = 'success'
+JOB_ERROR = 'error'
+
+JOB_DONE_STATES = (JOB_SUCCESS, JOB_ERROR)
+
+# Default number of jobs run concurrently by each Horizon process
+DEFAULT_JOB_MAX_WORKERS = 4
+
+# Default number of seconds a job record is kept after its last update
+DEFAULT_JOB_RETENTION = 3600
+
+# Default number of seconds between the heartbeats of a process running
+# jobs; its jobs are failed once it missed three heartbeats
+DEFAULT_JOB_HEARTBEAT = 30
+
+_JOB_KEY = 'stx-job-%s'
+_USER_JOBS_KEY = 'stx-jobs-user-%s'
+_USER_JOBS_LOCK_KEY = 'stx-jobs-user-%s-lock'
+_PROCESS_KEY = 'stx-jobs-process-%s'
+
+# How long the job list of a user may stay locked, and how long to wait
+# for it to be unlocked
+_LOCK_TIMEOUT = 10
+_LOCK_WAIT = 2
+
+_executor = None
+_executor_lock = threading.Lock()
+
+# Id of this process in the job records, and the number of jobs queued or
+# running in it, kept alive by the heartbeat thread while not zero
+_process = (None, None)
+_active = 0
+_active_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        if _executor is None:
+            _executor = futures.ThreadPoolExecutor(
+                max_workers=getattr(settings, 'JOB_MAX_WORKERS',
+                                    DEFAULT_JOB_MAX_WORKERS),
+                thread_name_prefix='stx-job')
+        return _executor
+
+
+def _cache():
+    # Jobs must be visible from every Horizon process, so a cache shared
+    # between processes (file based by default) is used for the job table.
+    return caches[getattr(settings, 'JOB_CACHE_ALIAS', 'default')]
+
+
+def _retention():
+    return getattr(settings, 'JOB_RETENTION', DEFAULT_JOB_RETENTION)
+
+
+def _heartbeat_interval():
+    return getattr(settings, 'JOB_HEARTBEAT', DEFAULT_JOB_HEARTBEAT)
+
+
+def _process_id():
+    # Taken per pid, as Horizon processes may be forked once this module
+    # was imported
+    global _process  # pylint: disable=global-statement
+    if _process[0] != os.getpid():
+        _process = os.getpid(), '%d-%s' % (os.getpid(), uuid.uuid4().hex)
+    return _process[1]
+
+
+def _beat():
+    _cache().set(_PROCESS_KEY % _process_id(), time.time(),
+                 3 * _heartbeat_interval())
+
+
+def _heartbeat():
+    while True:
+        time.sleep(_heartbeat_interval())
+        with _active_lock:
+            if not _active:
+                return
+        try:
+            _beat()
+        except Exception:
+            LOG.exception("Unable to record the heartbeat of the jobs")
+
+
+def _job_started():
+    global _active  # pylint: disable=global-statement
+    # Beat at once, so that the job is not taken as abandoned before the
+    # heartbeat thread first runs
+    _beat()
+    with _active_lock:
+        _active += 1
+        if _active == 1:
+            threading.Thread(target=_heartbeat, name='stx-job-heartbeat',
+                             daemon=True).start()
+
+
+def _job_finished():
+    global _active  # pylint: disable=global-statement
+    with _active_lock:
+        _active -= 1
+
+
+@contextlib.contextmanager
+def _user_jobs_locked(user_id):
+    """Lock the job list of a user against concurrent updates, from any
+    process; the lock is taken with cache.add and expires on its own."""
+    key = _USER_JOBS_LOCK_KEY % user_id
+    deadline = time.monotonic() + _LOCK_WAIT
+    locked = _cache().add(key, _process_id(), _LOCK_TIMEOUT)
+    while not locked and time.monotonic() < deadline:
+        time.sleep(0.05)
+        locked = _cache().add(key, _process_id(), _LOCK_TIMEOUT)
+    if not locked:
+        LOG.warning("Updating the job list of user %s without its lock",
+                    user_id)
+    try:
+        yield
+    finally:
+        if locked:
+            _cache().delete(key)
+
+
+def _save(record):
+    record['updated_at'] = time.time()
+    _cache().set(_JOB_KEY % record['id'], record, _retention())
+
+
+def _load(job_id):
+    record = _cache().get(_JOB_KEY % job_id)
+    if record is not None and record['state'] not in JOB_DONE_STATES and \
+            record.get('process') and \
+            _cache().get(_PROCESS_KEY % record['process']) is None:
+        # The process running the job stopped (e.g. it was recycled)
+        LOG.warning("Job %s (%s) was abandoned by process %s", record['id'],
+                    record['name'], record['process'])
+        record['state'] = JOB_ERROR
+        record['error_messages'].append(
+            "%s was interrupted, as the process running it stopped" %
+            record['name'])
+        _save(record)
+    return record
+
+
+class Job(object):
+    """Handle passed to a job function to report its progress.
+
+    The job function acts on behalf of job.request, a copy of the request
+    that submitted it, as that request has completed by the time the job
+    runs.  Messages added to it are recorded as the job's own.
+    """
+
+    def __init__(self, record, request):
+        self._record = record
+        self.request = request
+
+    @property
+    def id(self):
+        return self._record['id']
+
+    def update(self, progress=None, message=None):
+        if progress is not None:
+            self._record['progress'] = min(100, max(0, int(progress)))
+        if message is not None:
+            self._record['message'] = str(message)
+        _save(self._record)
+
+    def success(self, message):
+        self._record['success_messages'].append(str(message))
+        _save(self._record)
+
+    def info(self, message):
+        self._record['info_messages'].append(str(message))
+        _save(self._record)
+
+    def error(self, message):
+        self._record['error_messages'].append(str(message))
+        _save(self._record)
+
+
+def _collect_messages(record, request):
+    """Record the messages added to the request of a job."""
+    for message in request._messages._queued_messages:
+        if message.level >= message_constants.ERROR:
+            record['error_messages'].append(str(message.message))
+        elif message.level == message_constants.SUCCESS:
+            record['success_messages'].append(str(message.message))
+        else:
+            record['info_messages'].append(str(message.message))
+    for tag, message, _extra_tags in request.horizon['async_messages']:
+        if tag == 'error':
+            record['error_messages'].append(message)
+        elif tag == 'success':
+            record['success_messages'].append(message)
+        else:
+            record['info_messages'].append(message)
+
+
+def _run(record, request, func, args, kwargs):
+    job = Job(record, request)
+    try:
+        record['state'] = JOB_RUNNING
+        _save(record)
+        try:
+            result = func(job, *args, **kwargs)
+            if result:
+                record['success_messages'].append(str(result))
+        except Exception as ex:
+            LOG.exception("Job %s (%s) failed", record['id'], record['name'])
+            record['error_messages'].append(str(ex))
+        _collect_messages(record, request)
+    finally:
+        _job_finished()
+
+    record['progress'] = 100
+    record['state'] = JOB_ERROR if record['error_messages'] else JOB_SUCCESS
+    _save(record)
+    LOG.info("Job %s (%s) finished: %s", record['id'], record['name'],
+             record['state'])
+
+
+def submit(request, name, func, *args, **kwargs):
+    """Run func(job, *args, **kwargs) in the background.
+
+    The job function reports its progress through the Job handle it is
+    given, and uses job.request in place of request; a returned string is
+    recorded as a success message and an exception as an error message.
+
+    :returns: the id of the new job.
+    """
+    record = {
+        'id': uuid.uuid4().hex,
+        'name': str(name),
+        'owner': request.user.id,
+        'state': JOB_QUEUED,
+        'progress': 0,
+        'message': '',
+        'success_messages': [],
+        'info_messages': [],
+        'error_messages': [],
+        'created_at': time.time(),
+        'reported': False,
+        'process': _process_id(),
+    }
+    # Counted before its record is saved, for the heartbeat of this
+    # process to be recorded before the job can be seen
+    _job_started()
+    try:
+        _save(record)
+
+        user_key = _USER_JOBS_KEY % request.user.id
+        with _user_jobs_locked(request.user.id):
+            job_ids = _cache().get(user_key, [])
+            job_ids.append(record['id'])
+            _cache().set(user_key, job_ids, _retention())
+
+        _get_executor().submit(_run, record,
+                               subrequest.copy_request(request),
+                               func, args, kwargs)
+    except Exception as ex:
+        # The job will never run: fail its record, if it was saved
+        _job_finished()
+        record['state'] = JOB_ERROR
+        record['error_messages'].append(str(ex))
+        with contextlib.suppress(Exception):
+            _save(record)
+        raise
+    LOG.info("Job %s (%s) submitted", record['id'], record['name'])
+    return record['id']
+
+
+def get(request, job_id):
+    """Return the record of a job owned by the requesting user."""
+    record = _load(job_id)
+    if record is None or record['owner'] != request.user.id:
+        return None
+    return record
+
+
+def acknowledge(record):
+    """Mark a finished job as reported to its owner."""
+    if record['state'] in JOB_DONE_STATES and not record['reported']:
+        record['reported'] = True
+        _cache().set(_JOB_KEY % record['id'], record, _retention())
+
+
+def job_list(request):
+    job_ids = _cache().get(_USER_JOBS_KEY % request.user.id, [])
+    return [r for r in (get(request, job_id) for job_id in job_ids) if r]
+
+
+def add_messages(request):
+    """Report finished jobs of the requesting user as Horizon messages.
+
+    Each job is reported once; finished and reported jobs are dropped from
+    the user's job list.
+    """
+    user_key = _USER_JOBS_KEY % request.user.id
+    job_ids = _cache().get(user_key, [])
+    if not job_ids:
+        return
+
+    dropped = set()
+    for job_id in job_ids:
+        record = _load(job_id)
+        if record is None or record['owner'] != request.user.id:
+            dropped.add(job_id)
+            continue
+        if record['state'] not in JOB_DONE_STATES:
+            continue
+        dropped.add(job_id)
+        if record['reported']:
+            continue
+        for msg in record['success_messages']:
+            messages.success(request, msg)
+        for msg in record.get('info_messages', ()):
+            messages.info(request, msg)
+        for msg in record['error_messages']:
+            messages.error(request, msg)
+        record['reported'] = True
+        _save(record)
+
+    if dropped:
+        # Jobs may have been submitted meanwhile, by other processes
+        with _user_jobs_locked(request.user.id):
+            job_ids = _cache().get(user_key, [])
+            _cache().set(user_key,
+                         [job_id for job_id in job_ids
+                          if job_id not in dropped], _retention())
@@ -0,0 +1,47 @@
+#
+#  Copyright (c) 2026 Wind River Systems, Inc.
+#
+#  SPDX-License-Identifier: Apache-2.0
+#
+
+import importlib
+import importlib.util
+import logging
+
+LOG = logging.getLogger(__name__)
+
+# Names of the modules deferred by module(), checked by stx_import_time
+DEFERRED = set()
+
+
+class LazyModule(object):
+    """Stands for a module until one of its attributes is read, and then
+    imports it."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        module = self._module
+        if module is None:
+            # import_module holds the import lock of the module, so
+            # concurrent first reads import it once
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, attr)
+
+    def __repr__(self):
+        return "<lazy module %r%s>" % (
+            self._name, '' if self._module is None else ' (imported)')
+
+
+def module(name):
+    """Return module name, imported on first use of its attributes.
+
+    Its parent packages are imported now, and a module that is not
+    installed fails now with ImportError, as an import statement would.
+    """
+    if importlib.util.find_spec(name) is None:
+        raise ImportError("No module named %r" % name, name=name)
+    DEFERRED.add(name)
+    return LazyModule(name)
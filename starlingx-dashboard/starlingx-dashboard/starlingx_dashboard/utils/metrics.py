@@ -0,0 +1,223 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import glob
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+
+LOG = logging.getLogger(__name__)
+
+# Default for API_METRICS, whether metrics are collected
+DEFAULT_API_METRICS = True
+
+# Default directory where each process writes its metrics, for the
+# metrics endpoint to sum them; None when metrics are not shared
+DEFAULT_METRICS_DIR = None
+
+# Default minimum number of seconds between two writes of the metrics of
+# a process to METRICS_DIR
+DEFAULT_METRICS_FLUSH_INTERVAL = 10
+
+# Upper bounds, in seconds, of the latency histogram buckets
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30,
+           60)
+
+_PREFIX = 'stx_dashboard_'
+
+# Type and help of each metric
+METRICS = {
+    'view_duration_seconds': (
+        'histogram', 'Time spent handling requests of a Horizon view'),
+    'view_errors_total': (
+        'counter', 'Requests of a Horizon view answered with a 5xx status'),
+    'rest_duration_seconds': (
+        'histogram', 'Time spent handling requests of a REST API endpoint'),
+    'rest_errors_total': (
+        'counter', 'Requests of a REST API endpoint answered with a 5xx '
+                   'status'),
+    'backend_duration_seconds': (
+        'histogram', 'Duration of the calls to a backend service'),
+    'backend_errors_total': (
+        'counter', 'Calls to a backend service that raised an exception'),
+    'backend_in_flight': (
+        'gauge', 'Calls to a backend service in progress'),
+    'cache_requests_total': (
+        'counter', 'Lookups of a cache, by result (hit or miss)'),
+}
+
+_lock = threading.Lock()
+# Values by (metric name, labels); labels are sorted (name, value) pairs.
+# A histogram value is [bucket counts..., +Inf count, sum]
+_values = {}
+_last_flush = 0
+
+
+def enabled():
+    return getattr(settings, 'API_METRICS', DEFAULT_API_METRICS)
+
+
+def _key(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+
+def observe(name, seconds, **labels):
+    """Add a duration to a histogram."""
+    if not enabled():
+        return
+    key = _key(name, labels)
+    with _lock:
+        value = _values.get(key)
+        if value is None:
+            value = _values[key] = [0] * (len(BUCKETS) + 2)
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                value[i] += 1
+        value[-2] += 1
+        value[-1] += seconds
+
+
+def inc(name, amount=1, **labels):
+    """Add to a counter or gauge."""
+    if not enabled():
+        return
+    key = _key(name, labels)
+    with _lock:
+        _values[key] = _values.get(key, 0) + amount
+
+
+def cache(name, hit):
+    """Count a lookup of a cache."""
+    inc('cache_requests_total', cache=name, result='hit' if hit else 'miss')
+
+
+def snapshot():
+    """Return the metrics of this process, as JSON serializable data."""
+    with _lock:
+        return [[name, labels, list(value) if isinstance(value, list)
+                 else value]
+                for (name, labels), value in _values.items()]
+
+
+def _path(directory, pid):
+    return os.path.join(directory, 'metrics-%d.json' % pid)
+
+
+def flush(force=False):
+    """Write the metrics of this process to METRICS_DIR, at most every
+    METRICS_FLUSH_INTERVAL seconds unless forced."""
+    global _last_flush  # pylint: disable=global-statement
+    directory = getattr(settings, 'METRICS_DIR', DEFAULT_METRICS_DIR)
+    if not directory or not enabled():
+        return
+    now = time.monotonic()
+    interval = getattr(settings, 'METRICS_FLUSH_INTERVAL',
+                       DEFAULT_METRICS_FLUSH_INTERVAL)
+    with _lock:
+        if not force and now - _last_flush < interval:
+            return
+        _last_flush = now
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(snapshot(), f)
+        os.replace(tmp, _path(directory, os.getpid()))
+    except OSError:
+        LOG.exception("Failed to write the metrics to %s", directory)
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _snapshots():
+    """Return the metrics of this process and, with METRICS_DIR, of the
+    other live processes."""
+    directory = getattr(settings, 'METRICS_DIR', DEFAULT_METRICS_DIR)
+    if not directory:
+        return [snapshot()]
+    flush(force=True)
+    snapshots = []
+    for path in glob.glob(os.path.join(directory, 'metrics-*.json')):
+        pid = int(os.path.basename(path)[len('metrics-'):-len('.json')])
+        if not _alive(pid):
+            # The metrics of exited processes are reset, as after a restart
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            continue
+        try:
+            with open(path) as f:
+                snapshots.append(json.load(f))
+        except (OSError, ValueError):
+            LOG.warning("Failed to read the metrics of %s", path)
+    return snapshots
+
+
+def _merge(snapshots):
+    merged = {}
+    for entries in snapshots:
+        for name, labels, value in entries:
+            key = (name, tuple(tuple(label) for label in labels))
+            if isinstance(value, list):
+                total = merged.setdefault(key, [0] * len(value))
+                merged[key] = [a + b for a, b in zip(total, value)]
+            else:
+                merged[key] = merged.get(key, 0) + value
+    return merged
+
+
+def _escape(value):
+    return str(value).replace('\\', r'\\').replace('"', r'\"') \
+        .replace('\n', r'\n')
+
+
+def _labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ''
+    return '{%s}' % ','.join('%s="%s"' % (name, _escape(value))
+                             for name, value in pairs)
+
+
+def render():
+    """Return all the metrics in the Prometheus text format."""
+    merged = _merge(_snapshots())
+    by_name = {}
+    for (name, labels), value in merged.items():
+        by_name.setdefault(name, []).append((labels, value))
+
+    lines = []
+    for name in sorted(by_name):
+        kind, text = METRICS.get(name, ('untyped', name))
+        full_name = _PREFIX + name
+        lines.append('# HELP %s %s' % (full_name, text))
+        lines.append('# TYPE %s %s' % (full_name, kind))
+        for labels, value in sorted(by_name[name]):
+            if kind != 'histogram':
+                lines.append('%s%s %s' % (full_name, _labels(labels), value))
+                continue
+            for bound, count in zip(BUCKETS + ('+Inf',), value[:-1]):
+                lines.append('%s_bucket%s %d' % (
+                    full_name, _labels(labels, [('le', bound)]), count))
+            lines.append('%s_sum%s %s' % (full_name, _labels(labels),
+                                          value[-1]))
+            lines.append('%s_count%s %d' % (full_name, _labels(labels),
+                                            value[-2]))
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,89 @@
+#
+#  Copyright (c) 2026 Wind River Systems, Inc.
+#
+#  SPDX-License-Identifier: Apache-2.0
+#
+
+import logging
+import os
+import threading
+
+LOG = logging.getLogger(__name__)
+
+# Values read as True by ConfigFile.get_bool, once lowercased
+TRUE_VALUES = ('yes', 'true', 'on', '1')
+
+_files = {}
+_files_lock = threading.Lock()
+
+
+def parse(lines):
+    """Parse the KEY=value lines of platform.conf or openrc into a dict.
+
+    Blank lines and comments are skipped, as is the "export " of shell
+    assignments; quotes around a value are removed. The first
+    assignment of a key wins.
+    """
+    values = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        if line.startswith('export '):
+            line = line[len('export '):].lstrip()
+        key, _sep, value = line.partition('=')
+        values.setdefault(key.strip(), value.strip().strip('\'"'))
+    return values
+
+
+class ConfigFile(object):
+    """A platform configuration file, parsed on the first read and again
+    only when the file was replaced or modified since: when its inode,
+    modification time or size changed."""
+
+    def __init__(self, path):
+        self.path = path
+        self._stamp = None
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def values(self):
+        """Return the values of the file, as a dict of strings.
+
+        :raises OSError: when the file cannot be read.
+        """
+        stat = os.stat(self.path)
+        stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if stamp != self._stamp:
+            with self._lock:
+                if stamp != self._stamp:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        self._values = parse(f)
+                    self._stamp = stamp
+                    LOG.debug("Read %d values from %s", len(self._values),
+                              self.path)
+        return self._values
+
+    def get(self, key, default=None):
+        return self.values().get(key, default)
+
+    def get_bool(self, key, default=False):
+        value = self.get(key)
+        if value is None:
+            return default
+        return value.lower() in TRUE_VALUES
+
+    def get_int(self, key, default=None):
+        try:
+            return int(self.get(key))
+        except (TypeError, ValueError):
+            return default
+
+
+def config_file(path):
+    """Return the ConfigFile of path, shared by all its readers."""
+    try:
+        return _files[path]
+    except KeyError:
+        with _files_lock:
+            return _files.setdefault(path, ConfigFile(path))
@@ -0,0 +1,66 @@
+#
+#  Copyright (c) 2026 Wind River Systems, Inc.
+#
+#  SPDX-License-Identifier: Apache-2.0
+#
+
+import copy
+
+from django.contrib.messages.storage.base import BaseStorage
+
+from horizon import messages
+
+
+class CollectedMessages(BaseStorage):
+    """Message storage of a request copy, which keeps the messages added
+    to it until forward_messages() adds them to the original request."""
+
+    def _get(self, *args, **kwargs):
+        return [], True
+
+    def _store(self, messages, response, *args, **kwargs):
+        return []
+
+
+class SessionSnapshot(dict):
+    """The values of a session, as read by a request copy.
+
+    Changes made to it are never saved, so that threads acting on behalf
+    of a request do not write to its session.
+    """
+
+    modified = False
+    accessed = True
+
+    def __init__(self, session):
+        super(SessionSnapshot, self).__init__(session.items())
+        self.session_key = getattr(session, 'session_key', None)
+
+
+def copy_request(request):
+    """Return a copy of request for a thread acting on its behalf.
+
+    The copy shares the user and headers of request, but has its own
+    message storage and a snapshot of the session, so that copies can be
+    used concurrently.  Make copies in the thread handling request, and
+    pass each one to forward_messages() once its thread is done.
+    """
+    sub = copy.copy(request)
+    sub._messages = CollectedMessages(sub)
+    sub.horizon = dict(getattr(request, 'horizon', {}), async_messages=[])
+    session = getattr(request, 'session', None)
+    if session is not None:
+        sub.session = SessionSnapshot(session)
+    return sub
+
+
+def forward_messages(sub, request):
+    """Add the messages added to the request copy sub to request."""
+    for message in sub._messages._queued_messages:
+        messages.add_message(request, message.level, message.message,
+                             message.extra_tags)
+    del sub._messages._queued_messages[:]
+    if hasattr(request, 'horizon'):
+        request.horizon['async_messages'].extend(
+            sub.horizon['async_messages'])
+    del sub.horizon['async_messages'][:]
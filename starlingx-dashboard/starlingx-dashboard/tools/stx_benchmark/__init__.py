@@ -0,0 +1,31 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+"""Scale benchmarks of the dashboard against in-process fake backends.
+
+A development tool, kept out of the starlingx_dashboard package so that
+its fake clients and fleet generators are not installed with it.  Its
+commands are available once tools/ is on the Python path of Horizon and
+stx_benchmark is added to INSTALLED_APPS, e.g. with a local_settings.d
+file holding:
+
+    INSTALLED_APPS = list(INSTALLED_APPS) + ['stx_benchmark']
+
+Run with the Horizon manage.py:
+
+    manage.py stx_benchmark --hosts 10,100,500
+
+and micro-benchmarks of the per-row helpers of tables and tabs, compared
+to a baseline recorded on the machine (or CI runner) running them, with:
+
+    manage.py stx_microbenchmark --baseline micro.json --save
+    manage.py stx_microbenchmark --baseline micro.json
+
+The second command fails on a regression, and on cases missing from the
+baseline or recorded at another size.  The import times of the API
+modules are checked with:
+
+    manage.py stx_import_time
+"""
@@ -0,0 +1,247 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import collections
+import contextlib
+import threading
+import time
+from unittest import mock
+
+from starlingx_dashboard.api import breaker
+from starlingx_dashboard.api import ceph
+from starlingx_dashboard.api import dc_manager
+from starlingx_dashboard.api import fm
+from starlingx_dashboard.api import patch
+from starlingx_dashboard.api import sysinv
+from starlingx_dashboard.api import usm
+from starlingx_dashboard.api import vim
+
+# Fleet kind returned by the calls whose manager name is not the kind
+_KINDS = {
+    ('alarm', 'summary'): 'alarm_summary',
+    ('alarm_manager', 'list_alarms'): 'dc_alarm_summary',
+    ('subcloud_manager', 'list_subclouds'): 'subcloud',
+    ('subcloud_group_manager', 'list_subcloud_groups'): 'subcloud_group',
+    ('strategy_step_manager', 'list_strategy_steps'): 'strategy_step',
+}
+
+
+class Recorder(object):
+    """Counts the calls made to the fakes, and delays them by the
+    latency of their service (or by default, the '*' latency)."""
+
+    def __init__(self, latency=None):
+        self.latency = latency or {}
+        self.calls = collections.Counter()
+        self._lock = threading.Lock()
+
+    def record(self, service, operation):
+        with self._lock:
+            self.calls[(service, operation)] += 1
+        delay = self.latency.get(service, self.latency.get('*', 0))
+        if delay:
+            time.sleep(delay)
+
+    def reset(self):
+        with self._lock:
+            self.calls.clear()
+
+
+class Resource(object):
+    """A client resource built from a fleet item, missing attributes
+    reading as None."""
+
+    def __init__(self, info):
+        self._info = info
+        self.__dict__.update(info)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return None
+
+    def __getitem__(self, name):
+        return self._info[name]
+
+    def _add_details(self, info):
+        self._info.update(info)
+        self.__dict__.update(info)
+
+    def to_dict(self):
+        return dict(self._info)
+
+
+class _Manager(object):
+    """A fake manager of cgtsclient, fmclient or dcmanagerclient.
+
+    list* calls return the fleet items of the manager's kind, of a host
+    when given a host uuid first; get and *_detail calls return the item
+    of the given uuid; other calls (actions) return None.
+    """
+
+    def __init__(self, fleet, recorder, service, name):
+        self._fleet = fleet
+        self._recorder = recorder
+        self._service = service
+        self._name = name
+
+    def __getattr__(self, method):
+        if method.startswith('_'):
+            raise AttributeError(method)
+
+        def _call(*args, **kwargs):
+            self._recorder.record(self._service,
+                                  '%s.%s' % (self._name, method))
+            return self._answer(method, args)
+        return _call
+
+    def _answer(self, method, args):
+        kind = _KINDS.get((self._name, method), self._name)
+        if method == 'get' or method.endswith('detail'):
+            item = self._fleet.get(args[0]) if args else None
+            if item is None:
+                items = self._fleet.list(kind)
+                item = items[0] if items else {'uuid': args[0] if args
+                                               else None}
+            return Resource(item)
+        if method.startswith('list') or method == 'summary':
+            host_uuid = args[0] if args and isinstance(args[0], str) \
+                else None
+            return [Resource(item)
+                    for item in self._fleet.list(kind, host_uuid)]
+        return None
+
+
+class Client(object):
+    """A fake cgtsclient, fmclient or dcmanagerclient client."""
+
+    def __init__(self, fleet, recorder, service):
+        self._fleet = fleet
+        self._recorder = recorder
+        self._service = service
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return _Manager(self._fleet, self._recorder, self._service, name)
+
+
+class RestClient(object):
+    """A fake of the patching, USM or VIM client, answering the calls
+    named in answers and returning None to the others."""
+
+    def __init__(self, recorder, service, answers):
+        self._recorder = recorder
+        self._service = service
+        self._answers = answers
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        def _call(*args, **kwargs):
+            self._recorder.record(self._service, name)
+            answer = self._answers.get(name)
+            return answer() if answer is not None else None
+        return _call
+
+
+class _CephResponse(object):
+    ok = True
+
+    def raise_for_status(self):
+        pass
+
+
+class CephWrapper(object):
+    """A fake cephclient wrapper, with an OSD per storage host disk."""
+
+    def __init__(self, fleet, recorder):
+        self._recorder = recorder
+        storages = [host for host in fleet.list('ihost')
+                    if host['personality'] == 'storage']
+        self._osds = {}
+        for host in storages:
+            for _disk in fleet.list('idisk', host['uuid'])[1:]:
+                self._osds[len(self._osds)] = host['hostname']
+
+    def _answer(self, operation, output):
+        self._recorder.record('ceph', operation)
+        return _CephResponse(), output
+
+    def health(self, body='text'):
+        return self._answer('health', 'HEALTH_OK')
+
+    def fsid(self, body='text'):
+        return self._answer('fsid', '00000000-0000-0000-0000-000000000000')
+
+    def df(self, body='json'):
+        total = max(len(self._osds), 1) * 512 * 1024 ** 3
+        return self._answer('df', {'output': {'stats': {
+            'total_bytes': total, 'total_used_bytes': total // 4,
+            'total_avail_bytes': total - total // 4}}})
+
+    def status(self, body='json'):
+        return self._answer('status', {'output': {'pgmap': {
+            'read_bytes_sec': 1024 ** 2, 'read_op_per_sec': 100,
+            'write_bytes_sec': 2 * 1024 ** 2, 'write_op_per_sec': 200}}})
+
+    def mon_dump(self, body='json'):
+        return self._answer('mon_dump', {'output': {
+            'quorum': [0, 1],
+            'mons': [{'name': 'controller-0', 'rank': 0},
+                     {'name': 'controller-1', 'rank': 1}]}})
+
+    def osd_tree(self, body='json'):
+        return self._answer('osd_tree', {'output': {'nodes': [
+            {'id': osd, 'name': 'osd.%d' % osd, 'type': 'osd',
+             'status': 'up'} for osd in self._osds]}})
+
+    def osd_find(self, body='json', _id=None):
+        return self._answer('osd_find', {'output': {
+            'crush_location': {'host': self._osds.get(_id)}}})
+
+
+def _items(fleet, kind):
+    return lambda: list(fleet.list(kind))
+
+
+@contextlib.contextmanager
+def install(fleet, recorder):
+    """Make the API layer call fakes backed by fleet instead of the
+    platform services, and forget what it cached from earlier calls."""
+    platform = Client(fleet, recorder, 'platform')
+    faults = Client(fleet, recorder, 'faultmanagement')
+    dcmanager = Client(fleet, recorder, 'dcmanager')
+    patching = RestClient(recorder, 'patching', {
+        'get_hosts': lambda: {'data': list(fleet.list('patch_host'))},
+        'get_patches': lambda: {'pd': {}},
+    })
+    software = RestClient(recorder, 'usm', {
+        'get_releases': _items(fleet, 'release'),
+        'get_deploy_hosts': _items(fleet, 'deploy_host'),
+        'deploy_show': list,
+    })
+    nfv = RestClient(recorder, 'nfv', {})
+    cluster = CephWrapper(fleet, recorder)
+
+    for cache in (usm._snapshots, vim._snapshots, dc_manager._step_snapshots,
+                  breaker._circuits, breaker._last_known):
+        cache.clear()
+
+    with contextlib.ExitStack() as stack:
+        for module, name, fake in (
+                (sysinv, 'cgtsclient', platform),
+                (fm, 'fmclient', faults),
+                (dc_manager, 'dcmanagerclient', dcmanager),
+                (patch, '_patching_client', patching),
+                (usm, '_usm_client', software),
+                (vim, '_sw_update_client', nfv)):
+            stack.enter_context(mock.patch.object(
+                module, name, lambda *args, _fake=fake, **kwargs: _fake))
+        stack.enter_context(mock.patch.object(
+            ceph, 'cephwrapper', lambda: cluster))
+        yield
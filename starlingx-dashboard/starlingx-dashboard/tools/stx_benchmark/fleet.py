@@ -0,0 +1,323 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import collections
+import datetime
+import random
+import uuid
+
+_SEVERITIES = ('critical', 'major', 'minor', 'warning')
+
+_SENSOR_TYPES = ('temperature', 'voltage', 'fan', 'power', 'watchdog')
+
+
+class Fleet(object):
+    """The synthetic resources of a system, by kind (sysinv manager name,
+    or the name of the fake client call returning them)."""
+
+    def __init__(self):
+        self._items = collections.defaultdict(list)
+        self._by_host = collections.defaultdict(
+            lambda: collections.defaultdict(list))
+        self._by_uuid = {}
+
+    def add(self, kind, item, host_uuid=None):
+        self._items[kind].append(item)
+        if host_uuid is not None:
+            self._by_host[kind][host_uuid].append(item)
+        if 'uuid' in item:
+            self._by_uuid[item['uuid']] = item
+        return item
+
+    def list(self, kind, host_uuid=None):
+        if host_uuid is not None and kind in self._by_host:
+            return self._by_host[kind].get(host_uuid, [])
+        return self._items.get(kind, [])
+
+    def get(self, uuid_or_name):
+        return self._by_uuid.get(uuid_or_name)
+
+    def sizes(self):
+        return {kind: len(items) for kind, items in self._items.items()}
+
+
+def _timestamp(rand):
+    moment = datetime.datetime(2026, 1, 1) + datetime.timedelta(
+        seconds=rand.randint(0, 30 * 24 * 3600))
+    return moment.isoformat()
+
+
+def _uuid(rand):
+    return str(uuid.UUID(int=rand.getrandbits(128), version=4))
+
+
+def _personalities(count):
+    storages = count // 10 if count > 10 else 0
+    controllers = min(count, 2)
+    workers = count - controllers - storages
+    return ['controller'] * controllers + ['storage'] * storages + \
+        ['worker'] * workers
+
+
+def _add_host(fleet, rand, index, hostname, personality, ports,
+              interfaces, sensors, disks):
+    host_uuid = _uuid(rand)
+    fleet.add('ihost', {
+        'id': index + 1, 'uuid': host_uuid, 'hostname': hostname,
+        'personality': personality,
+        'subfunctions': ('controller,worker' if personality == 'controller'
+                         else personality),
+        'administrative': 'unlocked', 'operational': 'enabled',
+        'availability': rand.choice(('available', 'available', 'degraded')),
+        'invprovision': 'provisioned', 'task': '',
+        'install_state': 'completed', 'install_state_info': '',
+        'mgmt_mac': '08:00:27:%02x:%02x:%02x' % (
+            index // 65536, index // 256 % 256, index % 256),
+        'mgmt_ip': '192.168.%d.%d' % (index // 250, index % 250 + 2),
+        'bm_type': 'none', 'bm_ip': '', 'bm_username': '',
+        'location': {'locn': 'rack %d' % (index // 40)},
+        'capabilities': ({'Personality': 'Controller-Active' if index == 0
+                          else 'Controller-Standby'}
+                         if personality == 'controller' else {}),
+        'serialid': None, 'config_status': None, 'config_target': None,
+        'vim_progress_status': 'services-enabled', 'reboot_needed': False,
+        'software_load': '26.03', 'target_load': '26.03',
+        'uptime': rand.randint(600, 10 ** 7), 'boot_device': '/dev/sda',
+        'rootfs_device': '/dev/sda', 'console': 'ttyS0,115200',
+        'ttys_dcd': False, 'apparmor': 'disabled',
+        'clock_synchronization': 'ntp', 'max_cpu_mhz_configured': None,
+        'device_image_update': None, 'kernel_running': 'standard',
+        'created_at': _timestamp(rand), 'updated_at': _timestamp(rand),
+    })
+
+    port_names = []
+    for number in range(ports):
+        name = 'enp%ds0' % number
+        port_names.append(name)
+        port = fleet.add('ethernet_port', {
+            'uuid': _uuid(rand), 'name': name, 'namedisplay': name,
+            'type': 'ethernet', 'host_uuid': host_uuid,
+            'pciaddr': '0000:%02x:00.0' % number,
+            'mac': '90:e2:ba:%02x:%02x:%02x' % (index // 256, index % 256,
+                                                number),
+            'speed': 10000, 'numa_node': number % 2, 'autoneg': 'Yes',
+            'bootp': str(number == 0), 'link_mode': '0',
+            'dpdksupport': True, 'driver': 'ixgbe', 'pclass': 'Ethernet',
+            'pvendor': 'Intel', 'pdevice': '82599ES', 'psvendor': '',
+            'psdevice': '', 'sriov_totalvfs': 0, 'sriov_numvfs': 0,
+            'sriov_vfs_pci_address': '', 'sriov_vf_driver': None,
+            'capabilities': {}, 'interface_uuid': None,
+        }, host_uuid)
+        fleet.add('lldp_neighbour', {
+            'uuid': _uuid(rand), 'host_uuid': host_uuid,
+            'port_uuid': port['uuid'], 'port_name': name,
+            'port_namedisplay': name, 'msap': 'msap-%s' % port['uuid'],
+            'chassis_id': '00:1e:%02x:%02x:00:01' % (index % 256, number),
+            'port_identifier': 'Ethernet1/%d' % (index % 48),
+            'port_description': 'uplink', 'system_name': 'tor-%d' % (
+                index // 40), 'system_description': 'switch',
+            'system_capabilities': 'bridge, router',
+            'management_address': '10.0.0.%d' % (index // 40 + 1),
+            'ttl': 120, 'dot1_lag': 'capable=y,enabled=n',
+            'dot1_vlan_names': '', 'dot3_mac_status': '',
+            'dot3_max_frame': 9216,
+        }, host_uuid)
+
+    for number in range(interfaces):
+        ifname = ('mgmt0', 'cluster0', 'oam0', 'data0', 'data1',
+                  'pxeboot0')[number % 6]
+        if number >= 6:
+            ifname = 'vlan%d' % (100 + number)
+        fleet.add('iinterface', {
+            'uuid': _uuid(rand), 'ifname': ifname,
+            'iftype': 'vlan' if number >= 6 else 'ethernet',
+            'ifclass': 'data' if ifname.startswith('data') else 'platform',
+            'networktypelist': [], 'ports': (
+                [port_names[number % len(port_names)]] if port_names else []),
+            'uses': [], 'used_by': [], 'imtu': 1500,
+            'vlan_id': 100 + number if number >= 6 else None,
+            'aemode': None, 'txhashpolicy': None, 'primary_reselect': None,
+            'datanetworks': [], 'sriov_numvfs': 0, 'sriov_vf_driver': None,
+            'max_tx_rate': None, 'ihost_uuid': host_uuid,
+            'host_uuid': host_uuid,
+        }, host_uuid)
+
+    groups = []
+    for sensor_type in _SENSOR_TYPES:
+        groups.append(fleet.add('isensorgroup', {
+            'uuid': _uuid(rand), 'host_uuid': host_uuid,
+            'sensorgroupname': 'server %s' % sensor_type,
+            'sensortype': sensor_type, 'datatype': 'discrete',
+            'state': 'enabled', 'possible_states': 'ok,minor,major,critical',
+            'actions_minor_choices': 'ignore,log,alarm',
+            'actions_major_choices': 'ignore,log,alarm',
+            'actions_critical_choices': 'ignore,log,alarm,reset,powercycle',
+            'actions_minor_group': 'ignore', 'actions_major_group': 'log',
+            'actions_critical_group': 'alarm', 'suppress': 'False',
+            'audit_interval_group': 300, 'algorithm': 'debounce',
+            'record_ttl': 3,
+        }, host_uuid))
+    for number in range(sensors):
+        group = groups[number % len(groups)]
+        fleet.add('isensor', {
+            'uuid': _uuid(rand), 'host_uuid': host_uuid,
+            'sensorgroup_uuid': group['uuid'],
+            'sensorname': '%s %d' % (group['sensortype'], number),
+            'sensortype': group['sensortype'], 'datatype': 'discrete',
+            'status': rand.choice(('ok', 'ok', 'ok', 'minor')),
+            'state': 'enabled', 'state_requested': None,
+            'audit_interval': 300, 'algorithm': 'debounce',
+            'actions_minor': 'ignore', 'actions_major': 'log',
+            'actions_critical': 'alarm', 'suppress': 'False',
+            'capabilities': {},
+        }, host_uuid)
+
+    for number in range(disks):
+        fleet.add('idisk', {
+            'uuid': _uuid(rand), 'ihost_uuid': host_uuid,
+            'host_uuid': host_uuid,
+            'device_node': '/dev/sd%s' % chr(ord('a') + number % 26),
+            'device_path': '/dev/disk/by-path/pci-0000:00:0d.0-ata-%d.0' %
+                           (number + 1),
+            'device_num': 2048 + number, 'device_type': 'SSD',
+            'size_mib': 512000, 'available_mib': 256000, 'rpm': 'N/A',
+            'serial_id': 'SN%08d' % (index * 100 + number),
+            'capabilities': {}, 'ipv_uuid': None,
+        }, host_uuid)
+    return hostname
+
+
+def generate(hosts=10, ports=4, interfaces=6, sensors=20, disks=4,
+             alarms=50, events=500, subclouds=0, steps=None, seed=0):
+    """Return a Fleet of hosts, alarms, events, subclouds and strategy
+    steps; steps defaults to one per subcloud."""
+    rand = random.Random(seed)
+    fleet = Fleet()
+
+    personalities = _personalities(hosts)
+    fleet.add('isystem', {
+        'uuid': _uuid(rand), 'name': 'benchmark', 'description': '',
+        'system_type': 'All-in-one' if hosts <= 2 else 'Standard',
+        'system_mode': 'duplex' if hosts > 1 else 'simplex',
+        'software_version': '26.03', 'timezone': 'UTC', 'location': '',
+        'contact': '', 'latitude': None, 'longitude': None,
+        'capabilities': {'sdn_enabled': False, 'https_enabled': False,
+                         'shared_services': '[]', 'bm_region': 'External',
+                         'region_config': False, 'vswitch_type': 'none'},
+        'distributed_cloud_role': 'systemcontroller' if subclouds else None,
+        'security_feature': 'spectre_meltdown_v1',
+    })
+
+    numbers = collections.Counter()
+    hostnames = []
+    for index, personality in enumerate(personalities):
+        hostnames.append(_add_host(
+            fleet, rand, index, '%s-%d' % (personality, numbers[personality]),
+            personality, ports, interfaces, sensors, disks))
+        numbers[personality] += 1
+
+    for number in range(alarms):
+        hostname = rand.choice(hostnames) if hostnames else 'controller-0'
+        fleet.add('alarm', {
+            'uuid': _uuid(rand), 'alarm_id': '%d.%03d' % (
+                rand.choice((100, 200, 250, 270, 280, 400, 800, 900)),
+                rand.randint(1, 150)),
+            'alarm_state': 'set', 'entity_type_id': 'system.host',
+            'entity_instance_id': 'host=%s' % hostname,
+            'timestamp': _timestamp(rand),
+            'severity': rand.choice(_SEVERITIES),
+            'reason_text': 'Synthetic alarm %d on %s' % (number, hostname),
+            'alarm_type': 'operational-violation',
+            'probable_cause': 'unspecified-reason',
+            'proposed_repair_action': 'None', 'service_affecting': 'False',
+            'suppression': 'True', 'suppression_status': 'unsuppressed',
+            'mgmt_affecting': rand.choice(('True', 'False')),
+            'degrade_affecting': 'False',
+        })
+    counts = collections.Counter(alarm['severity']
+                                 for alarm in fleet.list('alarm'))
+    fleet.add('alarm_summary', {
+        'critical': counts['critical'], 'major': counts['major'],
+        'minor': counts['minor'], 'warnings': counts['warning'],
+        'status': 'critical' if counts['critical'] else 'OK',
+    })
+
+    for number in range(events):
+        hostname = rand.choice(hostnames) if hostnames else 'controller-0'
+        fleet.add('event_log', {
+            'uuid': _uuid(rand), 'event_log_id': '%d.%03d' % (
+                rand.choice((200, 275, 400, 401)), rand.randint(1, 150)),
+            'state': rand.choice(('log', 'set', 'clear')),
+            'entity_type_id': 'system.host',
+            'entity_instance_id': 'host=%s' % hostname,
+            'timestamp': _timestamp(rand),
+            'severity': rand.choice(_SEVERITIES + ('not-applicable',)),
+            'reason_text': 'Synthetic event %d on %s' % (number, hostname),
+            'event_log_type': 'equipment', 'probable_cause': 'unknown',
+            'proposed_repair_action': '', 'service_affecting': 'False',
+            'suppression': 'False', 'suppression_status': 'unsuppressed',
+        })
+
+    fleet.add('subcloud_group', {
+        'group_id': 1, 'name': 'Default', 'description': 'Default group',
+        'update_apply_type': 'parallel', 'max_parallel_subclouds': 2,
+        'created_at': _timestamp(rand), 'updated_at': _timestamp(rand),
+    })
+    names = ['subcloud%d' % (number + 1) for number in range(subclouds)]
+    for number, name in enumerate(names):
+        fleet.add('subcloud', {
+            'subcloud_id': number + 1, 'name': name, 'region_name': name,
+            'description': '', 'location': '', 'software_version': '26.03',
+            'management_state': 'managed',
+            'availability_status': rand.choice(('online', 'online',
+                                                'offline')),
+            'deploy_status': 'complete', 'error_description': 'No errors',
+            'management_subnet': '192.168.%d.0/24' % (number % 250),
+            'management_start_ip': '', 'management_end_ip': '',
+            'management_gateway_ip': '', 'systemcontroller_gateway_ip': '',
+            'group_id': 1, 'sync_status': 'in-sync',
+            'endpoint_sync_status': [], 'created_at': _timestamp(rand),
+            'updated_at': _timestamp(rand),
+        })
+        fleet.add('dc_alarm_summary', {
+            'name': name, 'critical': 0, 'major': rand.randint(0, 2),
+            'minor': rand.randint(0, 5), 'warnings': rand.randint(0, 5),
+            'status': 'OK',
+        })
+
+    step_count = subclouds if steps is None else steps
+    for number in range(step_count):
+        fleet.add('strategy_step', {
+            'cloud': names[number % len(names)] if names else
+            'subcloud%d' % (number + 1),
+            'stage': 1 + number // 10,
+            'state': rand.choice(('initial', 'applying', 'complete')),
+            'details': '', 'started_at': _timestamp(rand),
+            'finished_at': None,
+        })
+
+    for hostname, personality in zip(hostnames, personalities):
+        fleet.add('patch_host', {
+            'hostname': hostname, 'ip': '', 'nodetype': personality,
+            'patch_current': True, 'patch_failed': False,
+            'requires_reboot': False, 'secs_since_ack': 10,
+            'stale_details': False, 'sw_version': '26.03',
+            'state': 'idle', 'allow_insvc_patching': True,
+            'interim_state': False, 'latest_sysroot_commit': '',
+        })
+        fleet.add('deploy_host', {
+            'hostname': hostname, 'software_release': '26.03.0',
+            'target_release': '26.03.0', 'reboot_required': False,
+            'host_state': 'deployed',
+        })
+    fleet.add('release', {
+        'release_id': 'stx-26.03.0', 'state': 'deployed',
+        'sw_version': '26.03.0', 'status': 'REL', 'unremovable': True,
+        'summary': 'StarlingX', 'description': '',
+        'install_instructions': '', 'warnings': '',
+        'reboot_required': 'true', 'requires': [],
+    })
+    return fleet
@@ -0,0 +1,86 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import json
+import logging
+import os
+import subprocess
+import sys
+
+from starlingx_dashboard import api
+
+LOG = logging.getLogger(__name__)
+
+# Default import time budget of the measured modules, in milliseconds
+DEFAULT_BUDGET_MS = 500
+
+# Modules imported by default: the API package, then each API module
+MODULES = ('starlingx_dashboard.api',) + tuple(
+    'starlingx_dashboard.api.%s' % name for name in api.__all__)
+
+# Run in a new interpreter, so that nothing is imported yet; the marker
+# separates the imports of Django's setup from the measured ones
+_SCRIPT = """
+import json, sys, time
+import django
+django.setup()
+before = set(sys.modules)
+sys.stderr.write('%(marker)s\\n')
+sys.stderr.flush()
+started = time.perf_counter()
+for name in %(modules)r:
+    __import__(name)
+elapsed = time.perf_counter() - started
+from starlingx_dashboard.utils import lazy
+print(json.dumps({
+    'ms': elapsed * 1000,
+    'modules': len(set(sys.modules) - before),
+    'eager': sorted(name for name in lazy.DEFERRED
+                    if name in sys.modules and name not in before),
+}))
+"""
+
+_MARKER = '-- starlingx_dashboard imports --'
+
+
+def _slowest(importtime, count):
+    """Parse the -X importtime lines after the marker, and return the
+    count modules of longest own import time, as (name, ms)."""
+    lines = importtime.splitlines()
+    if _MARKER in lines:
+        lines = lines[lines.index(_MARKER) + 1:]
+    own = []
+    for line in lines:
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        try:
+            own.append((fields[2].strip(), int(fields[0]) / 1000.0))
+        except (IndexError, ValueError):
+            # The header line
+            continue
+    return sorted(own, key=lambda item: -item[1])[:count]
+
+
+def run(modules=MODULES, slowest=10):
+    """Import modules in a new interpreter, with the settings of this one.
+
+    :returns: a dict of the import time in ms, the number of modules
+              imported, the deferred client modules that were imported
+              anyway ('eager'), and the slowest modules as (name, ms).
+    """
+    script = _SCRIPT % {'marker': _MARKER, 'modules': tuple(modules)}
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', script],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True, env=dict(os.environ), check=False)
+    if process.returncode:
+        raise RuntimeError(process.stderr.strip().splitlines()[-1]
+                           if process.stderr.strip() else
+                           'exit status %d' % process.returncode)
+    result = json.loads(process.stdout.strip().splitlines()[-1])
+    result['slowest'] = _slowest(process.stderr, slowest)
+    return result
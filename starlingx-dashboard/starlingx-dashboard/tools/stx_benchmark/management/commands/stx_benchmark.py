@@ -0,0 +1,102 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import json
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from stx_benchmark import runner
+
+
+def _sizes(value):
+    try:
+        return [int(size) for size in value.split(',')]
+    except ValueError:
+        raise CommandError('--hosts must be a comma separated list of '
+                           'numbers of hosts')
+
+
+def _latency(value):
+    """Parse 0.01 or platform=0.05,*=0.01 into seconds by service."""
+    latency = {}
+    try:
+        for item in value.split(','):
+            service, _sep, seconds = item.rpartition('=')
+            latency[service or '*'] = float(seconds)
+    except ValueError:
+        raise CommandError('--latency must be seconds, or service=seconds '
+                           'pairs separated by commas')
+    return latency
+
+
+class Command(BaseCommand):
+    help = ("Render key dashboard views against in-process fake backends "
+            "serving synthetic fleets of growing size, and report wall "
+            "time, backend calls and peak memory.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hosts', default='10,100,500',
+                            help='Fleet sizes, in hosts (default: '
+                                 '10,100,500)')
+        parser.add_argument('--views', default='',
+                            help='Views to render (default: all of %s)' %
+                                 ', '.join(v[0] for v in runner.VIEWS))
+        parser.add_argument('--latency', default='0',
+                            help='Seconds added to each backend call, or '
+                                 'service=seconds pairs')
+        parser.add_argument('--repeat', type=int, default=3,
+                            help='Renders per view and size; the median '
+                                 'wall time is reported')
+        parser.add_argument('--ports', type=int, default=4)
+        parser.add_argument('--interfaces', type=int, default=6)
+        parser.add_argument('--sensors', type=int, default=20)
+        parser.add_argument('--disks', type=int, default=4)
+        parser.add_argument('--alarms', type=int, default=50)
+        parser.add_argument('--events', type=int, default=500)
+        parser.add_argument('--subclouds', type=int, default=0)
+        parser.add_argument('--steps', type=int, default=None,
+                            help='Strategy steps (default: one per '
+                                 'subcloud)')
+        parser.add_argument('--json', dest='json_path', default=None,
+                            help='Also write the results to this JSON '
+                                 'file, e.g. to track them in CI')
+
+    def handle(self, *args, **options):
+        try:
+            results = self._run(options)
+        except runner.RenderError as ex:
+            raise CommandError(str(ex))
+
+        row = '%-20s %6s %8s %10s %7s %10s  %s\n'
+        self.stdout.write(row % ('view', 'hosts', 'status', 'wall ms',
+                                 'calls', 'peak KiB', 'top calls'))
+        for result in results:
+            self.stdout.write(row % (
+                result['view'], result['hosts'], result['status'],
+                result['wall_ms'], result['calls'], result['peak_kib'],
+                ', '.join(result['top_operations'])))
+
+        if options['json_path']:
+            with open(options['json_path'], 'w') as f:
+                json.dump(results, f, indent=2, sort_keys=True)
+
+        failed = ['%s (%s hosts): %s' % (r['view'], r['hosts'], r['status'])
+                  for r in results if r['status'] != 200]
+        if failed:
+            raise CommandError('Views did not render with a 200 status: %s'
+                               % ', '.join(failed))
+
+    def _run(self, options):
+        return runner.run(
+            _sizes(options['hosts']),
+            views=[v for v in options['views'].split(',') if v],
+            latency=_latency(options['latency']),
+            repeat=max(options['repeat'], 1),
+            ports=options['ports'], interfaces=options['interfaces'],
+            sensors=options['sensors'], disks=options['disks'],
+            alarms=options['alarms'], events=options['events'],
+            subclouds=options['subclouds'], steps=options['steps'])
@@ -0,0 +1,53 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from stx_benchmark import imports
+
+
+class Command(BaseCommand):
+    help = ("Import the API modules in a new interpreter and fail when "
+            "they take longer than the budget, or when they import a "
+            "client library that should only be imported on first use.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--budget', type=float,
+                            default=imports.DEFAULT_BUDGET_MS,
+                            help='Import time budget, in ms (default: %s)'
+                                 % imports.DEFAULT_BUDGET_MS)
+        parser.add_argument('--modules', default='',
+                            help='Modules to import (default: %s)' %
+                                 ', '.join(imports.MODULES))
+        parser.add_argument('--repeat', type=int, default=3,
+                            help='Interpreters started; the fastest import '
+                                 'is compared to the budget')
+
+    def handle(self, *args, **options):
+        modules = [name for name in options['modules'].split(',') if name]
+        try:
+            results = [imports.run(modules or imports.MODULES)
+                       for _run in range(max(options['repeat'], 1))]
+        except RuntimeError as ex:
+            raise CommandError('Importing the modules failed: %s' % ex)
+        result = min(results, key=lambda item: item['ms'])
+
+        self.stdout.write('Imported %d modules in %.1f ms (budget %.1f '
+                          'ms)\n' % (result['modules'], result['ms'],
+                                     options['budget']))
+        for name, ms in result['slowest']:
+            self.stdout.write('  %8.1f ms  %s\n' % (ms, name))
+
+        errors = []
+        if result['eager']:
+            errors.append('deferred modules imported: %s' %
+                          ', '.join(result['eager']))
+        if result['ms'] > options['budget']:
+            errors.append('%.1f ms over the budget' %
+                          (result['ms'] - options['budget']))
+        if errors:
+            raise CommandError('; '.join(errors))
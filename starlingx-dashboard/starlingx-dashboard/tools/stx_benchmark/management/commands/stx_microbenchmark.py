@@ -0,0 +1,96 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import os
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from stx_benchmark import micro
+
+
+class Command(BaseCommand):
+    help = ("Time the per-row helpers of the dashboard tables and tabs on "
+            "generated rows, and fail when one regressed beyond the "
+            "threshold over its baseline, or has no baseline.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--cases', default='',
+                            help='Cases to run (default: all of %s)' %
+                                 ', '.join(micro.CASES))
+        parser.add_argument('--baseline', required=True,
+                            help='Baseline JSON file, recorded with --save '
+                                 'on the machine running the comparison')
+        parser.add_argument('--threshold', type=float,
+                            default=micro.DEFAULT_THRESHOLD,
+                            help='Regression allowed over the baseline, '
+                                 'as a fraction (default: %s)' %
+                                 micro.DEFAULT_THRESHOLD)
+        parser.add_argument('--repeat', type=int, default=5,
+                            help='Runs per case; the best time is kept')
+        parser.add_argument('--save', action='store_true',
+                            help='Write the results to the baseline file '
+                                 'instead of comparing them')
+
+    def handle(self, *args, **options):
+        names = [name for name in options['cases'].split(',') if name]
+        unknown = set(names) - set(micro.CASES)
+        if unknown:
+            raise CommandError('Unknown cases: %s' %
+                               ', '.join(sorted(unknown)))
+        results = micro.run(names, repeat=max(options['repeat'], 1))
+
+        if options['save']:
+            baseline = micro.load(options['baseline'])
+            baseline.update(results)
+            os.makedirs(os.path.dirname(os.path.abspath(
+                options['baseline'])), exist_ok=True)
+            micro.save(options['baseline'], baseline)
+            self.stdout.write('Saved %d cases to %s\n' %
+                              (len(results) - 1, options['baseline']))
+            return
+
+        baseline = micro.load(options['baseline'])
+        if not baseline:
+            raise CommandError('No baseline in %s, record one with --save' %
+                               options['baseline'])
+        rows = {row[0]: row for row in micro.compare(
+            results, baseline, options['threshold'])}
+        line = '%-28s %6s %12s %12s %7s  %s\n'
+        self.stdout.write(line % ('case', 'rows', 'baseline us', 'us',
+                                  'ratio', ''))
+        regressed = []
+        unmatched = []
+        for name, result in results.items():
+            if name == micro.CALIBRATION:
+                continue
+            if name not in rows:
+                self.stdout.write(line % (name, result['size'], '-',
+                                          result['us'], '-', 'no baseline'))
+                unmatched.append(name)
+                continue
+            _name, base, scaled, ratio, failed = rows[name]
+            note = ''
+            if ratio is None:
+                note = 'size differs from the baseline'
+                unmatched.append(name)
+            elif failed:
+                note = 'REGRESSED'
+                regressed.append(name)
+            self.stdout.write(line % (
+                name, result['size'], base, scaled,
+                '-' if ratio is None else '%.2f' % ratio, note))
+
+        if unmatched:
+            raise CommandError('%d case(s) have no baseline of their size, '
+                               'record it with --save: %s' % (
+                                   len(unmatched), ', '.join(unmatched)))
+        if regressed:
+            raise CommandError('%d case(s) regressed more than %d%% over '
+                               'the baseline: %s' % (
+                                   len(regressed),
+                                   options['threshold'] * 100,
+                                   ', '.join(regressed)))
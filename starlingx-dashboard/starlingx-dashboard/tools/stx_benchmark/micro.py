@@ -0,0 +1,286 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import collections
+import datetime
+import json
+import logging
+import random
+import timeit
+
+import cgcs_patch.constants as patch_constants
+
+from starlingx_dashboard.api import sysinv
+from starlingx_dashboard.dashboards.admin.host_topology import \
+    tabs as topology_tabs
+from starlingx_dashboard.dashboards.admin.inventory.cpu_functions import \
+    utils as icpu_utils
+from starlingx_dashboard.dashboards.admin.inventory import \
+    tables as inventory_tables
+from starlingx_dashboard.dashboards.dc_admin.dc_orchestration import \
+    views as orchestration_views
+from stx_benchmark import fakes
+from stx_benchmark import fleet as fleet_module
+
+LOG = logging.getLogger(__name__)
+
+# Regression allowed over the baseline before a case fails, as a fraction
+DEFAULT_THRESHOLD = 0.25
+
+# Baseline entry holding the time of the calibration loop, which scales
+# the other entries to the speed of the machine running the comparison
+CALIBRATION = '_calibration'
+
+# Host fields of the states the task/status column renders, beyond the
+# steady state of the fleet's hosts
+_HOST_STATES = (
+    {'availability': 'offline', 'install_state': 'installing',
+     'install_state_info': '120/480+'},
+    {'availability': 'offline', 'install_state': 'pre-install'},
+    {'availability': 'online', 'install_state': 'booting'},
+    {'task': 'Unlocking-'},
+    {'task': 'Rebooting'},
+    {'config_status': 'Config out-of-date'},
+    {'vim_progress_status': 'services-disabling'},
+)
+
+# Host display properties read by the inventory tables for each row
+_DISPLAY_PROPERTIES = ('personality', 'subfunction_oper',
+                       'subfunction_avail', 'apparmor', 'administrative',
+                       'operational', 'availability',
+                       'clock_synchronization', 'patch_state',
+                       'install_state')
+
+Case = collections.namedtuple('Case', ('name', 'size', 'setup', 'doc'))
+
+CASES = collections.OrderedDict()
+
+
+def case(name, size):
+    """Register setup(size, rand) as the case name, at size rows.
+
+    setup returns the function timed, which calls the benchmarked
+    function over its generated rows as rendering a page would.
+    """
+    def decorator(setup):
+        CASES[name] = Case(name, size, setup, setup.__doc__)
+        return setup
+    return decorator
+
+
+def _hosts(size, rand):
+    fleet = fleet_module.generate(hosts=size, ports=0, interfaces=0,
+                                  sensors=0, disks=0, alarms=0, events=0)
+    hosts = []
+    for index, item in enumerate(fleet.list('ihost')):
+        item = dict(item)
+        if index % 3 == 0:
+            item.update(rand.choice(_HOST_STATES))
+        host = sysinv.Host(fakes.Resource(item))
+        host.patch_current = rand.choice((True, True, False, 'Pending',
+                                          'Failed'))
+        host.requires_reboot = rand.random() < 0.1
+        if rand.random() < 0.05:
+            host._patch_state = \
+                patch_constants.PATCH_AGENT_STATE_INSTALLING
+        hosts.append(host)
+    return hosts
+
+
+@case('get_task_or_status', size=500)
+def _task_or_status(size, rand):
+    """Task/status column of the hosts table."""
+    hosts = _hosts(size, rand)
+
+    def run():
+        for host in hosts:
+            inventory_tables.get_task_or_status(host)
+    return run
+
+
+@case('get_install_percent', size=500)
+def _install_percent(size, rand):
+    """Cell attributes of the task/status column."""
+    cells = [str(inventory_tables.get_task_or_status(host))
+             for host in _hosts(size, rand)]
+
+    def run():
+        for cell in cells:
+            inventory_tables.get_install_percent(cell)
+    return run
+
+
+@case('host_display_properties', size=500)
+def _display_properties(size, rand):
+    """Display properties of the hosts, as the hosts tables read them."""
+    hosts = _hosts(size, rand)
+
+    def run():
+        for host in hosts:
+            for name in _DISPLAY_PROPERTIES:
+                getattr(host, name)
+    return run
+
+
+@case('host_get_display_value', size=5000)
+def _get_display_value(size, rand):
+    """Host._get_display_value lookups, hits and misses."""
+    host = _hosts(1, rand)[0]
+    choices = sysinv.Host.AVAIL_DISPLAY_CHOICES
+    display = sysinv.Host._AVAIL_DISPLAY
+    values = [rand.choice(choices)[0].upper() if rand.random() < 0.9
+              else 'unknown' for _number in range(size)]
+
+    def run():
+        for value in values:
+            host._get_display_value(display, value)
+    return run
+
+
+def _cpu_host(rand, sockets=2, cores=24, threads=2):
+    cpus = []
+    for thread in range(threads):
+        for socket in range(sockets):
+            for core in range(cores):
+                if core < 2:
+                    function = icpu_utils.PLATFORM_CPU_TYPE
+                elif core < 3:
+                    function = icpu_utils.VSWITCH_CPU_TYPE
+                elif core < 6:
+                    function = icpu_utils.ISOLATED_CPU_TYPE
+                else:
+                    function = icpu_utils.APPLICATION_CPU_TYPE
+                cpus.append(sysinv.Cpu(fakes.Resource({
+                    'cpu': len(cpus), 'numa_node': socket, 'core': core,
+                    'thread': thread, 'allocated_function': function,
+                    'cpu_model': 'Intel(R) Xeon(R) Gold 6230 CPU'})))
+    rand.shuffle(cpus)
+    nodes = [sysinv.Node(fakes.Resource({'numa_node': socket}))
+             for socket in range(sockets)]
+    return fakes.Resource({'cpus': cpus, 'nodes': nodes,
+                           'subfunctions': ['worker']})
+
+
+@case('restructure_host_cpu_data', size=50)
+def _restructure(size, rand):
+    """CPU functions of hosts of 2 sockets of 24 cores, hyperthreaded."""
+    hosts = [_cpu_host(rand) for _number in range(size)]
+
+    def run():
+        for host in hosts:
+            icpu_utils.restructure_host_cpu_data(host)
+    return run
+
+
+@case('compress_range', size=500)
+def _compress_range(size, rand):
+    """Core lists of 4 to 48 cores, with gaps, compressed to ranges."""
+    lists = []
+    for _number in range(size):
+        cores = list(range(rand.randint(4, 48)))
+        lists.append(sorted(rand.sample(cores, len(cores) * 3 // 4)))
+
+    def run():
+        for cores in lists:
+            # compress_range appends to and sorts the list it is given
+            icpu_utils.compress_range(list(cores))
+    return run
+
+
+@case('get_alarms_for_entity', size=500)
+def _alarms_for_entity(size, rand):
+    """Alarms of each host of the topology, among alarms of all hosts."""
+    fleet = fleet_module.generate(hosts=size, ports=0, interfaces=0,
+                                  sensors=0, disks=0, alarms=size,
+                                  events=0)
+    alarms = [fakes.Resource(alarm) for alarm in fleet.list('alarm')]
+    hostnames = [host['hostname'] for host in fleet.list('ihost')]
+
+    def run():
+        for hostname in hostnames:
+            topology_tabs.get_alarms_for_entity(alarms, hostname)
+    return run
+
+
+@case('check_strategy_out_of_date', size=1000)
+def _strategy_out_of_date(size, rand):
+    """Creation times of strategies, some out of date."""
+    now = datetime.datetime.now()
+    times = [(now - datetime.timedelta(seconds=rand.randint(0, 4 * 3600))
+              ).strftime('%Y-%m-%d %H:%M:%S.%f') for _number in range(size)]
+
+    def run():
+        for created_at in times:
+            orchestration_views.check_strategy_out_of_date(created_at)
+    return run
+
+
+def _calibrate():
+    total = 0
+    for number in range(100000):
+        total += number % 7
+    return total
+
+
+def _time(function, repeat):
+    """Best time of function over repeat runs, in microseconds."""
+    timer = timeit.Timer(function)
+    number, _elapsed = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number * 10 ** 6
+
+
+def run(names=None, repeat=5, seed=0):
+    """Time the cases named (or all of them) on generated rows.
+
+    :returns: a dict of {case: {'size': rows, 'us': microseconds}},
+              with the calibration loop timed as CALIBRATION.
+    """
+    results = {CALIBRATION: {'size': 1,
+                             'us': round(_time(_calibrate, repeat), 1)}}
+    for name, entry in CASES.items():
+        if names and name not in names:
+            continue
+        function = entry.setup(entry.size, random.Random(seed))
+        results[name] = {'size': entry.size,
+                         'us': round(_time(function, repeat), 1)}
+    return results
+
+
+def load(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save(path, results):
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Compare results to baseline, scaled by their calibration times.
+
+    :returns: a list of (case, baseline us, scaled us, ratio, regressed)
+              of the cases in both; ratio is None when the sizes differ.
+    """
+    scale = 1.0
+    if CALIBRATION in results and CALIBRATION in baseline:
+        scale = baseline[CALIBRATION]['us'] / results[CALIBRATION]['us']
+    rows = []
+    for name, result in results.items():
+        if name == CALIBRATION or name not in baseline:
+            continue
+        base = baseline[name]
+        scaled = result['us'] * scale
+        ratio = None
+        if base['size'] == result['size'] and base['us']:
+            ratio = scaled / base['us']
+        rows.append((name, base['us'], round(scaled, 1), ratio,
+                     ratio is not None and ratio > 1 + threshold))
+    return rows
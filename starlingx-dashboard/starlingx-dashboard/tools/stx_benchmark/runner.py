@@ -0,0 +1,177 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import collections
+import datetime
+import logging
+import statistics
+import time
+import tracemalloc
+import types
+
+from django.conf import settings
+from django.contrib.messages.storage import default_storage
+from django.contrib.sessions.backends import signed_cookies
+from django.test import override_settings
+from django.test import RequestFactory
+from django import urls
+from openstack_auth import user as auth_user
+
+from stx_benchmark import fakes
+from stx_benchmark import fleet as fleet_module
+
+LOG = logging.getLogger(__name__)
+
+# Benchmarked views: name, URL name, and whether the URL takes a host id
+VIEWS = (
+    ('inventory', 'horizon:admin:inventory:index', False),
+    ('inventory_detail', 'horizon:admin:inventory:detail', True),
+    ('topology_json', 'horizon:admin:host_topology:json', False),
+    ('storage_overview', 'horizon:admin:storage_overview:index', False),
+    ('software_management', 'horizon:admin:software_management:index',
+     False),
+    ('dc_orchestration', 'horizon:dc_admin:dc_orchestration:index', False),
+)
+
+# Services of the benchmark user's catalog
+_SERVICES = ('identity', 'platform', 'faultmanagement', 'dcmanager',
+             'patching', 'usm', 'nfv', 'network')
+
+# Caches reusing data across requests are disabled, so that each render
+# costs what a first render costs
+_COLD = {
+    'ALARM_COUNTS_TTL': 0,
+    'CHOICES_CACHE_TTL': 0,
+    'DC_STEP_SNAPSHOT_TTL': 0,
+    'USM_SNAPSHOT_TTL': 0,
+}
+
+
+class RenderError(Exception):
+    """Raised when rendering a benchmarked view fails"""
+
+    def __init__(self, path, error):
+        super(RenderError, self).__init__(
+            'Rendering %s failed: %s: %s' % (path, type(error).__name__,
+                                             error))
+        self.path = path
+
+
+def _user(region):
+    catalog = [{'type': service, 'name': service, 'id': service,
+                'endpoints': [{'region': region, 'region_id': region,
+                               'interface': interface,
+                               'url': 'http://localhost/%s' % service}
+                              for interface in ('public', 'internal',
+                                                'admin')]}
+               for service in _SERVICES]
+    token = types.SimpleNamespace(
+        id='benchmark', unscoped_token='benchmark',
+        expires=datetime.datetime.now(datetime.timezone.utc) +
+        datetime.timedelta(days=1),
+        user={'id': 'admin', 'name': 'admin'},
+        project={'id': 'admin', 'name': 'admin'},
+        tenant={'id': 'admin', 'name': 'admin'},
+        domain={}, user_domain_id='default', user_domain_name='Default',
+        project_domain_id='default', project_domain_name='Default',
+        roles=[{'id': 'admin', 'name': 'admin'}],
+        serviceCatalog=catalog, system_scoped=False)
+    return auth_user.User(
+        id='admin', token=token, user='admin', tenant_id='admin',
+        tenant_name='admin', service_catalog=catalog,
+        roles=[{'id': 'admin', 'name': 'admin'}], enabled=True,
+        services_region=region, authorized_tenants=[],
+        endpoint=getattr(settings, 'OPENSTACK_KEYSTONE_URL', ''),
+        user_domain_name='Default')
+
+
+def _request(path, user):
+    request = RequestFactory().get(path)
+    request.user = user
+    request.session = signed_cookies.SessionStore()
+    request._messages = default_storage(request)
+    # Set by the Horizon middleware
+    request.horizon = {'dashboard': None, 'panel': None,
+                       'async_messages': []}
+    return request
+
+
+def render(path, user):
+    """Handle a GET of path as its view would, rendering the response."""
+    request = _request(path, user)
+    match = urls.resolve(path)
+    response = match.func(request, *match.args, **match.kwargs)
+    if hasattr(response, 'render') and not response.is_rendered:
+        response.render()
+    if response.streaming:
+        for _chunk in response.streaming_content:
+            pass
+    return response
+
+
+def _measure(path, user, recorder, repeat):
+    timings = []
+    status = None
+    for _run in range(repeat):
+        recorder.reset()
+        started = time.perf_counter()
+        try:
+            code = render(path, user).status_code
+        except Exception as ex:
+            LOG.exception("Rendering %s failed", path)
+            raise RenderError(path, ex) from ex
+        timings.append(time.perf_counter() - started)
+        # Report the first run that did not render with a 200
+        if status in (None, 200):
+            status = code
+    calls = collections.Counter()
+    for (service, _operation), count in recorder.calls.items():
+        calls[service] += count
+
+    tracemalloc.start()
+    try:
+        render(path, user)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'status': status,
+        'wall_ms': round(statistics.median(timings) * 1000, 1),
+        'calls': sum(calls.values()),
+        'calls_by_service': dict(calls),
+        'top_operations': ['%s %s x%d' % (service, operation, count)
+                           for (service, operation), count
+                           in recorder.calls.most_common(3)],
+        'peak_kib': peak // 1024,
+    }
+
+
+def run(sizes, views=None, latency=None, repeat=3, region='RegionOne',
+        **fleet_options):
+    """Render views against fleets of each size (number of hosts).
+
+    :returns: a list of dicts, with the view, fleet size, status, median
+              wall time, backend call counts and peak memory of each run.
+    :raises RenderError: when rendering a view raises an exception.
+    """
+    views = [view for view in VIEWS if not views or view[0] in views]
+    recorder = fakes.Recorder(latency)
+    user = _user(region)
+    results = []
+    for size in sizes:
+        fleet = fleet_module.generate(hosts=size, **fleet_options)
+        hosts = fleet.list('ihost')
+        with fakes.install(fleet, recorder), override_settings(**_COLD):
+            for name, url_name, by_host in views:
+                if by_host and not hosts:
+                    continue
+                args = [hosts[-1]['uuid']] if by_host else []
+                result = _measure(urls.reverse(url_name, args=args), user,
+                                  recorder, repeat)
+                result.update({'view': name, 'hosts': size})
+                results.append(result)
+    return results